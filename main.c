@@ -79,7 +79,7 @@ Image* create_test_image(int width, int height) {
 /******************************************************************************
  * Traiter une image : SVD + compression
  ******************************************************************************/
-int process_image(const char *input_file, const char *output_dir) {
+int process_image(const char *input_file, const char *output_dir, int driver) {
     
     // 1. Charger l'image
     printf("╔══════════════════════════════════════════════════════════════════╗\n");
@@ -124,6 +124,7 @@ int process_image(const char *input_file, const char *output_dir) {
         image_free(img);
         return -1;
     }
+    svd->driver = driver;
     
     if (svd_compute(img, svd) != 0) {
         fprintf(stderr, "Erreur: Calcul SVD échoué\n");
@@ -257,11 +258,19 @@ int main(int argc, char *argv[]) {
         input_file = argv[1];
     }
     
+    // Pilote LAPACK : 2e argument, sinon $SVD_DRIVER (gesvd, gesdd ou auto)
+    const char *driver_name = (argc > 2) ? argv[2] : getenv("SVD_DRIVER");
+    int driver = svd_parse_driver(driver_name);
+    if (driver < 0) {
+        fprintf(stderr, "Pilote inconnu: %s (gesvd, gesdd ou auto)\n", driver_name);
+        return -1;
+    }
+    
     // Créer le répertoire de sortie si nécessaire
     const char *output_dir = "../images/output";
     
     // Traiter l'image
-    int result = process_image(input_file, output_dir);
+    int result = process_image(input_file, output_dir, driver);
     
     if (result == 0) {
         printf("╔══════════════════════════════════════════════════════════════════╗\n");
@@ -0,0 +1,225 @@
+"""
+AUTORÉGLAGE DES MOTEURS SVD - profil de la machine et répartiteur
+
+Le moteur le plus rapide dépend de la forme, du rang demandé et de la
+machine (gesdd ou gesvd, randomisé, Lanczos, Gram, noyau C). autotune()
+mesure une fois chaque moteur sur des matrices de type image (spectre
+décroissant + bruit, graine fixe) et enregistre, pour chaque (m, n, k) :
+
+    ms       temps médian
+    error    (||A - A_k||_F - ||A - A_k*||_F) / ||A||_F, écart relatif à
+             la troncature optimale A_k* d'Eckart–Young
+
+select_engine() choisit ensuite, pour le point du profil le plus proche
+(distance logarithmique sur m, n et k), le moteur le plus rapide dont
+l'erreur reste sous la tolérance. Sans profil : règle simple (exact si
+k est absent ou grand, randomisé sinon).
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+from svd_cache import DEFAULT_CACHE_DIR
+from svd_clib import available as c_available
+from svd_clib import c_svd
+from svd_engines import svd_exact, svd_gesvd, svd_gram, svd_lanczos, svd_randomized
+
+
+PROFILE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'engine_profile.json')
+DEFAULT_TOLERANCE = 1e-3
+TUNE_SHAPES = ((256, 256), (512, 512), (1024, 1024), (1024, 2048), (2048, 2048))
+TUNE_K = (10, 50, 150)
+
+_ENGINE_FUNCS = {
+    'exact': lambda A, k: svd_exact(A, k),
+    'gesvd': lambda A, k: svd_gesvd(A, k),
+    'randomized': svd_randomized,
+    'lanczos': svd_lanczos,
+    'gram': svd_gram,
+    'c_lapack': lambda A, k: c_svd(A, k),
+}
+
+_profile_cache = {}
+
+
+def tuning_matrix(m, n, seed=42):
+    """
+    Matrice de type image : dégradés et motifs lisses (spectre décroissant)
+    plus un bruit gaussien (plancher du spectre), valeurs dans [0, 255]
+
+    Args:
+        m, n: Dimensions
+        seed: Graine
+
+    Returns:
+        numpy.ndarray: Matrice (m×n) float64
+    """
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 1, m)[:, None]
+    x = np.linspace(0, 1, n)[None, :]
+    A = 128 + 60 * np.sin(6 * np.pi * x) * np.cos(4 * np.pi * y) + 40 * (x - y)
+    for f in rng.uniform(2, 40, size=8):
+        A = A + 10 * np.sin(f * np.pi * (x + rng.uniform() * y))
+    A += rng.normal(0, 6, (m, n))
+    return np.clip(A, 0, 255)
+
+
+def truncation_gap(A, U, S, VT, S_opt, k):
+    """
+    Écart relatif entre l'erreur de rang k obtenue et l'erreur optimale
+
+    Args:
+        A: Matrice (m×n)
+        U, S, VT: Facteurs du moteur testé
+        S_opt: Valeurs singulières exactes de A
+        k: Rang
+
+    Returns:
+        float: (||A - U_k S_k VT_k||_F - ||A - A_k*||_F) / ||A||_F (≥ 0 aux arrondis près)
+    """
+    norm2 = float(np.sum(S_opt ** 2))
+    residual = A - (U[:, :k] * S[:k]) @ VT[:k, :]
+    err = np.sqrt(float(np.vdot(residual, residual)))
+    err_opt = np.sqrt(max(norm2 - float(np.sum(S_opt[:k] ** 2)), 0.0))
+    return max(err - err_opt, 0.0) / np.sqrt(norm2)
+
+
+def _timed(fn, A, k, runs):
+    result = fn(A, k)                       # chauffe
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = fn(A, k)
+        times.append(time.perf_counter() - t0)
+    return result, float(np.median(times)) * 1000.0
+
+
+def autotune(shapes=TUNE_SHAPES, k_values=TUNE_K, engines=None, runs=3, path=PROFILE_PATH):
+    """
+    Mesurer chaque moteur sur la machine et enregistrer le profil
+
+    Args:
+        shapes: Dimensions (m, n) testées (m ≥ n après orientation)
+        k_values: Rangs testés
+        engines: Moteurs (None: tous ceux disponibles ; SciPy et la
+                 bibliothèque C sont facultatifs)
+        runs: Répétitions (médiane) après une chauffe
+        path: Fichier JSON du profil (None: ne pas enregistrer)
+
+    Returns:
+        dict: Profil {'host', 'entries': [{m, n, k, engines: {nom: {ms, error}}}]}
+    """
+    if engines is None:
+        engines = ['exact', 'randomized', 'gram']
+        try:
+            import scipy.sparse.linalg   # noqa: F401
+            engines += ['gesvd', 'lanczos']
+        except ImportError:
+            pass
+        if c_available():
+            engines.append('c_lapack')
+
+    entries = []
+    print('┌─────────────┬──────┬──────────────┬────────────┬────────────┐')
+    print('│   m × n     │  k   │ moteur       │  temps (ms)│  erreur    │')
+    print('├─────────────┼──────┼──────────────┼────────────┼────────────┤')
+    for m, n in shapes:
+        m, n = max(m, n), min(m, n)
+        A = tuning_matrix(m, n)
+        S_opt = np.linalg.svd(A, compute_uv=False)
+        for k in k_values:
+            if k >= n:
+                continue
+            results = {}
+            for name in engines:
+                (U, S, VT), ms = _timed(_ENGINE_FUNCS[name], A, k, runs)
+                error = truncation_gap(A, U, S, VT, S_opt, k)
+                results[name] = {'ms': ms, 'error': error}
+                print(f'│ {m:5d}×{n:<5d} │ {k:4d} │ {name:<12s} │ {ms:10.2f} │ {error:10.2e} │')
+            entries.append({'m': m, 'n': n, 'k': k, 'engines': results})
+    print('└─────────────┴──────┴──────────────┴────────────┴────────────┘')
+
+    profile = {'host': platform.node(), 'machine': platform.machine(), 'entries': entries}
+    if path:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(profile, f, indent=2)
+        _profile_cache.pop(path, None)
+        print(f'   ✓ Profil enregistré: {path}')
+    return profile
+
+
+def load_profile(path=PROFILE_PATH):
+    """Lire le profil (mis en mémoire au premier appel) ; None s'il n'existe pas"""
+    if path not in _profile_cache:
+        if not os.path.isfile(path):
+            return None
+        with open(path) as f:
+            _profile_cache[path] = json.load(f)
+    return _profile_cache[path]
+
+
+def select_engine(m, n, k=None, tolerance=DEFAULT_TOLERANCE, profile=None):
+    """
+    Moteur le plus rapide respectant la tolérance pour une SVD (m, n, k)
+
+    Args:
+        m, n: Dimensions de la matrice
+        k: Rang utile (None: spectre complet → 'exact')
+        tolerance: Écart maximal à la troncature optimale (voir truncation_gap)
+        profile: Profil d'autoréglage (None: load_profile())
+
+    Returns:
+        str: Nom du moteur (voir svd_engines.ENGINES)
+    """
+    m, n = max(m, n), min(m, n)
+    if k is None or k >= n:
+        return 'exact'
+
+    profile = profile or load_profile()
+    if not profile or not profile.get('entries'):
+        return 'randomized' if k + 10 < n // 4 else 'exact'
+
+    target = np.log([m, n, k])
+    entry = min(profile['entries'],
+                key=lambda e: float(np.sum((np.log([e['m'], e['n'], e['k']]) - target) ** 2)))
+    eligible = [(r['ms'], name) for name, r in entry['engines'].items()
+                if r['error'] <= tolerance]
+    return min(eligible)[1] if eligible else 'exact'
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_autotune.py                       (autoréglage complet)
+        python svd_autotune.py --shapes 512x512 1024x768 -k 10 50
+        python svd_autotune.py --select 3000x2000 -k 100 --tolerance 1e-4
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Autoréglage des moteurs SVD')
+    parser.add_argument('--shapes', nargs='+', help='dimensions m x n testées')
+    parser.add_argument('-k', type=int, nargs='+', default=list(TUNE_K), help='rangs testés')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--profile', default=PROFILE_PATH, help='fichier JSON du profil')
+    parser.add_argument('--select', metavar='MxN', help='afficher le moteur choisi pour m×n')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    if args.select:
+        m, n = (int(v) for v in args.select.lower().split('x'))
+        for k in args.k:
+            engine = select_engine(m, n, k, args.tolerance, load_profile(args.profile))
+            print(f'   • {m}×{n}, k={k}: {engine}')
+        raise SystemExit(0)
+
+    shapes = [tuple(int(v) for v in s.lower().split('x')) for s in args.shapes] \
+        if args.shapes else TUNE_SHAPES
+    autotune(shapes, args.k, runs=args.runs, path=args.profile)
@@ -0,0 +1,316 @@
+"""
+TRAITEMENT PAR LOTS - compression SVD non interactive d'un dossier d'images
+
+    python svd_batch.py "photos/*.png" --manifest liste.txt -o lots/ --workers 8
+
+Chaque image passe par chargement → SVD → balayage en k → encodage .svdz
+dans un processus du pool. Les processus sont lancés en 'spawn' avec les
+variables OMP/OpenBLAS/MKL fixées avant l'import de NumPy, puis limités
+par svd_threads.set_blas_threads : processus × threads BLAS ne dépasse
+jamais le nombre de cœurs. Sans --blas-threads, svd_threads.plan_threads
+répartit les images par taille (un pool par groupe) ; --pin épingle
+chaque processus sur son propre groupe de cœurs.
+
+Le manifeste des résultats (manifest.jsonl, un objet JSON par image) est
+écrit au fil de l'eau : un lot interrompu garde tout ce qui est terminé.
+Les fichiers de chaque image vont dans un sous-dossier qui reprend son
+chemin relatif au dossier commun du lot (output_names) : deux photos de
+même nom dans des dossiers différents ne s'écrasent pas.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import glob
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from PIL import Image
+
+from svd_codec import save_svdz
+from svd_compressor import SVDCompressor
+from svd_imageio import load_gray
+from svd_metrics import mean_squared_error, psnr_from_mse
+from svd_sweep import rank_sweep
+from svd_threads import available_cores, cpu_groups, pin_process, plan_threads, set_blas_threads
+
+
+BLAS_THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                    'BLIS_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
+DEFAULT_K_VALUES = (5, 10, 25, 50, 100)
+
+
+def collect_inputs(patterns=(), manifests=()):
+    """
+    Liste ordonnée et dédoublonnée des images à traiter
+
+    Args:
+        patterns: Motifs glob (ex. 'photos/**/*.jpg')
+        manifests: Fichiers texte, un chemin par ligne (# pour commenter)
+
+    Returns:
+        list: Chemins des images
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        paths += matches if matches or glob.has_magic(pattern) else [pattern]
+    for manifest in manifests:
+        base = os.path.dirname(manifest)
+        with open(manifest) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    paths.append(line if os.path.isabs(line) else os.path.join(base, line))
+    return list(dict.fromkeys(paths))
+
+
+def output_names(paths):
+    """
+    Sous-dossier de sortie de chaque image, unique dans le lot
+
+    Chemin relatif au dossier commun des entrées, sans extension
+    ('a/photo', 'b/photo') ; l'extension est gardée si deux images ne
+    diffèrent que par elle ('photo_png', 'photo_jpg').
+
+    Args:
+        paths: Images du lot
+
+    Returns:
+        list: Noms relatifs, dans l'ordre de paths
+    """
+    if not paths:
+        return []
+    absolute = [os.path.abspath(p) for p in paths]
+    root = os.path.commonpath([os.path.dirname(p) for p in absolute])
+    relative = [os.path.relpath(p, root) for p in absolute]
+    names = [os.path.splitext(r)[0] for r in relative]
+    counts = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    return [name if counts[name] == 1 else name + os.path.splitext(r)[1].replace('.', '_')
+            for name, r in zip(names, relative)]
+
+
+def image_shape(path):
+    """(m, n) d'une image, lu dans l'en-tête sans décoder les pixels ((0, 0) si illisible)"""
+    try:
+        with Image.open(path) as img:
+            return img.size[1], img.size[0]
+    except (OSError, ValueError):
+        return 0, 0
+
+
+def _init_worker(threads, groups, counter):
+    """Initialiseur des processus : threads BLAS et épinglage éventuel"""
+    set_blas_threads(threads)
+    if groups:
+        with counter.get_lock():
+            index = counter.value
+            counter.value += 1
+        pin_process(groups[index % len(groups)])
+
+
+def process_image(path, out_dir, k_values=DEFAULT_K_VALUES, engine='exact',
+                  precision='float64', target_psnr=None, svdz='int8', save_png=False,
+                  cache_dir=None, name=None):
+    """
+    Chaîne complète pour une image (exécutée dans un processus du pool)
+
+    Args:
+        path: Image source
+        out_dir: Dossier de sortie ; les fichiers vont dans out_dir/<name>/
+        k_values: Rangs balayés
+        engine, precision: Voir svd_engines.compute_svd
+        target_psnr: PSNR visé (dB), son rang est ajouté aux k
+        svdz: Quantification des fichiers .svdz (None: pas d'encodage)
+        save_png: Écrire aussi les reconstructions en PNG
+        cache_dir: Cache disque des facteurs (None: pas de cache)
+        name: Sous-dossier de sortie (None: nom du fichier sans extension ;
+              voir output_names pour un lot)
+
+    Returns:
+        dict: Enregistrement du manifeste (image, dimensions, temps, rangs)
+    """
+    record = {'image': path, 'pid': os.getpid()}
+    t0 = time.perf_counter()
+    try:
+        A, _ = load_gray(path, dtype=precision, engine=engine)
+        t_load = time.perf_counter()
+
+        m, n = A.shape
+        ks = sorted(k for k in set(k_values) if k <= min(m, n))
+        comp = SVDCompressor(A, k_max=max(ks + [1]), engine=engine, precision=precision,
+                             cache_dir=cache_dir)
+        U, S, VT = comp.factors
+        t_svd = time.perf_counter()
+
+        k_target = comp.select_rank(psnr=target_psnr) if target_psnr is not None else None
+        if k_target is not None and k_target not in ks:
+            ks = sorted(ks + [k_target])
+
+        stem = os.path.splitext(os.path.basename(path))[0]
+        dest = os.path.join(out_dir, name or stem)
+        os.makedirs(dest, exist_ok=True)
+        record['output'] = dest
+
+        ranks = []
+        for k, work, frame in rank_sweep(U, S, VT, ks):
+            row = comp.metrics(k)
+            row['psnr_clipped'] = float(psnr_from_mse(mean_squared_error(A, work)))
+            if svdz:
+                nbytes = save_svdz(os.path.join(dest, f'{stem}_k{k:03d}.svdz'), U, S, VT, k,
+                                   quant=svdz)
+                row['svdz_bytes'] = nbytes
+                row['svdz_ratio'] = A.size / nbytes
+            if save_png:
+                Image.fromarray(frame).save(os.path.join(dest, f'{stem}_k{k:03d}.png'))
+            ranks.append(row)
+        t_end = time.perf_counter()
+
+        record.update({
+            'status': 'ok', 'shape': [m, n], 'engine': engine, 'precision': precision,
+            'cached': comp.info['cached'], 'k_target': k_target, 'ranks': ranks,
+            'time_load': t_load - t0, 'time_svd': t_svd - t_load,
+            'time_sweep': t_end - t_svd, 'time_total': t_end - t0,
+        })
+    except Exception as e:   # une image illisible ne doit pas arrêter le lot
+        record.update({'status': 'error', 'error': f'{type(e).__name__}: {e}',
+                       'time_total': time.perf_counter() - t0})
+    return record
+
+
+def _run_pool(paths, names, out_dir, workers, threads, pin, manifest, done, total, options):
+    """Un pool de workers processus × threads threads BLAS ; écrit le manifeste"""
+    ctx = multiprocessing.get_context('spawn')
+    groups = cpu_groups(workers, threads) if pin else None
+    counter = ctx.Value('i', 0)
+
+    # Les processus 'spawn' héritent de l'environnement au démarrage,
+    # avant tout import de NumPy : c'est là que le nombre de threads BLAS se fixe
+    saved = {var: os.environ.get(var) for var in BLAS_THREAD_VARS}
+    os.environ.update({var: str(threads) for var in BLAS_THREAD_VARS})
+    records = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                                 initargs=(threads, groups, counter)) as pool:
+            futures = {pool.submit(process_image, p, out_dir, name=name, **options): p
+                       for p, name in zip(paths, names)}
+            for i, future in enumerate(as_completed(futures), done + 1):
+                try:
+                    record = future.result()
+                except BrokenProcessPool as e:
+                    # processus tué (mémoire, signal) : les images restantes du pool
+                    # sont notées en erreur, le lot continue avec le groupe suivant
+                    record = {'image': futures[future], 'status': 'error',
+                              'error': f'BrokenProcessPool: {e}', 'time_total': 0.0}
+                record['blas_threads'] = threads
+                records.append(record)
+                manifest.write(json.dumps(record) + '\n')
+                manifest.flush()
+                status = '✓' if record['status'] == 'ok' else '⚠'
+                print(f"   {status} [{i}/{total}] {record['image']} "
+                      f"({record['time_total']:.2f} s)"
+                      + (f" — {record['error']}" if record['status'] != 'ok' else ''))
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+    return records
+
+
+def run_batch(paths, out_dir, workers=None, blas_threads=None, pin=False, **options):
+    """
+    Traiter une liste d'images sur un ou plusieurs pools de processus
+
+    Args:
+        paths: Images à traiter
+        out_dir: Dossier de sortie (manifest.jsonl y est écrit)
+        workers: Nombre de processus (None: cœurs / blas_threads)
+        blas_threads: Threads BLAS par processus (None: selon la taille des
+                      images, voir svd_threads.plan_threads)
+        pin: Épingler chaque processus sur un groupe de cœurs disjoint
+        **options: Voir process_image
+
+    Returns:
+        list: Enregistrements du manifeste, dans l'ordre d'achèvement
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    cores = available_cores()
+    manifest_path = os.path.join(out_dir, 'manifest.jsonl')
+    names = output_names(paths)
+
+    if blas_threads is None:
+        plan = plan_threads([image_shape(p) for p in paths], cores)
+        if workers:
+            for group in plan:
+                group['workers'] = min(group['workers'], workers)
+    else:
+        plan = [{'threads': blas_threads, 'indices': list(range(len(paths))),
+                 'workers': workers or max(1, cores // blas_threads)}]
+
+    records = []
+    t0 = time.perf_counter()
+    with open(manifest_path, 'w') as manifest:
+        for group in plan:
+            print(f"   Groupe: {len(group['indices'])} image(s), {group['workers']} processus × "
+                  f"{group['threads']} thread(s) BLAS")
+            records += _run_pool([paths[i] for i in group['indices']],
+                                 [names[i] for i in group['indices']], out_dir,
+                                 group['workers'], group['threads'], pin, manifest,
+                                 len(records), len(paths), options)
+
+    elapsed = time.perf_counter() - t0
+    ok = sum(r['status'] == 'ok' for r in records)
+    print(f"\n   {ok}/{len(paths)} image(s) en {elapsed:.1f} s "
+          f"({len(paths) / elapsed * 3600:.0f} images/h, {cores} cœur(s))")
+    print(f"   ✓ Manifeste: {manifest_path}")
+    return records
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_batch.py "photos/*.jpg" -o lots/ --workers 8 -k 10 25 50
+        python svd_batch.py --manifest liste.txt -o lots/ --target-psnr 35 --png
+    """
+    import argparse
+
+    from svd_cache import DEFAULT_CACHE_DIR
+    from svd_codec import QUANTS
+    from svd_engines import ENGINES, PRECISIONS
+
+    parser = argparse.ArgumentParser(description='Compression SVD par lots (non interactive)')
+    parser.add_argument('inputs', nargs='*', help='images ou motifs glob')
+    parser.add_argument('--manifest', action='append', default=[],
+                        help='fichier listant les images, une par ligne')
+    parser.add_argument('-o', '--output', default='batch_output', help='dossier de sortie')
+    parser.add_argument('-k', type=int, nargs='+', default=list(DEFAULT_K_VALUES),
+                        help='rangs balayés')
+    parser.add_argument('--engine', choices=ENGINES, default='exact')
+    parser.add_argument('--precision', choices=tuple(PRECISIONS), default='float64')
+    parser.add_argument('--target-psnr', type=float, help='ajouter le plus petit k avec PSNR ≥ cible')
+    parser.add_argument('--svdz', choices=QUANTS, default='int8', help='quantification .svdz')
+    parser.add_argument('--no-svdz', action='store_true', help='ne pas écrire de .svdz')
+    parser.add_argument('--png', action='store_true', help='écrire les reconstructions en PNG')
+    parser.add_argument('--workers', type=int, help='processus (défaut: cœurs / threads BLAS)')
+    parser.add_argument('--blas-threads', type=int,
+                        help='threads BLAS par processus (défaut: selon la taille des images)')
+    parser.add_argument('--pin', action='store_true', help='épingler chaque processus sur ses cœurs')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='cache disque des facteurs')
+    parser.add_argument('--no-cache', action='store_true', help='toujours recalculer la SVD')
+    args = parser.parse_args()
+
+    paths = collect_inputs(args.inputs, args.manifest)
+    if not paths:
+        parser.error('aucune image (motifs ou --manifest)')
+    run_batch(paths, args.output, workers=args.workers, blas_threads=args.blas_threads, pin=args.pin,
+              k_values=args.k, engine=args.engine, precision=args.precision,
+              target_psnr=args.target_psnr, svdz=None if args.no_svdz else args.svdz,
+              save_png=args.png, cache_dir=None if args.no_cache else args.cache_dir)
@@ -0,0 +1,605 @@
+"""
+BENCHMARKS SVD - temps mesurés, jamais extrapolés
+
+Suite multi-moteurs (comme new.m : matrices aléatoires de graine fixe,
+chauffe puis répétitions, moyenne des répétitions) :
+    numpy         np.linalg.svd (LAPACK gesdd, seul pilote exposé par NumPy)
+    scipy_gesdd   scipy.linalg.svd(lapack_driver='gesdd')
+    scipy_gesvd   scipy.linalg.svd(lapack_driver='gesvd')
+    randomized    svd_engines.svd_randomized (k = min(100, n/2))
+    c_gesdd       noyau C de svd_compress.c appelé par ctypes (svd_clib),
+    c_gesvd       sans copie ni fichier PGM, pilote dgesdd ou dgesvd, si
+                  'make lib' a été lancé : le rapport des deux CSV suit le
+                  gain de dgesdd d'une nuit à l'autre
+    c_svd_demo    exécutable C (svd_compressor, 'make') lancé par subprocess
+                  sur une image PGM ; temps « SVD calculée en … » qu'il
+                  affiche (horloge monotone, temps écoulé comme perf_counter)
+--kind remplace les matrices gaussiennes par un corpus d'images
+synthétiques (svd_testimages), généré en mémoire une seule fois.
+Chaque moteur écrit benchmark_<moteur>.csv au format de
+matlab_benchmark.csv (taille,ms sans en-tête) ; plot_benchmark() et la
+figure D de svd_full ne tracent que ces fichiers mesurés.
+
+Images rectangulaires : une image m×n (m ≥ n) factorisée en économique coûte O(m·n²) ; l'ancien
+recadrage au carré n×n coûtait O(n³) mais jetait m - n lignes de pixels.
+Ce module mesure les deux, dans les deux orientations (haute et large),
+pour chiffrer le surcoût réel de l'image complète.
+
+startup_report() mesure le démarrage des points d'entrée (python -X
+importtime dans un processus neuf, NumPy déjà importé : seul le surcoût
+propre au module compte) et échoue si un budget est dépassé ou si un
+module lourd (matplotlib, cv2, SciPy) est chargé sans qu'on l'ait demandé.
+
+precision_report() compare la chaîne float32 à la référence float64 :
+écart sur σ, PSNR par k, pixels différents après écrêtage, temps et
+mémoire des facteurs.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import csv
+import glob
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from svd_engines import as_precision, compute_svd, svd_randomized
+from svd_metrics import mean_squared_error, psnr_from_mse
+from svd_pnm import write_pnm
+from svd_sweep import rank_sweep
+
+
+def _best_time(fn, runs):
+    """Meilleur temps (ms) sur runs exécutions, après un appel de chauffe"""
+    fn()
+    best = float('inf')
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000.0
+
+
+def benchmark_rectangular(shapes=((512, 768), (768, 512), (1024, 2048), (2048, 1024)),
+                          engine='exact', k=None, runs=3, seed=42, csv_path=None):
+    """
+    Comparer la SVD de l'image m×n complète à celle du recadrage carré
+
+    Args:
+        shapes: Dimensions (m, n) à mesurer
+        engine: Moteur SVD ('exact' ou 'randomized')
+        k: Rang pour le moteur 'randomized'
+        runs: Nombre de mesures (on garde la meilleure)
+        seed: Graine des matrices de test
+        csv_path: Fichier CSV optionnel (m, n, ms_complet, ms_carre)
+
+    Returns:
+        list: Dictionnaires m, n, full_ms, crop_ms, overhead, pixels
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+
+    print('┌─────────────┬──────────────┬──────────────┬──────────┬──────────┐')
+    print('│   m × n     │ complet (ms) │ carré (ms)   │ surcoût  │ pixels   │')
+    print('├─────────────┼──────────────┼──────────────┼──────────┼──────────┤')
+    for m, n in shapes:
+        A = rng.random((m, n)) * 255.0
+        d = min(m, n)
+        crop = np.ascontiguousarray(A[:d, :d])
+
+        full_ms = _best_time(lambda: compute_svd(A, k=k, engine=engine), runs)
+        crop_ms = _best_time(lambda: compute_svd(crop, k=k, engine=engine), runs)
+        row = {'m': m, 'n': n, 'full_ms': full_ms, 'crop_ms': crop_ms,
+               'overhead': full_ms / crop_ms, 'pixels': (m * n) / (d * d)}
+        rows.append(row)
+        print(f"│ {m:5d}×{n:<5d} │ {full_ms:12.1f} │ {crop_ms:12.1f} │ "
+              f"{row['overhead']:6.2f}×  │ {row['pixels']:6.2f}×  │")
+    print('└─────────────┴──────────────┴──────────────┴──────────┴──────────┘')
+    print('   surcoût = temps complet / temps carré ; pixels = pixels conservés en plus\n')
+
+    if csv_path:
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            for row in rows:
+                writer.writerow([row['m'], row['n'], f"{row['full_ms']:.3f}",
+                                 f"{row['crop_ms']:.3f}"])
+        print(f"   ✓ Résultats sauvegardés: {csv_path}")
+
+    return rows
+
+
+BENCH_SIZES = (256, 512, 1024, 2048)      # jusqu'à 8192 via --sizes
+BACKEND_LABELS = {
+    'matlab': 'MATLAB',
+    'numpy': 'NumPy (gesdd)',
+    'scipy_gesdd': 'SciPy gesdd',
+    'scipy_gesvd': 'SciPy gesvd',
+    'randomized': 'Randomisée (k≤100)',
+    'c_gesdd': 'C dgesdd (ctypes)',
+    'c_gesvd': 'C dgesvd (ctypes)',
+    'c_svd_demo': 'C (svd_compressor)',
+}
+_C_TIME = re.compile(r'SVD calculée en ([0-9.]+) secondes')
+
+
+def _scipy_svd(driver):
+    from scipy.linalg import svd
+    return lambda A: svd(A, full_matrices=False, lapack_driver=driver, check_finite=False)
+
+
+def python_backends():
+    """
+    Moteurs Python disponibles (SciPy et la bibliothèque C sont facultatifs)
+
+    Returns:
+        dict: {nom: fonction A ↦ SVD}
+    """
+    backends = {
+        'numpy': lambda A: np.linalg.svd(A, full_matrices=False),
+        'randomized': lambda A: svd_randomized(A, min(100, min(A.shape) // 2)),
+    }
+    try:
+        import scipy.linalg   # noqa: F401
+        backends['scipy_gesdd'] = _scipy_svd('gesdd')
+        backends['scipy_gesvd'] = _scipy_svd('gesvd')
+    except ImportError:
+        pass
+
+    from svd_clib import available, c_svd
+    if available():
+        backends['c_gesdd'] = lambda A: c_svd(A, driver='gesdd')
+        backends['c_gesvd'] = lambda A: c_svd(A, driver='gesvd')
+    return backends
+
+
+def bench_matrix(n, seed=42, kind=None):
+    """
+    Matrice n×n de benchmark
+
+    Args:
+        n: Taille
+        seed: Graine
+        kind: None (gaussienne, comme new.m) ou type d'image de
+              svd_testimages ('rings', 'shapes', 'lowrank', 'mixed')
+
+    Returns:
+        numpy.ndarray: Matrice float64 (pixels dans [0, 255] pour une image)
+    """
+    if kind is None:
+        return np.random.default_rng(seed).standard_normal((n, n))
+    from svd_testimages import test_image
+    return test_image(kind, n, seed=seed)
+
+
+def time_backend(fn, n, runs=3, warmup=1, seed=42, kind=None, A=None):
+    """
+    Temps moyen (ms) d'une SVD n×n après chauffe, comme new.m
+
+    Args:
+        fn: Fonction A ↦ SVD
+        n: Taille de la matrice
+        runs: Répétitions mesurées
+        warmup: Exécutions ignorées
+        seed: Graine de la matrice
+        kind: Type de matrice (voir bench_matrix)
+        A: Matrice déjà générée (None: bench_matrix(n, seed, kind))
+
+    Returns:
+        float: Moyenne des répétitions (ms)
+    """
+    if A is None:
+        A = bench_matrix(n, seed, kind)
+    times = []
+    for run in range(warmup + runs):
+        t0 = time.perf_counter()
+        fn(A)
+        if run >= warmup:
+            times.append((time.perf_counter() - t0) * 1000.0)
+    return float(np.mean(times))
+
+
+def time_c_demo(n, exe='./svd_compressor', runs=3, warmup=1, seed=42, timeout=None, kind=None, A=None):
+    """
+    Temps SVD (ms) du programme C sur une image PGM n×n aléatoire
+
+    Le programme écrit dans ../images/output et ../data relatifs à son
+    dossier courant : il est lancé dans une arborescence temporaire.
+    Le temps est celui qu'il affiche : temps écoulé de la seule SVD
+    (clock_gettime(CLOCK_MONOTONIC)), comparable aux temps perf_counter
+    des moteurs Python.
+
+    Args:
+        n: Taille de l'image
+        exe: Chemin de l'exécutable
+        runs, warmup, seed: Voir time_backend
+        timeout: Délai maximal par exécution (s)
+        kind: None (pixels uniformes) ou type d'image de svd_testimages
+        A: Image déjà générée, pixels dans [0, 255] (prioritaire sur kind)
+
+    Returns:
+        float: Moyenne des répétitions (ms)
+    """
+    exe = os.path.abspath(exe)
+    if A is None and kind is not None:
+        A = bench_matrix(n, seed, kind)
+    if A is None:
+        pixels = np.random.default_rng(seed).integers(0, 256, (n, n), dtype=np.uint8)
+    else:
+        pixels = np.clip(np.rint(A), 0, 255).astype(np.uint8)
+    times = []
+    with tempfile.TemporaryDirectory() as root:
+        cwd = os.path.join(root, 'run')
+        for d in (cwd, os.path.join(root, 'images', 'output'), os.path.join(root, 'images', 'data')):
+            os.makedirs(d)
+        pgm = os.path.join(root, 'input.pgm')
+        write_pnm(pgm, pixels)
+
+        for run in range(warmup + runs):
+            proc = subprocess.run([exe, pgm], cwd=cwd, capture_output=True, text=True,
+                                  timeout=timeout)
+            match = _C_TIME.search(proc.stdout)
+            if proc.returncode != 0 or match is None:
+                raise RuntimeError(f"{exe} a échoué (code {proc.returncode}): "
+                                   f"{(proc.stderr or proc.stdout).strip()[-200:]}")
+            if run >= warmup:
+                times.append(float(match.group(1)) * 1000.0)
+    return float(np.mean(times))
+
+
+def write_benchmark_csv(path, rows):
+    """Écrire (taille, ms) au format de matlab_benchmark.csv (sans en-tête)"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        for size, ms in rows:
+            writer.writerow([int(size), repr(float(ms))])
+
+
+def read_benchmark_csv(path):
+    """Lire un CSV (taille, ms) ; retourne {taille: ms}"""
+    with open(path) as f:
+        return {int(float(row[0])): float(row[1]) for row in csv.reader(f) if row}
+
+
+def measured_benchmarks(*directories):
+    """
+    Résultats mesurés trouvés dans des dossiers (matlab_benchmark.csv et
+    benchmark_<moteur>.csv)
+
+    Args:
+        *directories: Dossiers à examiner (le premier trouvé l'emporte)
+
+    Returns:
+        dict: {moteur: {taille: ms}}
+    """
+    found = {}
+    for directory in directories:
+        paths = glob.glob(os.path.join(directory, 'benchmark_*.csv'))
+        paths.append(os.path.join(directory, 'matlab_benchmark.csv'))
+        for path in sorted(paths):
+            name = os.path.basename(path)[:-4]
+            name = 'matlab' if name == 'matlab_benchmark' else name[len('benchmark_'):]
+            if name not in found and os.path.isfile(path):
+                found[name] = read_benchmark_csv(path)
+    return found
+
+
+def run_suite(sizes=BENCH_SIZES, backends=None, runs=3, warmup=1, seed=42, out_dir='.',
+              c_exe='./svd_compressor', kind=None):
+    """
+    Mesurer chaque moteur à chaque taille et écrire benchmark_<moteur>.csv
+
+    Args:
+        sizes: Tailles n des matrices n×n
+        backends: Noms des moteurs (None: tous ceux disponibles, plus
+                  c_svd_demo si l'exécutable existe)
+        runs, warmup, seed: Voir time_backend
+        out_dir: Dossier des CSV
+        c_exe: Exécutable C pour 'c_svd_demo'
+        kind: None (matrices gaussiennes) ou type d'image de svd_testimages :
+              le corpus est généré une fois, en parallèle, pour tous les moteurs
+
+    Returns:
+        dict: {moteur: {taille: ms}}
+    """
+    available = python_backends()
+    if backends is None:
+        backends = list(available) + (['c_svd_demo'] if os.path.isfile(c_exe) else [])
+    os.makedirs(out_dir, exist_ok=True)
+
+    corpus = {}
+    if kind is not None:
+        from svd_testimages import make_corpus
+        corpus = {n: A for (_, n, _), A in make_corpus(sizes, [kind], seed=seed).items()}
+
+    source = f"images '{kind}'" if kind else 'matrices gaussiennes'
+    print(f"   Benchmark SVD : {runs} répétitions après {warmup} chauffe(s), {source}, graine {seed}")
+    results = {}
+    for name in backends:
+        rows = []
+        for n in sizes:
+            try:
+                if name == 'c_svd_demo':
+                    ms = time_c_demo(n, c_exe, runs, warmup, seed, A=corpus.get(n))
+                else:
+                    ms = time_backend(available[name], n, runs, warmup, seed, A=corpus.get(n))
+            except (KeyError, OSError, RuntimeError, subprocess.SubprocessError) as e:
+                print(f"   ⚠ {name} {n}×{n}: {e}")
+                break
+            rows.append((n, ms))
+            print(f"   • {BACKEND_LABELS.get(name, name):<22s} {n:5d}×{n:<5d} {ms:12.2f} ms")
+        if rows:
+            results[name] = dict(rows)
+            write_benchmark_csv(os.path.join(out_dir, f'benchmark_{name}.csv'), rows)
+    print(f"   ✓ Résultats sauvegardés: {out_dir}/benchmark_*.csv\n")
+    return results
+
+
+def nearest_measurements(results, n):
+    """
+    Mesures de chaque moteur à la taille mesurée la plus proche de n
+
+    Args:
+        results: {moteur: {taille: ms}}
+        n: Taille visée
+
+    Returns:
+        tuple: (taille retenue ou None, {moteur: ms})
+    """
+    sizes = sorted({size for data in results.values() for size in data})
+    if not sizes:
+        return None, {}
+    size = min(sizes, key=lambda s: abs(np.log(s / n)))
+    return size, {name: data[size] for name, data in results.items() if size in data}
+
+
+def plot_benchmark(results, path, point=None):
+    """
+    Courbes temps/taille (log-log) à partir des seuls résultats mesurés
+
+    Args:
+        results: {moteur: {taille: ms}} (voir measured_benchmarks)
+        path: Image de sortie
+        point: (taille, ms, libellé) optionnel, mesure de l'image en cours
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    fig.patch.set_facecolor('#1a1a2e')
+    ax.set_facecolor('#16213e')
+    ax.tick_params(colors='white')
+    for sp in ax.spines.values():
+        sp.set_color('#334466')
+
+    for name, data in sorted(results.items()):
+        sizes = sorted(data)
+        ax.plot(sizes, [data[n] for n in sizes], 'o-', linewidth=2, markersize=7,
+                label=BACKEND_LABELS.get(name, name))
+    if point is not None:
+        ax.plot(point[0], point[1], '*', color='white', markersize=16, label=point[2])
+    if not results and point is None:
+        ax.text(0.5, 0.5, "Aucune mesure : lancer python svd_benchmark.py --suite",
+                transform=ax.transAxes, ha='center', color='white', fontsize=13)
+
+    ax.set_xscale('log', base=2)
+    ax.set_yscale('log')
+    ax.set_xlabel('Taille de la matrice (n×n)', color='white', fontsize=13)
+    ax.set_ylabel('Temps SVD mesuré (ms)', color='white', fontsize=13)
+    ax.set_title('Benchmark SVD (mesures uniquement)', color='white', fontsize=15,
+                 fontweight='bold')
+    ax.grid(True, which='both', color='#2a3a5c', alpha=0.5)
+    if results or point is not None:
+        ax.legend(facecolor='#1a1a2e', labelcolor='white')
+    plt.tight_layout()
+    fig.savefig(path, dpi=150, bbox_inches='tight', facecolor=fig.get_facecolor())
+    plt.close(fig)
+
+
+def precision_report(A, k_values=(5, 10, 25, 50, 100), engine='exact'):
+    """
+    Rapport d'exactitude de la chaîne float32 par rapport à float64
+
+    Args:
+        A: Image (m×n), valeurs dans [0, 255]
+        k_values: Rangs reconstruits et comparés
+        engine: Moteur SVD
+
+    Returns:
+        dict: 'sigma_rel_error' (max |Δσ|/σ₁), 'rows' (k, PSNR64, PSNR32,
+              ΔPSNR, pixels différents, écart max en niveaux de gris),
+              'time_ms' et 'factor_bytes' par précision
+    """
+    k_values = sorted(k for k in set(k_values) if k <= min(A.shape))
+    runs = {}
+    for precision in ('float64', 'float32'):
+        img = as_precision(A, precision)
+        t0 = time.perf_counter()
+        U, S, VT, _ = compute_svd(img, k=max(k_values), engine=engine)
+        frames = {}
+        psnrs = {}
+        for k, work, frame in rank_sweep(U, S, VT, k_values):
+            psnrs[k] = float(psnr_from_mse(mean_squared_error(img, work)))
+            frames[k] = frame.copy()
+        runs[precision] = {
+            'S': S, 'frames': frames, 'psnr': psnrs,
+            'time_ms': (time.perf_counter() - t0) * 1000.0,
+            'factor_bytes': U.nbytes + S.nbytes + VT.nbytes,
+        }
+
+    ref, low = runs['float64'], runs['float32']
+    r = min(len(ref['S']), len(low['S']))
+    sigma_err = float(np.max(np.abs(ref['S'][:r] - low['S'][:r])) / ref['S'][0])
+
+    rows = []
+    for k in k_values:
+        diff = np.abs(ref['frames'][k].astype(np.int16) - low['frames'][k])
+        rows.append((k, ref['psnr'][k], low['psnr'][k], low['psnr'][k] - ref['psnr'][k],
+                     int(np.count_nonzero(diff)), int(diff.max())))
+
+    print(f'   Précision float32 vs float64 ({A.shape[0]}×{A.shape[1]}, moteur {engine})')
+    print(f'   max |Δσ| / σ₁ = {sigma_err:.2e}')
+    print('┌──────┬────────────┬────────────┬──────────┬──────────────┬─────────┐')
+    print('│  k   │ PSNR f64   │ PSNR f32   │  ΔPSNR   │ pixels ≠     │ écart   │')
+    print('├──────┼────────────┼────────────┼──────────┼──────────────┼─────────┤')
+    for k, p64, p32, dp, ndiff, dmax in rows:
+        print(f'│ {k:4d} │ {p64:8.3f}   │ {p32:8.3f}   │ {dp:+8.4f} │ {ndiff:12d} │ {dmax:7d} │')
+    print('└──────┴────────────┴────────────┴──────────┴──────────────┴─────────┘')
+    print(f'   Temps SVD + balayage: {ref["time_ms"]:.1f} ms (f64) / {low["time_ms"]:.1f} ms (f32)')
+    print(f'   Facteurs: {ref["factor_bytes"] / 2**20:.2f} Mo (f64) / '
+          f'{low["factor_bytes"] / 2**20:.2f} Mo (f32)\n')
+
+    return {
+        'sigma_rel_error': sigma_err,
+        'rows': rows,
+        'time_ms': {p: runs[p]['time_ms'] for p in runs},
+        'factor_bytes': {p: runs[p]['factor_bytes'] for p in runs},
+    }
+
+
+# Budget de démarrage (ms, au-delà de l'import de NumPy) des points d'entrée
+STARTUP_BUDGETS_MS = {'svd_compress_python': 150, 'svd_full': 150, 'svd_batch': 150}
+STARTUP_FORBIDDEN = ('matplotlib', 'cv2', 'scipy')
+_IMPORTTIME = re.compile(r'import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( +)(\S+)')
+
+
+def import_times(module, baseline=('numpy',), python=None):
+    """
+    Profil d'import d'un module dans un processus neuf (python -X importtime)
+
+    Args:
+        module: Module à importer
+        baseline: Modules importés avant (leur coût n'est pas compté)
+        python: Interpréteur (None: celui-ci)
+
+    Returns:
+        list: (module, temps cumulé en ms, profondeur) dans l'ordre de
+              -X importtime (un module après ses dépendances) ; profondeur 0
+              pour les modules importés directement par -c
+    """
+    code = 'import ' + ', '.join(tuple(baseline) + (module,))
+    proc = subprocess.run([python or sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=os.path.dirname(os.path.abspath(__file__)),
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} a échoué: {proc.stderr.strip()[-200:]}")
+    times = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            times.append((match.group(4), int(match.group(2)) / 1000.0,
+                          (len(match.group(3)) - 1) // 2))
+    return times
+
+
+def startup_report(budgets=STARTUP_BUDGETS_MS, runs=5, forbidden=STARTUP_FORBIDDEN):
+    """
+    Temps d'import des points d'entrée comparé à leur budget
+
+    Args:
+        budgets: {module: budget en ms}
+        runs: Mesures par module (médiane), après une exécution qui écrit le .pyc
+        forbidden: Modules qui ne doivent pas être chargés au démarrage
+
+    Returns:
+        list: Dictionnaires module, ms, budget, heaviest, forbidden, ok
+    """
+    rows = []
+    print('┌──────────────────────┬───────────┬─────────┬──────────────────────────────────┬────────┐')
+    print('│ Module               │ import ms │ budget  │ imports directs les plus lourds  │ statut │')
+    print('├──────────────────────┼───────────┼─────────┼──────────────────────────────────┼────────┤')
+    for module, budget in budgets.items():
+        import_times(module)
+        samples = [import_times(module) for _ in range(runs)]
+        ms = float(np.median([dict((n, t) for n, t, _ in s)[module] for s in samples]))
+
+        # Sous-arbre du module : ses lignes suivent celles de la ligne de base
+        last = samples[-1]
+        end = [name for name, _, _ in last].index(module)
+        start = max((i + 1 for i in range(end) if last[i][2] == 0), default=0)
+        subtree = last[start:end + 1]
+        children = sorted(((t, name) for name, t, depth in subtree if depth == 1), reverse=True)
+        heaviest = [(name, t) for t, name in children[:3]]
+        loaded = [f for f in forbidden
+                  if any(n == f or n.startswith(f + '.') for n, _, _ in subtree)]
+        ok = ms <= budget and not loaded
+        rows.append({'module': module, 'ms': ms, 'budget': budget, 'heaviest': heaviest,
+                     'forbidden': loaded, 'ok': ok})
+        heavy = ', '.join(f'{name} {t:.0f}' for name, t in heaviest)
+        status = '✓' if ok else '✗'
+        print(f'│ {module:<20s} │ {ms:9.1f} │ {budget:7.0f} │ {heavy[:32]:<32s} │   {status}    │')
+    print('└──────────────────────┴───────────┴─────────┴──────────────────────────────────┴────────┘')
+    for row in rows:
+        if row['forbidden']:
+            print(f"   ✗ {row['module']} charge {', '.join(row['forbidden'])} au démarrage")
+    return rows
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_benchmark.py --shapes 512x768 768x512 --runs 3 --csv rect.csv
+        python svd_benchmark.py --precision-report photo.png
+        python svd_benchmark.py --suite --sizes 256 512 1024 2048 4096 8192
+        python svd_benchmark.py --suite --kind mixed --sizes 512 1024 2048
+        python svd_benchmark.py --startup          (code de sortie 1 si budget dépassé)
+    """
+    import argparse
+
+    from svd_testimages import KINDS
+
+    parser = argparse.ArgumentParser(description='Benchmarks SVD')
+    parser.add_argument('--suite', action='store_true',
+                        help='benchmark multi-moteurs (CSV au format matlab_benchmark.csv)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BENCH_SIZES),
+                        help='tailles n×n de la suite (256 à 8192)')
+    parser.add_argument('--backends', nargs='+', choices=tuple(BACKEND_LABELS)[1:],
+                        help='moteurs de la suite (défaut: tous les disponibles)')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--kind', choices=KINDS,
+                        help='images synthétiques de svd_testimages (défaut: gaussiennes)')
+    parser.add_argument('--c-exe', default='./svd_compressor',
+                        help="exécutable C à mesurer (construit par 'make')")
+    parser.add_argument('-o', '--output', default='.', help='dossier des CSV et du graphique')
+    parser.add_argument('--shapes', nargs='+', default=['512x768', '768x512',
+                                                       '1024x2048', '2048x1024'],
+                        help='dimensions m x n (ex. 512x768)')
+    parser.add_argument('--engine', choices=('exact', 'randomized'), default='exact')
+    parser.add_argument('-k', type=int, help='rang pour le moteur randomized')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--csv', help='fichier CSV de sortie')
+    parser.add_argument('--precision-report', metavar='IMAGE',
+                        help='comparer float32 à float64 sur cette image (niveaux de gris)')
+    parser.add_argument('--startup', action='store_true',
+                        help="temps d'import des points d'entrée contre leur budget")
+    parser.add_argument('--budget', type=float, help='budget de démarrage commun (ms)')
+    args = parser.parse_args()
+
+    if args.startup:
+        budgets = {m: args.budget or b for m, b in STARTUP_BUDGETS_MS.items()}
+        rows = startup_report(budgets, runs=max(args.runs, 1))
+        raise SystemExit(0 if all(row['ok'] for row in rows) else 1)
+
+    if args.suite:
+        run_suite(args.sizes, args.backends, runs=args.runs, warmup=args.warmup,
+                  out_dir=args.output, c_exe=args.c_exe, kind=args.kind)
+        chart = os.path.join(args.output, 'graphique_benchmark.png')
+        plot_benchmark(measured_benchmarks(args.output), chart)
+        print(f"   ✓ Graphique: {chart}")
+        raise SystemExit(0)
+
+    if args.precision_report:
+        from PIL import Image
+        with Image.open(args.precision_report) as img:
+            precision_report(np.asarray(img.convert('L'), dtype=np.float64), engine=args.engine)
+        raise SystemExit(0)
+
+    shapes = [tuple(int(v) for v in s.lower().split('x')) for s in args.shapes]
+    benchmark_rectangular(shapes, engine=args.engine, k=args.k, runs=args.runs,
+                          csv_path=args.csv)
@@ -0,0 +1,134 @@
+"""
+COMPRESSION SVD PAR BLOCS - rang adaptatif par tuile (à la JPEG)
+
+L'image est découpée en tuiles b×b empilées dans un tableau (T, b, b),
+factorisées d'un seul appel par le gufunc np.linalg.svd (SVD « batchée »).
+Chaque tuile reçoit le plus petit rang qui atteint l'objectif de qualité :
+les zones lisses coûtent 1 ou 2 composantes, les zones texturées plus.
+Les lots de tuiles peuvent être répartis sur un pool de processus.
+
+Coût de stockage : Σ_t k_t·(2b + 1) coefficients, à comparer aux m·n
+pixels, comme compression_ratio() pour la SVD globale.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import numpy as np
+
+
+def image_to_tiles(A, block):
+    """
+    Découper une image en tuiles (T, b, b), avec réplication des bords
+
+    Args:
+        A: Image (m×n)
+        block: Taille b des tuiles
+
+    Returns:
+        tuple: (tuiles (T, b, b), (lignes, colonnes) de la grille)
+    """
+    m, n = A.shape
+    th, tw = -(-m // block), -(-n // block)
+    padded = np.pad(A, ((0, th * block - m), (0, tw * block - n)), mode='edge')
+    tiles = padded.reshape(th, block, tw, block).swapaxes(1, 2).reshape(-1, block, block)
+    return tiles, (th, tw)
+
+
+def tiles_to_image(tiles, grid, shape):
+    """
+    Réassembler des tuiles (T, b, b) en image (m×n) (inverse de image_to_tiles)
+
+    Args:
+        tiles: Tuiles (T, b, b)
+        grid: (lignes, colonnes) de la grille
+        shape: (m, n) de l'image originale
+
+    Returns:
+        numpy.ndarray: Image (m×n)
+    """
+    th, tw = grid
+    block = tiles.shape[1]
+    img = tiles.reshape(th, tw, block, block).swapaxes(1, 2).reshape(th * block, tw * block)
+    return img[:shape[0], :shape[1]]
+
+
+def tile_ranks(S, target_psnr=None, rank=None):
+    """
+    Rang de chaque tuile : plus petit k dont l'erreur de troncature respecte
+    l'objectif PSNR (Eckart–Young tuile par tuile), ou rang fixe
+
+    Args:
+        S: Valeurs singulières par tuile (T, b)
+        target_psnr: PSNR visé par tuile (dB)
+        rank: Rang fixe (utilisé si target_psnr est None)
+
+    Returns:
+        numpy.ndarray: Rangs (T,) dans [0, b]
+    """
+    T, b = S.shape
+    if target_psnr is None:
+        return np.full(T, min(rank or b, b), dtype=np.int64)
+
+    s2 = S.astype(np.float64) ** 2
+    total = s2.sum(axis=1, keepdims=True)
+    # tail[:, k] = ||tuile - tuile_k||_F² pour k = 0..b
+    tail = total - np.concatenate([np.zeros((T, 1)), np.cumsum(s2, axis=1)], axis=1)
+    threshold = b * b * (255.0 ** 2) / 10 ** (target_psnr / 10)
+    return (tail > threshold).sum(axis=1)
+
+
+def _compress_batch(tiles, target_psnr, rank):
+    """Compresser un lot de tuiles (exécuté dans un processus du pool)"""
+    U, S, VT = np.linalg.svd(tiles, full_matrices=False)
+    ranks = tile_ranks(S, target_psnr, rank)
+    keep = np.arange(S.shape[1]) < ranks[:, None]
+    S_kept = np.where(keep, S, 0.0)
+    rec = np.matmul(U * S_kept[:, None, :], VT)
+    np.clip(rec, 0, 255, out=rec)
+    return rec, ranks, float(np.sum(S_kept ** 2)), float(np.sum(S ** 2))
+
+
+def compress_blocks(A, block=64, target_psnr=None, rank=None, workers=None, batch=512):
+    """
+    Compression SVD par tuiles b×b avec rang adaptatif
+
+    Args:
+        A: Image (m×n) en float, valeurs dans [0, 255]
+        block: Taille des tuiles (64 ou 128 typiquement)
+        target_psnr: PSNR visé par tuile (dB) ; sinon rang fixe
+        rank: Rang fixe par tuile si target_psnr est None
+        workers: Processus du pool (None ou 1 : dans le processus courant)
+        batch: Nombre de tuiles par lot envoyé à un processus
+
+    Returns:
+        dict: 'image' (m×n, écrêtée), 'ranks' (grille), 'psnr', 'ratio',
+              'energy' (%), 'mean_rank'
+    """
+    m, n = A.shape
+    tiles, grid = image_to_tiles(np.asarray(A, dtype=np.float64), block)
+    batches = [tiles[i:i + batch] for i in range(0, len(tiles), batch)]
+
+    if workers and workers > 1 and len(batches) > 1:
+        from concurrent.futures import ProcessPoolExecutor   # ~20 ms d'import : seulement si utile
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_compress_batch, batches,
+                                  [target_psnr] * len(batches), [rank] * len(batches)))
+    else:
+        parts = [_compress_batch(b, target_psnr, rank) for b in batches]
+
+    rec = tiles_to_image(np.concatenate([p[0] for p in parts]), grid, (m, n))
+    ranks = np.concatenate([p[1] for p in parts])
+    kept = sum(p[2] for p in parts)
+    total = sum(p[3] for p in parts)
+
+    mse = np.mean((A - rec) ** 2)
+    stored = int(ranks.sum()) * (2 * block + 1)
+    return {
+        'image': rec,
+        'ranks': ranks.reshape(grid),
+        'psnr': 100.0 if mse < 1e-10 else 10 * np.log10((255.0 ** 2) / mse),
+        'ratio': (m * n) / stored if stored else float('inf'),
+        'energy': kept / total * 100.0 if total > 0 else 100.0,
+        'mean_rank': float(ranks.mean()),
+    }
@@ -0,0 +1,241 @@
+"""
+CACHE DISQUE DES FACTEURS SVD - (U, S, VT) indexés par le contenu de l'image
+
+La clé est un hachage BLAKE2 des pixels décodés (forme, type, octets),
+du moteur, de la précision et des options de factorisation : changer
+l'image, le moteur ou la précision donne une autre entrée, il n'y a rien
+à invalider à la main. Chaque entrée est un dossier :
+
+    <clé>/U.npy  S.npy  VT.npy   (relus en np.load(mmap_mode='r'))
+    <clé>/meta.json              (version, info de compute_svd, taille)
+
+L'entrée est écrite dans un dossier temporaire puis renommée (os.replace) :
+un processus concurrent ne voit jamais une entrée à moitié écrite. Une
+entrée illisible ou d'une autre version est supprimée et recalculée.
+Éviction LRU sous un budget en octets, la date de modification de
+meta.json servant de date de dernier accès.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from svd_engines import as_precision, compute_svd
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.environ.get(
+    'SVD_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'svd_compression'))
+DEFAULT_BUDGET = 2 * 2**30   # 2 Gio
+FACTORS = ('U', 'S', 'VT')
+
+
+def image_key(A, engine='exact', k=None, precision=None, **options):
+    """
+    Clé de cache : hachage du contenu de l'image et des paramètres de la SVD
+
+    Args:
+        A: Image (m×n) décodée
+        engine: Moteur SVD
+        k: Rang demandé (ignoré par le moteur exact, qui calcule tout)
+        precision: Précision de calcul (None: type de A)
+        **options: Options du moteur (oversampling, power_iters, seed)
+
+    Returns:
+        str: Clé hexadécimale
+    """
+    A = np.ascontiguousarray(A)
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{A.shape}|{A.dtype.str}".encode('ascii'))
+    h.update(memoryview(A).cast('B'))
+    params = {'engine': engine, 'k': None if engine == 'exact' else k,
+              'precision': precision or A.dtype.name, 'options': sorted(options.items()),
+              'version': CACHE_VERSION}
+    h.update(json.dumps(params, sort_keys=True).encode('ascii'))
+    return h.hexdigest()
+
+
+def _entry_size(path):
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+def cache_entries(cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Lister les entrées du cache, de la plus ancienne à la plus récente
+
+    Args:
+        cache_dir: Dossier du cache
+
+    Returns:
+        list: Tuples (dernier accès, taille en octets, chemin)
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        meta = os.path.join(path, 'meta.json')
+        if name.startswith('.') or not os.path.isfile(meta):
+            continue
+        try:
+            entries.append((os.path.getmtime(meta), _entry_size(path), path))
+        except OSError:
+            continue   # supprimée entre-temps par un autre processus
+    return sorted(entries)
+
+
+def evict(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_BUDGET):
+    """
+    Supprimer les entrées les moins récemment utilisées au-delà du budget
+
+    Args:
+        cache_dir: Dossier du cache
+        max_bytes: Taille totale autorisée (octets)
+
+    Returns:
+        int: Nombre d'entrées supprimées
+    """
+    entries = cache_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear_cache(cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Vider le cache : seuls les dossiers d'entrées (et temporaires) sont
+    supprimés ; les fichiers voisins (cost_model.json de svd_scaling,
+    engine_profile.json de svd_autotune) sont gardés
+
+    Args:
+        cache_dir: Dossier du cache
+
+    Returns:
+        int: Nombre de dossiers supprimés
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def _load_entry(path):
+    """Relire une entrée (facteurs en mmap) ; None si absente ou invalide"""
+    try:
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION:
+            raise ValueError(f"version {meta.get('version')}")
+        U, S, VT = (np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+                    for name in FACTORS)
+    except FileNotFoundError:
+        if os.path.isdir(path):                    # meta.json sans facteurs : entrée cassée
+            shutil.rmtree(path, ignore_errors=True)
+        return None
+    except (OSError, ValueError, KeyError):
+        shutil.rmtree(path, ignore_errors=True)   # entrée corrompue : recalcul
+        return None
+    os.utime(os.path.join(path, 'meta.json'))     # dernier accès (LRU)
+    return U, S, VT, meta['info']
+
+
+def _store_entry(cache_dir, key, U, S, VT, info):
+    """Écrire une entrée dans un dossier temporaire puis la publier par renommage"""
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix='.tmp-', dir=cache_dir)
+    try:
+        for name, arr in zip(FACTORS, (U, S, VT)):
+            np.save(os.path.join(tmp, f'{name}.npy'), np.ascontiguousarray(arr))
+        meta = {'version': CACHE_VERSION, 'info': info}
+        with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(cache_dir, key))
+    except OSError:
+        # Entrée déjà publiée par un autre processus, ou disque plein
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def cached_svd(A, k=None, engine='exact', precision=None, cache_dir=DEFAULT_CACHE_DIR,
+               max_bytes=DEFAULT_BUDGET, **options):
+    """
+    compute_svd avec cache disque : une image inchangée n'est pas refactorisée
+
+    Args:
+        A: Image (m×n)
+        k, engine, precision, **options: Voir svd_engines.compute_svd
+        cache_dir: Dossier du cache (None: pas de cache)
+        max_bytes: Budget total du cache (octets)
+
+    Returns:
+        tuple: (U, S, VT, info) ; info['cached'] indique un succès de cache.
+               Les facteurs relus sont des memmaps en lecture seule.
+    """
+    if cache_dir is None:
+        U, S, VT, info = compute_svd(A, k=k, engine=engine, precision=precision, **options)
+        info['cached'] = False
+        return U, S, VT, info
+
+    if precision is not None:
+        A = as_precision(A, precision)
+    key = image_key(A, engine=engine, k=k, precision=precision, **options)
+    path = os.path.join(cache_dir, key)
+
+    entry = _load_entry(path)
+    if entry is not None:
+        U, S, VT, info = entry
+        info['cached'] = True
+        return U, S, VT, info
+
+    U, S, VT, info = compute_svd(A, k=k, engine=engine, precision=precision, **options)
+    info = {name: (value.item() if isinstance(value, np.generic) else value)
+            for name, value in info.items()}
+    _store_entry(cache_dir, key, U, S, VT, info)
+    evict(cache_dir, max_bytes)
+    info['cached'] = False
+    return U, S, VT, info
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_cache.py --list
+        python svd_cache.py --evict 500     (budget en Mo)
+        python svd_cache.py --clear
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Cache disque des facteurs SVD')
+    parser.add_argument('--dir', default=DEFAULT_CACHE_DIR, help='dossier du cache')
+    parser.add_argument('--list', action='store_true', help='lister les entrées (LRU en premier)')
+    parser.add_argument('--evict', type=int, metavar='MO', help='réduire le cache à ce budget')
+    parser.add_argument('--clear', action='store_true', help='vider le cache')
+    args = parser.parse_args()
+
+    if args.clear:
+        print(f"   ✓ Cache vidé: {clear_cache(args.dir)} entrée(s) supprimée(s) de {args.dir}")
+    if args.evict is not None:
+        print(f"   ✓ {evict(args.dir, args.evict * 2**20)} entrée(s) supprimée(s)")
+    if args.list or not (args.clear or args.evict is not None):
+        entries = cache_entries(args.dir)
+        for _, size, path in entries:
+            print(f"   • {os.path.basename(path)}  {size / 2**20:8.2f} Mo")
+        print(f"   {len(entries)} entrée(s), {sum(e[1] for e in entries) / 2**20:.2f} Mo "
+              f"dans {args.dir}")
@@ -0,0 +1,241 @@
+"""
+LIAISON PYTHON DES NOYAUX C - svd_compress.c par ctypes, sans fichier PGM
+
+    make lib                          → libsvdcompress.so
+    U, S, VT = c_svd(A)               # LAPACKE dgesdd/dgesvd
+    A_k = c_reconstruct(U, S, VT, k)  # dcopy/dscal + dgemm, écrêté
+    psnr = c_psnr(A, A_k)             # daxpy + ddot
+
+Le pilote LAPACK ('gesvd', 'gesdd' ou 'auto', comme SVDDriver) est
+transmis au noyau C, qui se replie sur dgesvd si dgesdd échoue ;
+return_driver=True renvoie le pilote effectivement utilisé.
+
+Les tableaux NumPy sont passés par adresse, sans copie. LAPACK/BLAS
+attendent du column-major ; un tableau C m×n est, lu en column-major, la
+matrice Aᵀ (n×m). Plutôt que de transposer, on factorise donc Aᵀ et
+on relit les facteurs : Aᵀ = U' S V'ᵀ donne A = V' S U'ᵀ, et les sorties
+Fortran de LAPACK relues transposées sont des tableaux C ordinaires. Les
+tableaux Fortran sont passés tels quels. Seule copie : l'entrée de la SVD,
+que LAPACK détruit (overwrite_a=True pour l'éviter).
+
+ctypes relâche le GIL pendant l'appel : les noyaux peuvent tourner en
+parallèle dans plusieurs threads.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import ctypes
+import os
+
+import numpy as np
+
+from svd_memstats import count_alloc, count_copy
+
+
+LIB_NAME = 'libsvdcompress.so'
+DRIVER_CODES = {'gesvd': 0, 'gesdd': 1, 'auto': 2}     # enum SVDDriver
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+_lib = None
+_double_p = np.ctypeslib.ndpointer(dtype=np.float64)
+_int = ctypes.c_int
+
+
+def load_library(path=None):
+    """
+    Charger libsvdcompress.so (une seule fois)
+
+    Args:
+        path: Chemin de la bibliothèque (None: $SVD_CLIB, puis le dossier
+              de ce module)
+
+    Returns:
+        ctypes.CDLL: Bibliothèque avec les signatures déclarées
+    """
+    global _lib
+    if _lib is not None and path is None:
+        return _lib
+
+    path = path or os.environ.get('SVD_CLIB') or os.path.join(_HERE, LIB_NAME)
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError as e:
+        raise OSError(f"Bibliothèque C introuvable ({path}) : compiler avec 'make lib'") from e
+
+    lib.svd_compute_buffers.argtypes = [_int, _int, _double_p, _double_p,
+                                        _double_p, _int, _double_p, _int,
+                                        _int, ctypes.POINTER(_int)]
+    lib.svd_compute_buffers.restype = _int
+    lib.svd_reconstruct_buffers.argtypes = [_int, _int, _int, _double_p, _int, _double_p,
+                                            _double_p, _int, _double_p]
+    lib.svd_reconstruct_buffers.restype = _int
+    lib.svd_psnr_buffers.argtypes = [_int, _double_p, _double_p]
+    lib.svd_psnr_buffers.restype = ctypes.c_double
+
+    _lib = lib
+    return lib
+
+
+def available():
+    """True si la bibliothèque C est chargeable"""
+    try:
+        load_library()
+        return True
+    except OSError:
+        return False
+
+
+def _layout(*arrays):
+    """
+    Même disposition mémoire pour tous les tableaux, sans copie si possible
+
+    Returns:
+        tuple: (tableaux float64 contigus, True si column-major)
+    """
+    arrays = [np.asarray(X, dtype=np.float64) for X in arrays]
+    if all(X.flags.f_contiguous for X in arrays):
+        return arrays, True
+    return [np.ascontiguousarray(X) for X in arrays], False
+
+
+def c_svd(A, k=None, overwrite_a=False, driver='auto', return_driver=False):
+    """
+    SVD économique par svd_compute_buffers (LAPACKE dgesdd ou dgesvd)
+
+    Args:
+        A: Matrice (m×n)
+        k: Nombre de triplets à garder (None pour tout garder)
+        overwrite_a: Autoriser la destruction de A (évite la seule copie)
+        driver: 'auto', 'gesdd' ou 'gesvd'
+        return_driver: Renvoyer aussi le pilote utilisé
+
+    Returns:
+        tuple: (U, S, VT) ou (U, S, VT, pilote) ; pour une entrée C, U et VT
+               sont des vues C-contiguës des sorties Fortran
+    """
+    if driver not in DRIVER_CODES:
+        raise ValueError(f"Pilote LAPACK inconnu: {driver!r} (choix: {', '.join(DRIVER_CODES)})")
+    lib = load_library()
+    (M,), fortran = _layout(A)
+    if not overwrite_a and np.may_share_memory(M, A):
+        M = M.copy(order='F' if fortran else 'C')
+    if M is not A:
+        count_copy(M)
+
+    m, n = M.shape
+    r = min(m, n)
+    # Matrice vue par LAPACK (p×q, column-major) : A elle-même ou Aᵀ
+    p, q = (m, n) if fortran else (n, m)
+    S = np.empty(r)
+    Uf = np.empty((p, r), order='F')
+    VTf = np.empty((r, q), order='F')
+    count_alloc(M if M is not A else None, S, Uf, VTf)
+    used = _int(-1)
+    info = lib.svd_compute_buffers(p, q, M, S, Uf, p, VTf, r, DRIVER_CODES[driver],
+                                   ctypes.byref(used))
+    if info != 0:
+        raise np.linalg.LinAlgError(f"svd_compute_buffers: code LAPACK {info}")
+
+    if fortran:
+        U, VT = Uf, VTf
+    else:
+        U, VT = VTf.T, Uf.T            # A = V' S U'ᵀ : transposées = vues C
+    if k is not None:
+        U, S, VT = U[:, :k], S[:k], VT[:k, :]
+    if return_driver:
+        names = {code: name for name, code in DRIVER_CODES.items()}
+        return U, S, VT, names[used.value]
+    return U, S, VT
+
+
+def c_reconstruct(U, S, VT, k, out=None):
+    """
+    Reconstruction de rang k écrêtée dans [0, 255] par svd_reconstruct_buffers
+
+    Args:
+        U, S, VT: Facteurs (U m×r, VT r×n), lus en place
+        k: Rang
+        out: Tampon (m×n) float64 contigu, même ordre que U et VT (None:
+             nouveau tableau)
+
+    Returns:
+        numpy.ndarray: A_k écrêté
+    """
+    lib = load_library()
+    (U, VT), fortran = _layout(U, VT)
+    S = np.ascontiguousarray(S, dtype=np.float64)
+    m, n = U.shape[0], VT.shape[1]
+    if not 1 <= k <= min(len(S), U.shape[1], VT.shape[0]):
+        raise ValueError(f"k doit être compris entre 1 et {len(S)} (reçu {k})")
+
+    order = 'F' if fortran else 'C'
+    if out is None:
+        out = np.empty((m, n), order=order)
+    elif out.shape != (m, n) or out.dtype != np.float64 or \
+            not out.flags[f'{order}_CONTIGUOUS']:
+        raise ValueError(f"out doit être un tableau float64 {m}×{n} contigu ({order})")
+
+    if fortran:
+        status = lib.svd_reconstruct_buffers(m, n, k, U, m, S, VT, VT.shape[0], out)
+    else:
+        # Tableaux C relus en column-major : A_kᵀ = VT_kᵀ · diag(S_k) · U_kᵀ
+        status = lib.svd_reconstruct_buffers(n, m, k, VT, n, S, U, U.shape[1], out)
+    if status != 0:
+        raise MemoryError("svd_reconstruct_buffers: allocation échouée")
+    return out
+
+
+def c_psnr(original, reconstructed):
+    """
+    PSNR (dB) par svd_psnr_buffers (daxpy + ddot)
+
+    Args:
+        original, reconstructed: Matrices de même forme
+
+    Returns:
+        float: PSNR (99.99 si les images sont identiques)
+    """
+    if np.shape(original) != np.shape(reconstructed):
+        raise ValueError("Les deux images doivent avoir la même forme")
+    (a, b), _ = _layout(original, reconstructed)
+    return load_library().svd_psnr_buffers(a.size, a, b)
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        make lib && python svd_clib.py image.png -k 50
+        python svd_clib.py --size 1024 -k 50         (matrice aléatoire)
+    """
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Noyaux C (LAPACKE/CBLAS) depuis Python')
+    parser.add_argument('image', nargs='?', help='image (défaut: matrice aléatoire)')
+    parser.add_argument('--size', type=int, default=512, help='taille de la matrice aléatoire')
+    parser.add_argument('-k', type=int, default=50)
+    parser.add_argument('--driver', choices=tuple(DRIVER_CODES), default='auto',
+                        help='pilote LAPACK')
+    parser.add_argument('--lib', help=f'chemin de {LIB_NAME}')
+    args = parser.parse_args()
+
+    load_library(args.lib)
+    if args.image:
+        from PIL import Image
+        A = np.asarray(Image.open(args.image).convert('L'), dtype=np.float64)
+    else:
+        A = np.random.default_rng(42).uniform(0, 255, (args.size, args.size))
+
+    t0 = time.perf_counter()
+    U, S, VT, used = c_svd(A, driver=args.driver, return_driver=True)
+    t_c = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    U_np, S_np, VT_np = np.linalg.svd(A, full_matrices=False)
+    t_np = time.perf_counter() - t0
+
+    k = min(args.k, len(S))
+    A_k = c_reconstruct(U, S, VT, k)
+    print(f"   • {A.shape[0]}×{A.shape[1]} : SVD C {t_c * 1000:.1f} ms (d{used}), NumPy {t_np * 1000:.1f} ms")
+    print(f"   • max |σ_C - σ_NumPy| = {np.max(np.abs(S - S_np)):.2e}")
+    print(f"   • PSNR(k={k}) = {c_psnr(A, A_k):.2f} dB")
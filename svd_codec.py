@@ -0,0 +1,362 @@
+"""
+FORMAT .svdz - stockage réel des facteurs U_k, S_k, VT_k
+
+Structure d'un fichier :
+    en-tête (24 octets, little-endian)
+        magic    4s   b'SVDZ'
+        version  B
+        quant    B    0 = float16, 1 = int8 (échelle par composante)
+        codec    B    0 = zlib, 1 = lzma
+        flags    B    réservé (0)
+        m, n, k  3×I  dimensions de l'image et rang
+        crc32    I    somme de contrôle des données décompressées
+    données compressées (codage entropique zlib/lzma) :
+        S        float32[k]
+        int8     : échelles U float32[k], échelles V float32[k],
+                   U_kᵀ int8[k·m], VT_k int8[k·n]
+        float16  : U_kᵀ float16[k·m], VT_k float16[k·n], octets regroupés
+                   (poids faibles puis poids forts) pour aider le codeur
+
+Les composantes sont rangées par ordre de σ décroissant (U_kᵀ et VT_k
+ligne par ligne) : la colonne i de U et la ligne i de VT sont contiguës.
+La variante progressive .svds (fin du module) découpe ce flux en blocs
+décodables séparément pour afficher des aperçus pendant la réception.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import io
+import lzma
+import struct
+import zlib
+
+import numpy as np
+
+from svd_sweep import add_rank_block, render_frame
+
+
+MAGIC = b'SVDZ'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBBIIII')
+
+QUANTS = ('float16', 'int8')
+CODECS = ('zlib', 'lzma')
+
+
+def _shuffle16(a):
+    """Regrouper les octets de poids faible puis fort d'un tableau float16"""
+    b = np.ascontiguousarray(a).view(np.uint8).reshape(-1, 2)
+    return np.ascontiguousarray(b.T).tobytes()
+
+
+def _unshuffle16(buf, count):
+    """Inverse de _shuffle16"""
+    b = np.frombuffer(buf, dtype=np.uint8, count=2 * count).reshape(2, count)
+    return np.ascontiguousarray(b.T).view(np.float16).ravel()
+
+
+def _quantize_int8(rows):
+    """Quantifier chaque ligne sur [-127, 127] avec sa propre échelle"""
+    scales = np.abs(rows).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    q = np.rint(rows / scales[:, None]).astype(np.int8)
+    return q, scales.astype(np.float32)
+
+
+def _pack(Ut, S, Vt, quant):
+    """Sérialiser un groupe de composantes (S, U_kᵀ, VT_k) avant codage"""
+    parts = [np.asarray(S, dtype=np.float32).tobytes()]
+    if quant == 'int8':
+        qu, su = _quantize_int8(Ut)
+        qv, sv = _quantize_int8(Vt)
+        parts += [su.tobytes(), sv.tobytes(), qu.tobytes(), qv.tobytes()]
+    else:
+        parts += [_shuffle16(Ut.astype(np.float16)), _shuffle16(Vt.astype(np.float16))]
+    return b''.join(parts)
+
+
+def _unpack(raw, k, m, n, quant):
+    """Inverse de _pack : retourne (U_kᵀ, S, VT_k) en float32"""
+    S = np.frombuffer(raw, dtype=np.float32, count=k)
+    off = 4 * k
+    if quant == 'int8':
+        su = np.frombuffer(raw, dtype=np.float32, count=k, offset=off)
+        sv = np.frombuffer(raw, dtype=np.float32, count=k, offset=off + 4 * k)
+        off += 8 * k
+        Ut = np.frombuffer(raw, dtype=np.int8, count=k * m, offset=off).reshape(k, m)
+        Vt = np.frombuffer(raw, dtype=np.int8, count=k * n, offset=off + k * m).reshape(k, n)
+        Ut = Ut * su[:, None]
+        Vt = Vt * sv[:, None]
+    else:
+        Ut = _unshuffle16(raw[off:off + 2 * k * m], k * m).reshape(k, m).astype(np.float32)
+        Vt = _unshuffle16(raw[off + 2 * k * m:], k * n).reshape(k, n).astype(np.float32)
+    return Ut, S, Vt
+
+
+def _compress(raw, codec, level):
+    return zlib.compress(raw, level) if codec == 'zlib' else lzma.compress(raw, preset=level)
+
+
+def _decompress(payload, codec):
+    return zlib.decompress(payload) if codec == 'zlib' else lzma.decompress(payload)
+
+
+def _check_options(quant, codec):
+    if quant not in QUANTS:
+        raise ValueError(f"Quantification inconnue: {quant!r} (choix: {', '.join(QUANTS)})")
+    if codec not in CODECS:
+        raise ValueError(f"Codec inconnu: {codec!r} (choix: {', '.join(CODECS)})")
+
+
+def _header_options(quant, codec):
+    """Noms de la quantification et du codec lus dans un en-tête"""
+    if quant >= len(QUANTS):
+        raise ValueError(f"Quantification inconnue dans l'en-tête: {quant}")
+    if codec >= len(CODECS):
+        raise ValueError(f"Codec inconnu dans l'en-tête: {codec}")
+    return QUANTS[quant], CODECS[codec]
+
+
+def _check_ranks(U, S, VT, ks):
+    """Chaque k doit désigner des composantes présentes (1 ≤ k ≤ r)"""
+    r = min(U.shape[1], len(S), VT.shape[0])
+    bad = [k for k in ks if not 1 <= k <= r]
+    if bad:
+        raise ValueError(f"k doit être compris entre 1 et {r} (rang des facteurs), reçu "
+                         f"{', '.join(map(str, bad))}")
+
+
+def encode(U, S, VT, k, quant='int8', codec='zlib', level=9):
+    """
+    Encoder les k premières composantes au format .svdz
+
+    Args:
+        U: Matrice U (m×r)
+        S: Valeurs singulières (r)
+        VT: Matrice V^T (r×n)
+        k: Nombre de composantes stockées
+        quant: 'int8' (échelle par composante) ou 'float16'
+        codec: Codage entropique 'zlib' ou 'lzma'
+        level: Niveau de compression du codec
+
+    Returns:
+        bytes: Fichier .svdz complet
+    """
+    _check_options(quant, codec)
+    _check_ranks(U, S, VT, [k])
+
+    m, n = U.shape[0], VT.shape[1]
+    raw = _pack(U[:, :k].T, S[:k], VT[:k, :], quant)
+    payload = _compress(raw, codec, level)
+
+    header = HEADER.pack(MAGIC, VERSION, QUANTS.index(quant), CODECS.index(codec), 0,
+                         m, n, k, zlib.crc32(raw))
+    return header + payload
+
+
+def decode(data):
+    """
+    Décoder un fichier .svdz en facteurs float32
+
+    Args:
+        data: Contenu du fichier (bytes)
+
+    Returns:
+        tuple: (U (m×k), S (k), VT (k×n)) en float32
+    """
+    magic, version, quant, codec, _, m, n, k, crc = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Fichier .svdz invalide (magic)")
+    if version != VERSION:
+        raise ValueError(f"Version .svdz non supportée: {version}")
+    quant, codec = _header_options(quant, codec)
+
+    raw = _decompress(memoryview(data)[HEADER.size:], codec)
+    if zlib.crc32(raw) != crc:
+        raise ValueError("Fichier .svdz corrompu (crc32)")
+
+    Ut, S, Vt = _unpack(raw, k, m, n, quant)
+    return Ut.T, S, Vt
+
+
+def decode_image(data, out=None):
+    """
+    Décoder un fichier .svdz directement en image uint8
+
+    Args:
+        data: Contenu du fichier (bytes)
+        out: Tampon uint8 (m×n) optionnel
+
+    Returns:
+        numpy.ndarray: Image (m×n) uint8
+    """
+    U, S, VT = decode(data)
+    img = (U * S) @ VT
+    np.clip(img, 0, 255, out=img)
+    if out is None:
+        return img.astype(np.uint8)
+    np.copyto(out, img, casting='unsafe')
+    return out
+
+
+def save_svdz(path, U, S, VT, k, **options):
+    """
+    Écrire un fichier .svdz
+
+    Args:
+        path: Chemin du fichier
+        U, S, VT: Facteurs SVD
+        k: Nombre de composantes stockées
+        **options: quant, codec, level (voir encode)
+
+    Returns:
+        int: Taille du fichier en octets
+    """
+    data = encode(U, S, VT, k, **options)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def load_svdz(path):
+    """
+    Lire un fichier .svdz
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        tuple: (U, S, VT) en float32
+    """
+    with open(path, 'rb') as f:
+        return decode(f.read())
+
+
+# ─────────────────────────────────────────────
+# VARIANTE PROGRESSIVE (.svds) : décodage par raffinements successifs
+# ─────────────────────────────────────────────
+#
+#   en-tête    : comme .svdz avec magic b'SVDS' ; k = rang total, crc32 = 0
+#   blocs      : k_début, nombre, taille, crc32 (4×I) puis données codées
+#
+# Chaque bloc porte des composantes consécutives (ordre de σ décroissant)
+# et se décode seul : un fichier tronqué ou un flux partiellement reçu
+# donne déjà l'aperçu de tous les blocs complets.
+
+STREAM_MAGIC = b'SVDS'
+CHUNK = struct.Struct('<IIII')
+
+
+def encode_stream(U, S, VT, k_values, quant='int8', codec='zlib', level=9):
+    """
+    Encoder les composantes en blocs progressifs, un bloc par palier de k
+
+    Args:
+        U: Matrice U (m×r)
+        S: Valeurs singulières (r)
+        VT: Matrice V^T (r×n)
+        k_values: Paliers de raffinement (ex. [1, 5, 10, 25]) ; le dernier
+                  est le rang total stocké
+        quant, codec, level: Voir encode
+
+    Returns:
+        bytes: Fichier .svds complet
+    """
+    _check_options(quant, codec)
+    ks = sorted(set(k_values))
+    if not ks:
+        raise ValueError("k_values vide")
+    _check_ranks(U, S, VT, ks)
+
+    m, n = U.shape[0], VT.shape[1]
+    parts = [HEADER.pack(STREAM_MAGIC, VERSION, QUANTS.index(quant), CODECS.index(codec), 0,
+                         m, n, ks[-1], 0)]
+
+    k_prev = 0
+    for k in ks:
+        raw = _pack(U[:, k_prev:k].T, S[k_prev:k], VT[k_prev:k, :], quant)
+        payload = _compress(raw, codec, level)
+        parts += [CHUNK.pack(k_prev, k - k_prev, len(payload), zlib.crc32(raw)), payload]
+        k_prev = k
+
+    return b''.join(parts)
+
+
+def _byte_reader(source):
+    """Fonction read(n) sur bytes, fichier ouvert ou itérable de morceaux"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    if hasattr(source, 'read'):
+        def read(size):
+            data = source.read(size)
+            while data and len(data) < size:
+                more = source.read(size - len(data))
+                if not more:
+                    break
+                data += more
+            return data
+        return read
+
+    pieces = iter(source)
+    buffer = bytearray()
+
+    def read(size):
+        while len(buffer) < size:
+            piece = next(pieces, None)
+            if piece is None:
+                break
+            buffer.extend(piece)
+        data = bytes(buffer[:size])
+        del buffer[:size]
+        return data
+    return read
+
+
+def iter_decode_stream(source, out=None):
+    """
+    Générateur d'aperçus de plus en plus fins à partir d'un flux .svds
+
+    Chaque bloc complet est ajouté à l'accumulateur par add_rank_block
+    (pas de remultiplication depuis k = 1). Un bloc incomplet (fichier
+    tronqué, flux interrompu) termine proprement l'itération.
+
+    Args:
+        source: bytes, fichier ouvert en binaire ou itérable de morceaux
+        out: Tampon uint8 (m×n) optionnel, réutilisé à chaque palier
+
+    Yields:
+        tuple: (k, image uint8) — le tampon est réutilisé au palier suivant
+    """
+    read = _byte_reader(source)
+    header = read(HEADER.size)
+    if len(header) < HEADER.size:
+        return
+    magic, version, quant, codec, _, m, n, _, _ = HEADER.unpack(header)
+    if magic != STREAM_MAGIC:
+        raise ValueError("Flux .svds invalide (magic)")
+    if version != VERSION:
+        raise ValueError(f"Version .svds non supportée: {version}")
+    quant, codec = _header_options(quant, codec)
+
+    acc = np.zeros((m, n), dtype=np.float32)
+    work = np.empty((m, n), dtype=np.float32)
+    frame = out if out is not None else np.empty((m, n), dtype=np.uint8)
+
+    while True:
+        chunk = read(CHUNK.size)
+        if len(chunk) < CHUNK.size:
+            return
+        k_start, count, size, crc = CHUNK.unpack(chunk)
+        payload = read(size)
+        if len(payload) < size:
+            return
+
+        raw = _decompress(payload, codec)
+        if zlib.crc32(raw) != crc:
+            raise ValueError(f"Bloc .svds corrompu (composantes {k_start + 1}..{k_start + count})")
+        Ut, S, Vt = _unpack(raw, count, m, n, quant)
+
+        add_rank_block(acc, Ut.T, S, Vt, work)
+        render_frame(acc, work, frame)
+        yield k_start + count, frame
@@ -0,0 +1,169 @@
+"""
+COMPRESSION SVD COULEUR - canaux empilés, une seule SVD « batchée »
+
+Au lieu de relancer le script trois fois (une par canal), les canaux sont
+empilés dans un tableau (C, m, n) et factorisés d'un seul appel au gufunc
+np.linalg.svd. Deux modes :
+    'rgb'    rangs par canal R, G, B
+    'ycbcr'  luminance Y et chrominances Cb/Cr (JPEG, BT.601 plein
+             intervalle) : l'œil tolère un rang bien plus faible en chroma
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import time
+
+import numpy as np
+from PIL import Image
+
+from svd_metrics import psnr_from_mse, rate_distortion_curve, select_rank
+
+
+COLOR_MODES = ('rgb', 'ycbcr')
+CHANNEL_NAMES = {'rgb': ('R', 'G', 'B'), 'ycbcr': ('Y', 'Cb', 'Cr')}
+
+# Matrices JPEG (BT.601, plein intervalle), décalage de 128 sur Cb/Cr
+_RGB_TO_YCBCR = np.array([[0.299, 0.587, 0.114],
+                          [-0.168736, -0.331264, 0.5],
+                          [0.5, -0.418688, -0.081312]])
+_YCBCR_TO_RGB = np.linalg.inv(_RGB_TO_YCBCR)
+_OFFSET = np.array([0.0, 128.0, 128.0])
+
+
+def load_color_image(filepath):
+    """
+    Charger une image couleur en tableau (3, m, n) float64
+
+    Args:
+        filepath: Chemin de l'image
+
+    Returns:
+        numpy.ndarray: Canaux R, G, B empilés, valeurs dans [0, 255]
+    """
+    with Image.open(filepath) as img:
+        rgb = np.asarray(img.convert('RGB'), dtype=np.float64)
+    return np.ascontiguousarray(rgb.transpose(2, 0, 1))
+
+
+def rgb_to_ycbcr(rgb):
+    """Convertir (3, m, n) RGB en (3, m, n) YCbCr"""
+    return np.tensordot(_RGB_TO_YCBCR, rgb, axes=1) + _OFFSET[:, None, None]
+
+
+def ycbcr_to_rgb(ycc):
+    """Convertir (3, m, n) YCbCr en (3, m, n) RGB"""
+    return np.tensordot(_YCBCR_TO_RGB, ycc - _OFFSET[:, None, None], axes=1)
+
+
+def compress_color(rgb, ranks=None, mode='ycbcr', target_psnr=None, chroma_psnr=None):
+    """
+    Compresser une image couleur : une SVD batchée pour tous les canaux
+
+    Args:
+        rgb: Canaux (3, m, n) dans [0, 255]
+        ranks: Rang commun (int) ou un rang par canal ; ignoré si
+               target_psnr est fourni
+        mode: 'rgb' ou 'ycbcr'
+        target_psnr: PSNR visé par canal (dB) → rang par canal en forme close
+        chroma_psnr: PSNR visé pour Cb/Cr en mode 'ycbcr' (défaut: target_psnr)
+
+    Returns:
+        dict: 'image' (m, n, 3) uint8, 'ranks', 'channel_psnr',
+              'channel_energy', 'psnr' (RGB), 'ratio', 'time_svd'
+    """
+    if mode not in COLOR_MODES:
+        raise ValueError(f"Mode couleur inconnu: {mode!r} (choix: {', '.join(COLOR_MODES)})")
+
+    C, m, n = rgb.shape
+    channels = rgb_to_ycbcr(rgb) if mode == 'ycbcr' else rgb
+
+    t0 = time.time()
+    U, S, VT = np.linalg.svd(channels, full_matrices=False)   # (C, m, r), (C, r), (C, r, n)
+    time_svd = time.time() - t0
+
+    if target_psnr is not None:
+        targets = [target_psnr] * C
+        if mode == 'ycbcr' and chroma_psnr is not None:
+            targets[1:] = [chroma_psnr] * (C - 1)
+        ranks = [select_rank(S[c], m, n, psnr=targets[c]) or S.shape[1] for c in range(C)]
+    elif ranks is None:
+        ranks = [min(m, n)] * C
+    elif np.isscalar(ranks):
+        ranks = [ranks] * C
+    elif len(ranks) not in (1, C):
+        raise ValueError(f"ranks: un rang commun ou un par canal ({C}), reçu {len(ranks)}")
+    ranks = np.broadcast_to(np.asarray(ranks, dtype=np.int64), (C,))
+    if ranks.min() < 1 or ranks.max() > min(m, n):
+        raise ValueError(f"Les rangs doivent être compris entre 1 et {min(m, n)} "
+                         f"(reçu {ranks.tolist()})")
+
+    keep = np.arange(S.shape[1]) < ranks[:, None]
+    S_kept = np.where(keep, S, 0.0)
+    rec = np.matmul(U * S_kept[:, None, :], VT)
+
+    channel_psnr, channel_energy = [], []
+    for c in range(C):
+        curve = rate_distortion_curve(S[c], m, n)
+        channel_psnr.append(float(curve['psnr'][ranks[c] - 1]))
+        channel_energy.append(float(curve['energy'][ranks[c] - 1]))
+
+    if mode == 'ycbcr':
+        rec = ycbcr_to_rgb(rec)
+    np.clip(rec, 0, 255, out=rec)
+    mse = np.mean((rgb - rec) ** 2)
+
+    return {
+        'image': np.ascontiguousarray(rec.transpose(1, 2, 0)).astype(np.uint8),
+        'ranks': ranks,
+        'channel_psnr': channel_psnr,
+        'channel_energy': channel_energy,
+        'psnr': float(psnr_from_mse(mse)),
+        'ratio': (C * m * n) / (int(ranks.sum()) * (m + n + 1)),
+        'time_svd': time_svd,
+    }
+
+
+def print_color_report(result, mode):
+    """
+    Afficher rangs, PSNR et énergie par canal, puis le bilan global
+
+    Args:
+        result: Dictionnaire retourné par compress_color
+        mode: 'rgb' ou 'ycbcr'
+    """
+    print('┌───────┬──────┬──────────┬──────────────┐')
+    print('│ Canal │  k   │   PSNR   │   Énergie    │')
+    print('├───────┼──────┼──────────┼──────────────┤')
+    for name, k, p, e in zip(CHANNEL_NAMES[mode], result['ranks'],
+                             result['channel_psnr'], result['channel_energy']):
+        print(f'│ {name:<5s} │ {k:4d} │ {p:7.2f}  │   {e:6.2f}%    │')
+    print('└───────┴──────┴──────────┴──────────────┘')
+    print(f'   PSNR RGB global: {result["psnr"]:.2f} dB │ '
+          f'ratio {result["ratio"]:.1f}:1 │ SVD batchée en {result["time_svd"]:.4f} s\n')
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_color.py photo.jpg --mode ycbcr --ranks 60 15 15
+        python svd_color.py photo.jpg --target-psnr 35 --chroma-psnr 30
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compression SVD couleur (canaux empilés)')
+    parser.add_argument('image', help='image couleur à compresser')
+    parser.add_argument('--mode', choices=COLOR_MODES, default='ycbcr')
+    parser.add_argument('--ranks', type=int, nargs='+', help='rang commun ou un rang par canal')
+    parser.add_argument('--target-psnr', type=float, help='PSNR visé par canal (dB)')
+    parser.add_argument('--chroma-psnr', type=float, help='PSNR visé pour Cb/Cr (mode ycbcr)')
+    parser.add_argument('-o', '--output', help='image reconstruite (PNG, JPEG…)')
+    args = parser.parse_args()
+
+    ranks = args.ranks[0] if args.ranks and len(args.ranks) == 1 else args.ranks
+    result = compress_color(load_color_image(args.image), ranks=ranks, mode=args.mode,
+                            target_psnr=args.target_psnr, chroma_psnr=args.chroma_psnr)
+    print_color_report(result, args.mode)
+    if args.output:
+        Image.fromarray(result['image']).save(args.output)
+        print(f'   ✓ Image sauvegardée: {args.output}')
@@ -20,6 +20,8 @@ SVD* svd_create(int m, int n) {
     svd->n = n;
     svd->min_dim = (m < n) ? m : n;
     svd->computed = 0;
+    svd->driver = SVD_DRIVER_AUTO;
+    svd->driver_used = SVD_DRIVER_AUTO;
     
     // Allocation optimisée : U (m × min_dim), VT (min_dim × n)
     svd->U = (double*)calloc(m * svd->min_dim, sizeof(double));
@@ -47,7 +49,129 @@ void svd_free(SVD *svd) {
 }
 
 /******************************************************************************
- * Calculer la SVD avec LAPACK (dgesvd)
+ * Noms des pilotes (affichage, arguments de la ligne de commande)
+ ******************************************************************************/
+const char* svd_driver_name(int driver) {
+    switch (driver) {
+        case SVD_DRIVER_GESVD: return "dgesvd";
+        case SVD_DRIVER_GESDD: return "dgesdd";
+        default:               return "auto";
+    }
+}
+
+int svd_parse_driver(const char *name) {
+    if (!name) return SVD_DRIVER_AUTO;
+    if (strcmp(name, "gesvd") == 0 || strcmp(name, "dgesvd") == 0) return SVD_DRIVER_GESVD;
+    if (strcmp(name, "gesdd") == 0 || strcmp(name, "dgesdd") == 0) return SVD_DRIVER_GESDD;
+    if (strcmp(name, "auto") == 0) return SVD_DRIVER_AUTO;
+    return -1;
+}
+
+// Pilote effectif d'une demande (SVD_DRIVER_AUTO résolu selon min(m, n))
+static int svd_resolve_driver(int driver, int m, int n) {
+    int min_dim = (m < n) ? m : n;
+    if (driver == SVD_DRIVER_AUTO) {
+        return (min_dim >= SVD_GESDD_MIN_DIM) ? SVD_DRIVER_GESDD : SVD_DRIVER_GESVD;
+    }
+    return driver;
+}
+
+/******************************************************************************
+ * dgesvd avec requête de workspace
+ ******************************************************************************/
+static int svd_gesvd_buffers(int m, int n, double *A, double *S,
+                             double *U, int ldu, double *VT, int ldvt) {
+    // 1. Requête de la taille optimale du workspace
+    double work_query;
+    int info = LAPACKE_dgesvd_work(LAPACK_COL_MAJOR, 'S', 'S',
+                                   m, n, A, m, S, U, ldu, VT, ldvt,
+                                   &work_query, -1);
+    if (info != 0) return info;
+
+    int lwork = (int)work_query;
+    double *work = (double*)malloc((size_t)lwork * sizeof(double));
+    if (!work) return -1;
+
+    // 2. Calcul avec le workspace alloué
+    info = LAPACKE_dgesvd_work(LAPACK_COL_MAJOR, 'S', 'S',
+                               m, n, A, m, S, U, ldu, VT, ldvt,
+                               work, lwork);
+    free(work);
+    return info;
+}
+
+/******************************************************************************
+ * dgesdd avec requête de workspace (iwork : 8·min(m, n) entiers)
+ ******************************************************************************/
+static int svd_gesdd_buffers(int m, int n, double *A, double *S,
+                             double *U, int ldu, double *VT, int ldvt) {
+    int min_dim = (m < n) ? m : n;
+    int *iwork = (int*)malloc((size_t)8 * min_dim * sizeof(int));
+    if (!iwork) return -1;
+
+    // 1. Requête de la taille optimale du workspace
+    double work_query;
+    int info = LAPACKE_dgesdd_work(LAPACK_COL_MAJOR, 'S',
+                                   m, n, A, m, S, U, ldu, VT, ldvt,
+                                   &work_query, -1, iwork);
+    if (info != 0) {
+        free(iwork);
+        return info;
+    }
+
+    int lwork = (int)work_query;
+    double *work = (double*)malloc((size_t)lwork * sizeof(double));
+    if (!work) {
+        free(iwork);
+        return -1;
+    }
+
+    // 2. Calcul avec le workspace alloué
+    info = LAPACKE_dgesdd_work(LAPACK_COL_MAJOR, 'S',
+                               m, n, A, m, S, U, ldu, VT, ldvt,
+                               work, lwork, iwork);
+    free(work);
+    free(iwork);
+    return info;
+}
+
+/******************************************************************************
+ * Noyau SVD sur tampon column-major, sans affichage
+ * A (m×n, lda = m) est détruit ; S (min_dim), U (m×min_dim), VT (min_dim×n)
+ * driver: SVDDriver ; si dgesdd échoue (non-convergence, workspace), A est
+ * restauré et recalculé par dgesvd. *driver_used reçoit le pilote retenu.
+ * Retour: 0, -1 (allocation) ou le code info de LAPACK
+ ******************************************************************************/
+int svd_compute_buffers(int m, int n, double *A, double *S,
+                        double *U, int ldu, double *VT, int ldvt,
+                        int driver, int *driver_used) {
+    if (!A || !S || !U || !VT || m < 1 || n < 1) return -1;
+
+    driver = svd_resolve_driver(driver, m, n);
+    if (driver != SVD_DRIVER_GESDD) {
+        if (driver_used) *driver_used = SVD_DRIVER_GESVD;
+        return svd_gesvd_buffers(m, n, A, S, U, ldu, VT, ldvt);
+    }
+
+    // dgesdd détruit A même en cas d'échec : copie pour le repli
+    size_t bytes = (size_t)m * n * sizeof(double);
+    double *backup = (double*)malloc(bytes);
+    if (backup) memcpy(backup, A, bytes);
+
+    int info = svd_gesdd_buffers(m, n, A, S, U, ldu, VT, ldvt);
+    if (driver_used) *driver_used = SVD_DRIVER_GESDD;
+
+    if (info != 0 && backup) {
+        memcpy(A, backup, bytes);
+        info = svd_gesvd_buffers(m, n, A, S, U, ldu, VT, ldvt);
+        if (driver_used) *driver_used = SVD_DRIVER_GESVD;
+    }
+    free(backup);
+    return info;
+}
+
+/******************************************************************************
+ * Calculer la SVD avec LAPACK (pilote svd->driver : dgesvd, dgesdd ou auto)
  * Version compatible avec Kali Linux
  ******************************************************************************/
 int svd_compute(Image *img, SVD *svd) {
@@ -79,67 +203,35 @@ int svd_compute(Image *img, SVD *svd) {
         }
     }
     
-    // 2. Variables pour LAPACK
-    char jobu = 'S';    // Compute min(m,n) columns of U
-    char jobvt = 'S';   // Compute min(m,n) rows of VT
-    int lda = m;
-    int ldu = m;
-    int ldvt = min_dim;
-    
-    // 3. Espace de travail pour LAPACK
-    int lwork = -1;
-    double work_query;
-    int info;
-    
-    // Requête de la taille optimale de work
-    info = LAPACKE_dgesvd_work(LAPACK_COL_MAJOR, jobu, jobvt,
-                               m, n, A, lda,
-                               svd->S,
-                               svd->U, ldu,
-                               svd->VT, ldvt,
-                               &work_query, lwork);
-    
-    if (info != 0) {
-        printf("   [ERREUR LAPACK] dgesvd_work query failed: %d\n", info);
-        free(A);
-        return -1;
-    }
-    
-    // Allouer le workspace optimal
-    lwork = (int)work_query;
-    double *work = (double*)malloc(lwork * sizeof(double));
-    if (!work) {
-        printf("   [ERREUR] Allocation workspace échouée\n");
-        free(A);
-        return -1;
-    }
-    
-    // 4. Calculer la SVD
-    clock_t start = clock();
+    // 2. Calculer la SVD (U: ldu = m, VT: ldvt = min_dim). Temps écoulé
+    //    (horloge monotone) : clock() additionnerait le temps CPU de tous
+    //    les threads BLAS et ne serait pas comparable aux mesures Python
+    struct timespec start, end;
+    clock_gettime(CLOCK_MONOTONIC, &start);
     
-    info = LAPACKE_dgesvd(LAPACK_COL_MAJOR, jobu, jobvt,
-                          m, n, A, lda,
-                          svd->S,
-                          svd->U, ldu,
-                          svd->VT, ldvt);
+    int info = svd_compute_buffers(m, n, A, svd->S, svd->U, m, svd->VT, min_dim,
+                                   svd->driver, &svd->driver_used);
     
-    clock_t end = clock();
-    double elapsed = (double)(end - start) / CLOCKS_PER_SEC;
+    clock_gettime(CLOCK_MONOTONIC, &end);
+    double elapsed = (double)(end.tv_sec - start.tv_sec)
+                   + (double)(end.tv_nsec - start.tv_nsec) * 1e-9;
     
-    // 5. Nettoyer
-    free(work);
     free(A);
     
     if (info != 0) {
-        printf("   [ERREUR LAPACK] dgesvd failed: %d\n", info);
+        printf("   [ERREUR LAPACK] %s failed: %d\n", svd_driver_name(svd->driver_used), info);
         return -1;
     }
     
-    printf("   ✓ SVD calculée en %.3f secondes\n", elapsed);
+    if (svd_resolve_driver(svd->driver, m, n) != svd->driver_used) {
+        printf("   ⚠ dgesdd a échoué : repli sur dgesvd\n");
+    }
+    printf("   ✓ SVD calculée en %.4f secondes (pilote %s)\n",
+           elapsed, svd_driver_name(svd->driver_used));
     printf("   ✓ Plage des valeurs singulières: σ₁=%.2f, σ_%d=%.2f\n", 
            svd->S[0], min_dim, svd->S[min_dim-1]);
     
-    // 6. Vérifier la validité des valeurs singulières
+    // 3. Vérifier la validité des valeurs singulières
     int valid_sv = 0;
     for (int i = 0; i < min_dim; i++) {
         if (svd->S[i] > 0) valid_sv++;
@@ -150,6 +242,65 @@ int svd_compute(Image *img, SVD *svd) {
     return 0;
 }
 
+/******************************************************************************
+ * Reconstruction out = U[:, :k] · diag(S[:k]) · VT[:k, :] écrêtée dans [0, 255]
+ * U et VT column-major, lus en place (ldu, ldvt) ; out en column-major
+ * (ld = m) ou directement en row-major (ld = n, ordre des pixels d'Image) :
+ * dgemm écrit alors Aᵀ transposée, sans tampon ni boucle de conversion
+ ******************************************************************************/
+static int svd_reconstruct_layout(int m, int n, int k,
+                                  const double *U, int ldu, const double *S,
+                                  const double *VT, int ldvt, double *out,
+                                  int row_major) {
+    if (!U || !S || !VT || !out || k < 1) return -1;
+    
+    // 1. US_k = U_k * diag(S_k) : copie et mise à l'échelle colonne par colonne (BLAS)
+    double *US = (double*)malloc((size_t)m * k * sizeof(double));
+    if (!US) return -1;
+    
+    for (int j = 0; j < k; j++) {
+        cblas_dcopy(m, &U[(size_t)j * ldu], 1, &US[(size_t)j * m], 1);
+        cblas_dscal(m, S[j], &US[(size_t)j * m], 1);
+    }
+    
+    // 2. out = US_k * VT_k (BLAS dgemm, VT lu avec son ldvt). En row-major,
+    //    US (m×k, ld m) et VT (k×n, ld ldvt) column-major sont vus comme les
+    //    transposées de matrices row-major : d'où Trans, Trans
+    if (row_major) {
+        cblas_dgemm(CblasRowMajor, CblasTrans, CblasTrans,
+                    m, n, k,
+                    1.0, US, m,
+                    VT, ldvt,
+                    0.0, out, n);
+    } else {
+        cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans,
+                    m, n, k,
+                    1.0, US, m,
+                    VT, ldvt,
+                    0.0, out, m);
+    }
+    free(US);
+    
+    // 3. Écrêter
+    size_t total = (size_t)m * n;
+    for (size_t i = 0; i < total; i++) {
+        if (out[i] < 0.0) out[i] = 0.0;
+        if (out[i] > 255.0) out[i] = 255.0;
+    }
+    return 0;
+}
+
+/******************************************************************************
+ * Noyau de reconstruction sur tampons column-major, sans affichage
+ * out (m×n, ld = m) = U[:, :k] · diag(S[:k]) · VT[:k, :], écrêté dans [0, 255]
+ * U et VT sont lus en place (ldu, ldvt) : aucune extraction des k composantes
+ ******************************************************************************/
+int svd_reconstruct_buffers(int m, int n, int k,
+                            const double *U, int ldu, const double *S,
+                            const double *VT, int ldvt, double *out) {
+    return svd_reconstruct_layout(m, n, k, U, ldu, S, VT, ldvt, out, 0);
+}
+
 /******************************************************************************
  * Reconstruction SVD avec BLAS pour l'optimisation
  ******************************************************************************/
@@ -171,69 +322,16 @@ Image* svd_compress(SVD *svd, int k) {
     Image *result = image_create(n, m);
     if (!result) return NULL;
     
-    // 1. Allouer les matrices temporaires
-    double *U_k = (double*)malloc(m * k * sizeof(double));
-    double *VT_k = (double*)malloc(k * n * sizeof(double));
-    double *S_k = (double*)malloc(k * sizeof(double));
-    double *temp = (double*)calloc(m * n, sizeof(double));
-    
-    if (!U_k || !VT_k || !S_k || !temp) {
+    // 1. Reconstruction A_k = U_k * diag(S_k) * VT_k, écrite directement en
+    //    row-major dans l'image (déjà écrêtée)
+    if (svd_reconstruct_layout(m, n, k, svd->U, m, svd->S,
+                               svd->VT, svd->min_dim, result->data, 1) != 0) {
         printf("   [ERREUR] Allocation temporaire échouée\n");
-        if (U_k) free(U_k);
-        if (VT_k) free(VT_k);
-        if (S_k) free(S_k);
-        if (temp) free(temp);
         image_free(result);
         return NULL;
     }
     
-    // 2. Extraire les k premières composantes
-    for (int i = 0; i < m; i++) {
-        for (int j = 0; j < k; j++) {
-            U_k[i + j * m] = svd->U[i + j * m];
-        }
-    }
-    
-    for (int i = 0; i < k; i++) {
-        S_k[i] = svd->S[i];
-        for (int j = 0; j < n; j++) {
-            VT_k[i + j * k] = svd->VT[i + j * svd->min_dim];
-        }
-    }
-    
-    // 3. Reconstruction: A_k = U_k * diag(S_k) * VT_k
-    // Étape 1: temp = diag(S_k) * VT_k
-    for (int i = 0; i < k; i++) {
-        double sigma = S_k[i];
-        cblas_dscal(n, sigma, &VT_k[i], k);  // BLAS: scale rows of VT_k by sigma
-    }
-    
-    // Étape 2: result = U_k * temp (avec BLAS dgemm)
-    // Note: column-major: U_k (m×k) * temp (k×n) = résultat (m×n)
-    double alpha = 1.0;
-    double beta = 0.0;
-    cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans,
-                m, n, k,
-                alpha,
-                U_k, m,
-                VT_k, k,
-                beta,
-                temp, m);
-    
-    // 4. Convertir de column-major à row-major pour l'image
-    for (int i = 0; i < m; i++) {
-        for (int j = 0; j < n; j++) {
-            double val = temp[j * m + i];  // Column-major to row-major
-            
-            // Normaliser et clamper
-            if (val < 0.0) val = 0.0;
-            if (val > 255.0) val = 255.0;
-            
-            result->data[i * n + j] = val;
-        }
-    }
-    
-    // 5. Calculer les statistiques
+    // 2. Calculer les statistiques
     double min_val = result->data[0];
     double max_val = result->data[0];
     double sum = 0.0;
@@ -249,52 +347,29 @@ Image* svd_compress(SVD *svd, int k) {
            min_val, max_val, sum / (m * n));
     printf("   ✓ Image compressée générée (k=%d)\n", k);
     
-    // 6. Nettoyer
-    free(U_k);
-    free(VT_k);
-    free(S_k);
-    free(temp);
-    
     result->max_value = 255;
     return result;
 }
 
 /******************************************************************************
- * Calculer le PSNR (Peak Signal-to-Noise Ratio)
+ * PSNR entre deux tampons de même taille (ordre indifférent), sans affichage
  ******************************************************************************/
-double svd_compute_psnr(Image *original, Image *compressed) {
-    if (!original || !compressed) return 0.0;
-    if (original->width != compressed->width || 
-        original->height != compressed->height) return 0.0;
-    
-    int m = original->height;
-    int n = original->width;
-    int total = m * n;
-    
-    if (total == 0) return 0.0;
+double svd_psnr_buffers(int total, const double *a, const double *b) {
+    if (!a || !b || total <= 0) return 0.0;
     
     double mse = 0.0;
     
     // Utiliser BLAS si disponible pour les grandes images
-    if (total > 10000) {
-        double *diff = (double*)malloc(total * sizeof(double));
-        if (diff) {
-            memcpy(diff, original->data, total * sizeof(double));
-            cblas_daxpy(total, -1.0, compressed->data, 1, diff, 1);
-            mse = cblas_ddot(total, diff, 1, diff, 1) / total;
-            free(diff);
-        } else {
-            // Fallback manuel
-            for (int i = 0; i < total; i++) {
-                double d = original->data[i] - compressed->data[i];
-                mse += d * d;
-            }
-            mse /= total;
-        }
+    double *diff = (total > 10000) ? (double*)malloc((size_t)total * sizeof(double)) : NULL;
+    if (diff) {
+        memcpy(diff, a, (size_t)total * sizeof(double));
+        cblas_daxpy(total, -1.0, b, 1, diff, 1);
+        mse = cblas_ddot(total, diff, 1, diff, 1) / total;
+        free(diff);
     } else {
-        // Calcul manuel pour les petites images
+        // Calcul manuel (petites images ou allocation échouée)
         for (int i = 0; i < total; i++) {
-            double d = original->data[i] - compressed->data[i];
+            double d = a[i] - b[i];
             mse += d * d;
         }
         mse /= total;
@@ -305,6 +380,18 @@ double svd_compute_psnr(Image *original, Image *compressed) {
     return 10.0 * log10(255.0 * 255.0 / mse);
 }
 
+/******************************************************************************
+ * Calculer le PSNR (Peak Signal-to-Noise Ratio)
+ ******************************************************************************/
+double svd_compute_psnr(Image *original, Image *compressed) {
+    if (!original || !compressed) return 0.0;
+    if (original->width != compressed->width || 
+        original->height != compressed->height) return 0.0;
+    
+    return svd_psnr_buffers(original->height * original->width,
+                            original->data, compressed->data);
+}
+
 /******************************************************************************
  * Calculer le taux de compression
  ******************************************************************************/
@@ -4,6 +4,16 @@
 #include "image_io.h"
 #include <math.h>
 
+// Pilotes LAPACK de la SVD
+typedef enum {
+    SVD_DRIVER_GESVD = 0,   // dgesvd : QR implicite (référence)
+    SVD_DRIVER_GESDD = 1,   // dgesdd : diviser pour régner (plus rapide)
+    SVD_DRIVER_AUTO  = 2    // dgesdd si min(m, n) ≥ SVD_GESDD_MIN_DIM, sinon dgesvd
+} SVDDriver;
+
+// En dessous, dgesdd n'apporte rien (il délègue lui-même au QR sous ~25)
+#define SVD_GESDD_MIN_DIM 64
+
 // Structure pour stocker une décomposition SVD
 typedef struct {
     int m;              // Nombre de lignes (hauteur)
@@ -13,6 +23,8 @@ typedef struct {
     double *S;          // Vecteur des valeurs singulières (min_dim)
     double *VT;         // Matrice V^T (min_dim × n) - économie de mémoire
     int computed;       // Flag: SVD calculé ou non
+    int driver;         // Pilote demandé (SVDDriver, SVD_DRIVER_AUTO par défaut)
+    int driver_used;    // Pilote effectivement utilisé (après repli éventuel)
 } SVD;
 
 // Prototypes des fonctions
@@ -24,5 +36,16 @@ double svd_compute_psnr(Image *original, Image *compressed);
 double svd_compression_ratio(int m, int n, int k);
 double svd_energy_retained(SVD *svd, int k);
 void svd_export_singular_values(SVD *svd, const char *filename);
+const char* svd_driver_name(int driver);
+int svd_parse_driver(const char *name);
+
+// Noyaux sur tampons column-major, sans affichage (liaison Python: svd_clib.py)
+int svd_compute_buffers(int m, int n, double *A, double *S,
+                        double *U, int ldu, double *VT, int ldvt,
+                        int driver, int *driver_used);
+int svd_reconstruct_buffers(int m, int n, int k,
+                            const double *U, int ldu, const double *S,
+                            const double *VT, int ldvt, double *out);
+double svd_psnr_buffers(int total, const double *a, const double *b);
 
 #endif // SVD_COMPRESS_H
\ No newline at end of file
@@ -1,11 +1,19 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
 import time
 import os
 from pathlib import Path
 from PIL import Image
-import cv2
+
+from svd_engines import DRIVERS, ENGINES, PRECISIONS, as_precision
+from svd_cache import DEFAULT_CACHE_DIR, cached_svd
+from svd_metrics import clip_correction, mean_squared_error, rate_distortion_curve, select_rank
+from svd_sweep import rank_sweep
+from svd_codec import QUANTS, decode_image, save_svdz
+from svd_blocks import compress_blocks
+from svd_color import COLOR_MODES, compress_color, load_color_image, print_color_report
+from svd_imageio import describe_load, load_gray
+from svd_pnm import write_pnm
+from svd_memstats import count_alloc, count_copy, enable, print_report, reset, stage
 
 
 def print_header():
@@ -21,6 +29,7 @@ def print_header():
 def generate_test_image(width=256, height=256):
     """
     Générer une image de test synthétique avec cercles concentriques et dégradé
+    (calcul vectorisé : svd_testimages.rings_image)
     
     Args:
         width: Largeur de l'image
@@ -29,35 +38,19 @@ def generate_test_image(width=256, height=256):
     Returns:
         numpy.ndarray: Image (height, width) en niveaux de gris [0-255]
     """
-    img = np.zeros((height, width))
-    cx = width / 2
-    cy = height / 2
-    max_dist = np.sqrt(cx**2 + cy**2)
-    
-    for y in range(height):
-        for x in range(width):
-            dx = x - cx
-            dy = y - cy
-            dist = np.sqrt(dx**2 + dy**2)
-            
-            # Motif: cercles + dégradé
-            value = 128 + 127 * np.sin(dist / max_dist * 10 * np.pi)
-            value += (x / width) * 50
-            
-            img[y, x] = value
-    
-    # Normaliser dans [0, 255]
-    img = (img - img.min()) / (img.max() - img.min()) * 255
-    
-    return img
+    from svd_testimages import rings_image
+    return rings_image(height, width)
 
 
-def load_image(filepath=None):
+def load_image(filepath=None, precision='float64', max_size=None, engine=None):
     """
     Charger une image depuis un fichier ou générer une image de test
     
     Args:
         filepath: Chemin vers l'image (None pour générer une image de test)
+        precision: Type flottant de l'image retournée ('float64' ou 'float32')
+        max_size: Côté maximal (None: pleine résolution ; JPEG réduit au décodage)
+        engine: Moteur SVD visé, qui fixe l'ordre mémoire du tableau
     
     Returns:
         numpy.ndarray: Image en niveaux de gris [0-255]
@@ -76,18 +69,11 @@ def load_image(filepath=None):
         
     if filepath and os.path.exists(filepath):
         try:
-            # Charger l'image avec PIL
-            img_pil = Image.open(filepath)
-            
-            # Convertir en niveaux de gris si nécessaire
-            if img_pil.mode == 'RGB' or img_pil.mode == 'RGBA':
-                img_pil = img_pil.convert('L')
-                print(f'   ✓ Image couleur convertie en niveaux de gris')
+            # Décodage direct en niveaux de gris, dans le type et l'ordre du moteur
+            img, load_info = load_gray(filepath, max_size, PRECISIONS[precision], engine)
             
-            # Convertir en tableau numpy
-            img = np.array(img_pil, dtype=np.float64)
-            
-            print(f'   ✓ Image chargée: {img.shape[0]}×{img.shape[1]} pixels\n')
+            print(f'   ✓ Image chargée: {img.shape[0]}×{img.shape[1]} pixels')
+            print(f'   ✓ Chargement: {describe_load(load_info)}\n')
             
             return img
             
@@ -100,33 +86,41 @@ def load_image(filepath=None):
     img = generate_test_image(256, 256)
     print('   ✓ Image générée: 256×256 pixels\n')
     
-    return img
+    return as_precision(img, precision)
 
 
-def compress_svd(U, S, V, k):
+def compress_svd(U, S, V, k, out=None, us=None):
     """
     Compresser l'image en gardant k valeurs singulières
     
     Args:
-        U: Matrice U de la SVD (m×m)
-        S: Vecteur des valeurs singulières (min(m,n))
-        V: Matrice V de la SVD (n×n)
+        U: Matrice U de la SVD (m×r)
+        S: Vecteur des valeurs singulières (r)
+        V: Matrice V^T de la SVD (r×n), telle que retournée par NumPy
         k: Nombre de valeurs singulières à conserver
+        out: Tampon (m×n) flottant recevant l'image (None: alloué)
+        us: Tampon (m×k' avec k' ≥ k) pour U_k·diag(S_k), de préférence en
+            ordre Fortran (None: alloué)
     
     Returns:
-        numpy.ndarray: Image compressée
+        numpy.ndarray: Image compressée (out)
     """
-    # Créer Sigma_k (matrice diagonale tronquée)
-    S_k = np.zeros((U.shape[0], V.shape[0]))
-    S_k[:k, :k] = np.diag(S[:k])
-    
-    # Reconstruction: A_k = U @ S_k @ V^T
-    img_compressed = U @ S_k @ V.T
-    
-    # Normaliser dans [0, 255]
-    img_compressed = np.clip(img_compressed, 0, 255)
-    
-    return img_compressed
+    m, n = U.shape[0], V.shape[1]
+    dtype = np.result_type(U, S, V)
+    if us is None:
+        us = np.empty((m, k), dtype=dtype, order='F')
+        count_alloc(us)
+    if out is None:
+        out = np.empty((m, n), dtype=dtype)
+        count_alloc(out)
+    
+    # Reconstruction: A_k = U_k @ diag(S_k) @ V_k^T (diag appliquée aux colonnes de U_k),
+    # puis écrêtage dans [0, 255], sans autre tableau que us et out
+    np.multiply(U[:, :k], S[:k], out=us[:, :k])
+    np.matmul(us[:, :k], V[:k, :], out=out)
+    np.clip(out, 0, 255, out=out)
+    
+    return out
 
 
 def compute_psnr(original, compressed):
@@ -140,7 +134,7 @@ def compute_psnr(original, compressed):
     Returns:
         float: PSNR en dB
     """
-    mse = np.mean((original - compressed) ** 2)
+    mse = mean_squared_error(original, compressed)
     
     if mse < 1e-10:
         return 100.0
@@ -168,47 +162,131 @@ def compression_ratio(m, n, k):
     return original_size / compressed_size
 
 
-def energy_retained(singular_values, k):
+def energy_retained(singular_values, k, total_energy=None):
     """
     Calculer le pourcentage d'énergie conservée
     
     Args:
         singular_values: Vecteur des valeurs singulières
         k: Nombre de valeurs conservées
+        total_energy: ||A||_F² si le spectre est tronqué (None: somme de σᵢ²)
     
     Returns:
         float: Pourcentage d'énergie [0-100]
     """
-    total_energy = np.sum(singular_values ** 2)
+    if total_energy is None:
+        total_energy = np.sum(singular_values ** 2)
     retained_energy = np.sum(singular_values[:k] ** 2)
     return (retained_energy / total_energy) * 100
 
 
-def svd_compress_python(filepath=None):
+def quality_label(psnr_val):
+    """
+    Qualité perçue associée à un PSNR
+    
+    Args:
+        psnr_val: PSNR en dB
+    
+    Returns:
+        str: Libellé de qualité
+    """
+    if psnr_val < 25:
+        return 'Faible'
+    elif psnr_val < 30:
+        return 'Acceptable'
+    elif psnr_val < 35:
+        return 'Bonne'
+    elif psnr_val < 40:
+        return 'Très bonne'
+    return 'Excellente'
+
+
+def svd_compress_python(filepath=None, engine='exact', exact_psnr=True,
+                        target_psnr=None, target_energy=None, max_bytes=None, svdz=None,
+                        block=None, block_psnr=35.0, workers=None,
+                        color=None, color_ranks=None, precision='float64',
+                        cache_dir=DEFAULT_CACHE_DIR, driver='auto', plots=True, max_size=None,
+                        image_format='png', mem_debug=False):
     """
     Fonction principale de compression d'images par SVD
     
     Args:
         filepath: Chemin vers l'image (optionnel)
+        engine: Moteur SVD (voir svd_engines.ENGINES, 'auto' compris)
+        exact_psnr: Corriger le PSNR de l'écrêtage [0, 255] sur les images
+                    rendues (False: PSNR en forme close, non écrêté)
+        target_psnr: PSNR minimal visé (dB) → plus petit k correspondant
+        target_energy: Énergie minimale visée (%) → plus petit k correspondant
+        max_bytes: Budget des facteurs en octets (double) → meilleur k
+        svdz: Quantification 'int8'/'float16' pour écrire des fichiers .svdz
+              (le ratio rapporté devient alors le vrai ratio en octets)
+        block: Taille des tuiles pour le mode blocs (None: désactivé)
+        block_psnr: PSNR visé par tuile en mode blocs (dB)
+        workers: Processus utilisés pour les lots de tuiles
+        color: 'rgb' ou 'ycbcr' pour compresser les canaux couleur en une
+               SVD batchée (None: niveaux de gris)
+        color_ranks: Rang commun ou un rang par canal en mode couleur
+                     (None: déduit de target_psnr)
+        precision: 'float64' ou 'float32' pour toute la chaîne (chargement,
+                   SVD, reconstruction, métriques)
+        cache_dir: Cache disque des facteurs SVD (None: toujours recalculer)
+        driver: Pilote LAPACK de la SVD complète ('auto', 'gesdd', 'gesvd')
+        plots: Générer les graphiques (False: matplotlib n'est jamais importé)
+        max_size: Côté maximal de l'image chargée (None: pleine résolution)
+        image_format: 'png' ou 'pgm' (P5 lisible par l'exécutable C) pour
+                      les reconstructions
+        mem_debug: Afficher les octets alloués/copiés par étape (svd_memstats)
     """
     print_header()
+    if mem_debug:
+        enable()
+        reset()
+    
+    # Mode couleur : canaux empilés (C, m, n), une seule SVD batchée
+    if color:
+        if not filepath or not os.path.exists(filepath):
+            raise ValueError('Le mode couleur nécessite un fichier image existant')
+        print(f'ÉTAPE UNIQUE: COMPRESSION COULEUR ({color.upper()})')
+        print('═══════════════════════════════════\n')
+        rgb = load_color_image(filepath)
+        print(f'   ✓ Image chargée: {rgb.shape[1]}×{rgb.shape[2]} pixels, {rgb.shape[0]} canaux\n')
+        result = compress_color(rgb, ranks=color_ranks, mode=color, target_psnr=target_psnr)
+        print_color_report(result, color)
+        output_dir = Path('python_output')
+        output_dir.mkdir(exist_ok=True)
+        Image.fromarray(result['image']).save(output_dir / f'python_color_{color}.png')
+        print(f'   ✓ Image sauvegardée: {output_dir}/python_color_{color}.png\n')
+        return
     
     # 1. Charger l'image
-    img = load_image(filepath)
+    with stage('chargement'):
+        img = load_image(filepath, precision, max_size, engine)
     height, width = img.shape
     
+    # Adapter k_values à la taille de l'image
+    min_dim = min(height, width)
+    k_values = [5, 10, 25, 50, 75, 100, 150, 200]
+    k_values = [k for k in k_values if k <= min_dim]
+    
     # 2. Calculer la SVD
     print('ÉTAPE 2/4: DÉCOMPOSITION SVD')
     print('═══════════════════════════════════\n')
     
-    print('   Calcul de la SVD...')
+    print(f'   Calcul de la SVD (moteur: {engine}, {precision})...')
     t_start = time.time()
-    U, S, V = np.linalg.svd(img, full_matrices=True)
+    with stage('svd'):
+        U, S, V, svd_info = cached_svd(img, k=max(k_values), engine=engine, precision=precision,
+                                       cache_dir=cache_dir, driver=driver)
     elapsed_svd = time.time() - t_start
     
     singular_values = S  # NumPy retourne directement le vecteur S
+    total_energy = svd_info['frob2']
     
-    print(f'   ✓ SVD calculée en {elapsed_svd:.4f} secondes')
+    print(f'   ✓ SVD calculée en {elapsed_svd:.4f} secondes ({len(S)} triplets'
+          f'{", pilote " + svd_info["driver"] if svd_info.get("driver") else ""}'
+          f'{", relue du cache" if svd_info["cached"] else ""})')
+    print(f'   ✓ Erreur de troncature: ||A - A_k||_F = {svd_info["residual"]:.3e} '
+          f'(relative {svd_info["rel_error"]:.3e})')
     print(f'   ✓ σ₁ = {singular_values[0]:.2f} (plus grande)')
     if len(singular_values) >= 10:
         print(f'   ✓ σ₁₀ = {singular_values[9]:.2f}')
@@ -216,15 +294,26 @@ def svd_compress_python(filepath=None):
         print(f'   ✓ σ₅₀ = {singular_values[49]:.2f}')
     print()
     
+    # PSNR/énergie/ratio de tous les k en forme close (Eckart–Young)
+    curve = rate_distortion_curve(S, height, width, total_energy)
+    
+    # Rang cible : forme close, bissection sur images écrêtées si nécessaire
+    if target_psnr is not None or target_energy is not None or max_bytes is not None:
+        clip_args = dict(original=img, U=U, VT=V) if exact_psnr else {}
+        k_target = select_rank(S, height, width, total_energy, psnr=target_psnr,
+                               energy=target_energy, max_bytes=max_bytes,
+                               bytes_per_value=img.itemsize, **clip_args)
+        if k_target is None:
+            print(f'   ⚠ Objectif inatteignable avec les {len(S)} triplets calculés\n')
+        else:
+            print(f'   ✓ Rang cible sélectionné: k = {k_target}\n')
+            if k_target not in k_values:
+                k_values = sorted(k_values + [k_target])
+    
     # 3. Compression avec différentes valeurs de k
     print('ÉTAPE 3/4: COMPRESSION AVEC DIFFÉRENTES VALEURS DE k')
     print('═══════════════════════════════════════════════════════\n')
     
-    # Adapter k_values à la taille de l'image
-    min_dim = min(height, width)
-    k_values = [5, 10, 25, 50, 75, 100, 150, 200]
-    k_values = [k for k in k_values if k <= min_dim]
-    
     print('┌─────┬──────────┬───────────────┬──────────────┬──────────────┐')
     print('│  k  │   PSNR   │  Compression  │   Énergie    │   Qualité    │')
     print('│     │   (dB)   │     Ratio     │   Conservée  │              │')
@@ -232,46 +321,73 @@ def svd_compress_python(filepath=None):
     
     results = []
     compressed_images = {}
+    svdz_files = []
     
     # Créer le dossier de sortie
     output_dir = Path('python_output')
     output_dir.mkdir(exist_ok=True)
     
-    for k in k_values:
-        # Compression
-        t_start = time.time()
-        img_compressed = compress_svd(U, S, V, k)
-        time_compress = time.time() - t_start
+    # Compression incrémentale : chaque k n'ajoute que le bloc de rang manquant
+    t_start = time.time()
+    with stage('reconstruction'):
+        for k, img_compressed, frame in rank_sweep(U, S, V, k_values):
+            time_compress = time.time() - t_start
         
-        # Métriques
-        psnr_val = compute_psnr(img, img_compressed)
-        ratio = compression_ratio(height, width, k)
-        energy = energy_retained(singular_values, k)
+            # Métriques (correction exacte de l'écrêtage seulement pour ce k rendu)
+            if exact_psnr:
+                clip_correction(curve, img, {k: img_compressed})
+            psnr_val = curve['psnr'][k - 1]
+            ratio = curve['ratio'][k - 1]
+            energy = curve['energy'][k - 1]
         
-        # Qualité
-        if psnr_val < 25:
-            quality = 'Faible'
-        elif psnr_val < 30:
-            quality = 'Acceptable'
-        elif psnr_val < 35:
-            quality = 'Bonne'
-        elif psnr_val < 40:
-            quality = 'Très bonne'
-        else:
-            quality = 'Excellente'
+            # Fichier .svdz réel : ratio en octets par rapport à l'image 8 bits
+            if svdz:
+                path = output_dir / f'python_compressed_k{k:03d}.svdz'
+                nbytes = save_svdz(path, U, S, V, k, quant=svdz)
+                ratio = img.size / nbytes
+                svdz_files.append((k, nbytes, compute_psnr(img, decode_image(path.read_bytes()))))
+        
+            # Qualité
+            quality = quality_label(psnr_val)
+        
+            print(f'│{k:4d} │ {psnr_val:7.2f}  │    {ratio:5.1f}:1    │   {energy:6.2f}%   │ {quality:<12s} │')
         
-        print(f'│{k:4d} │ {psnr_val:7.2f}  │    {ratio:5.1f}:1    │   {energy:6.2f}%   │ {quality:<12s} │')
+            # Stocker résultats
+            results.append([k, psnr_val, ratio, energy, time_compress])
+            if plots:
+                compressed_images[k] = img_compressed.copy()   # tampon réutilisé au k suivant
+                count_copy(img_compressed)
         
-        # Stocker résultats
-        results.append([k, psnr_val, ratio, energy, time_compress])
-        compressed_images[k] = img_compressed
+            # Sauvegarder image compressée
+            filename = output_dir / f'python_compressed_k{k:03d}.{image_format}'
+            if image_format == 'pgm':
+                write_pnm(filename, frame)
+            else:
+                Image.fromarray(frame).save(filename)
         
-        # Sauvegarder image compressée
-        filename = output_dir / f'python_compressed_k{k:03d}.png'
-        Image.fromarray(img_compressed.astype(np.uint8)).save(filename)
+            t_start = time.time()
     
     print('└─────┴──────────┴───────────────┴──────────────┴──────────────┘\n')
     
+    # Mode blocs : tuiles block×block, rang adaptatif par tuile, même rapport
+    if block:
+        t_start = time.time()
+        blk = compress_blocks(img, block=block, target_psnr=block_psnr, workers=workers)
+        time_block = time.time() - t_start
+        print(f'   Mode blocs {block}×{block} (objectif {block_psnr:.1f} dB/tuile, '
+              f'rang moyen {blk["mean_rank"]:.1f}, {time_block:.3f} s):')
+        print(f'   PSNR {blk["psnr"]:.2f} dB │ ratio {blk["ratio"]:.1f}:1 │ '
+              f'énergie {blk["energy"]:.2f}% │ {quality_label(blk["psnr"])}\n')
+        Image.fromarray(blk['image'].astype(np.uint8)).save(
+            output_dir / f'python_blocks_b{block:03d}.png')
+    
+    if svdz_files:
+        print(f'   Fichiers .svdz ({svdz}) — {img.size} octets bruts:')
+        for k, nbytes, psnr_q in svdz_files:
+            print(f'   • k={k:3d}: {nbytes:8d} octets, ratio {img.size / nbytes:6.2f}:1, '
+                  f'PSNR décodé {psnr_q:6.2f} dB')
+        print()
+    
     # Convertir results en numpy array
     results = np.array(results)
     
@@ -295,10 +411,12 @@ def svd_compress_python(filepath=None):
     print()
     
     # 5. Visualisation
-    print('ÉTAPE 5: GÉNÉRATION DES GRAPHIQUES')
-    print('═══════════════════════════════════\n')
-    
-    generate_visualizations(img, compressed_images, k_values, singular_values, results, output_dir)
+    if plots:
+        print('ÉTAPE 5: GÉNÉRATION DES GRAPHIQUES')
+        print('═══════════════════════════════════\n')
+        
+        generate_visualizations(img, compressed_images, k_values, singular_values, results,
+                                output_dir, total_energy)
     
     # 6. Sauvegarder les résultats
     np.savetxt(output_dir / 'python_results.csv', results, 
@@ -313,9 +431,15 @@ def svd_compress_python(filepath=None):
     
     print(f'Temps total SVD: {elapsed_svd:.4f} secondes')
     print(f'Images compressées sauvegardées dans: {output_dir}/\n')
+    
+    if mem_debug:
+        print('Mémoire par étape (alloué/copié déclarés, pic mesuré par tracemalloc):')
+        print_report()
+        print()
 
 
-def generate_visualizations(img, compressed_images, k_values, singular_values, results, output_dir):
+def generate_visualizations(img, compressed_images, k_values, singular_values, results, output_dir,
+                            total_energy=None):
     """
     Générer les graphiques de visualisation
     
@@ -326,7 +450,12 @@ def generate_visualizations(img, compressed_images, k_values, singular_values, r
         singular_values: Vecteur des valeurs singulières
         results: Tableau numpy des résultats (k, psnr, ratio, energy, time)
         output_dir: Dossier de sortie
+        total_energy: ||A||_F² (None: somme de σᵢ²)
     """
+    import matplotlib.pyplot as plt     # chargé seulement si des graphiques sont demandés
+    
+    if total_energy is None:
+        total_energy = np.sum(singular_values**2)
     
     # Figure 1: Images comparatives
     fig = plt.figure(figsize=(14, 8))
@@ -342,7 +471,7 @@ def generate_visualizations(img, compressed_images, k_values, singular_values, r
     # Images compressées
     for i, k in enumerate(k_values[:7], start=2):
         img_comp = compressed_images[k]
-        psnr_val = compute_psnr(img, img_comp)
+        psnr_val = results[i - 2, 1]
         
         plt.subplot(2, 4, i)
         plt.imshow(img_comp, cmap='gray', vmin=0, vmax=255)
@@ -366,7 +495,7 @@ def generate_visualizations(img, compressed_images, k_values, singular_values, r
     
     # Sous-graphique 2: Énergie cumulée
     plt.subplot(1, 2, 2)
-    cumulative = np.cumsum(singular_values**2) / np.sum(singular_values**2) * 100
+    cumulative = np.cumsum(singular_values**2) / total_energy * 100
     plt.plot(range(1, len(cumulative)+1), cumulative, 'r-', linewidth=2)
     plt.axhline(y=50, color='k', linestyle='--', alpha=0.5, label='50%')
     plt.axhline(y=90, color='k', linestyle='--', alpha=0.5, label='90%')
@@ -414,11 +543,53 @@ if __name__ == '__main__':
     Utilisation:
         python svd_compress_python.py                    # Mode interactif
         python svd_compress_python.py /path/to/image.jpg # Avec fichier
+        python svd_compress_python.py image.jpg --engine randomized
     """
-    import sys
+    import argparse
     
     # Récupérer le chemin de l'image depuis les arguments
-    filepath = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = argparse.ArgumentParser(description='Compression d\'images par SVD (Python)')
+    parser.add_argument('filepath', nargs='?', default=None, help='image à compresser')
+    parser.add_argument('--engine', choices=ENGINES, default='exact',
+                        help='moteur SVD (randomized: seuls les max(k) premiers triplets)')
+    parser.add_argument('--fast-psnr', action='store_true',
+                        help='PSNR en forme close, sans correction de l\'écrêtage')
+    parser.add_argument('--target-psnr', type=float, help='plus petit k avec PSNR ≥ cible (dB)')
+    parser.add_argument('--target-energy', type=float, help='plus petit k avec énergie ≥ cible (%%)')
+    parser.add_argument('--max-bytes', type=int,
+                        help='meilleur k sous ce budget (octets, facteurs dans la précision de calcul)')
+    parser.add_argument('--svdz', choices=QUANTS,
+                        help='écrire des fichiers .svdz et rapporter le vrai ratio en octets')
+    parser.add_argument('--block', type=int, help='mode blocs: taille des tuiles (ex. 64)')
+    parser.add_argument('--block-psnr', type=float, default=35.0, help='PSNR visé par tuile (dB)')
+    parser.add_argument('--workers', type=int, help='processus pour les lots de tuiles')
+    parser.add_argument('--color', choices=COLOR_MODES, help='mode couleur (SVD batchée des canaux)')
+    parser.add_argument('--color-ranks', type=int, nargs='+', help='rang commun ou un rang par canal')
+    parser.add_argument('--precision', choices=tuple(PRECISIONS), default='float64',
+                        help='précision de calcul de toute la chaîne (float32: mémoire / 2)')
+    parser.add_argument('--driver', choices=DRIVERS, default='auto',
+                        help='pilote LAPACK de la SVD complète (gesdd: diviser pour régner)')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='pas de graphiques (démarrage rapide, matplotlib non chargé)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='cache disque des facteurs SVD')
+    parser.add_argument('--no-cache', action='store_true', help='toujours recalculer la SVD')
+    parser.add_argument('--format', choices=('png', 'pgm'), default='png',
+                        help='format des reconstructions (pgm: échange avec le programme C)')
+    parser.add_argument('--mem-debug', action='store_true',
+                        help='octets alloués, copiés et pic mémoire par étape')
+    parser.add_argument('--max-size', type=int,
+                        help='côté maximal (réduction au décodage JPEG, défaut: pleine résolution)')
+    args = parser.parse_args()
+    color_ranks = args.color_ranks
+    if color_ranks and len(color_ranks) == 1:
+        color_ranks = color_ranks[0]
     
     # Lancer la compression
-    svd_compress_python(filepath)
+    svd_compress_python(args.filepath, engine=args.engine, exact_psnr=not args.fast_psnr,
+                        target_psnr=args.target_psnr, target_energy=args.target_energy,
+                        max_bytes=args.max_bytes, svdz=args.svdz,
+                        block=args.block, block_psnr=args.block_psnr, workers=args.workers,
+                        color=args.color, color_ranks=color_ranks, precision=args.precision,
+                        cache_dir=None if args.no_cache else args.cache_dir, driver=args.driver,
+                        plots=not args.no_plots, max_size=args.max_size,
+                        image_format=args.format, mem_debug=args.mem_debug)
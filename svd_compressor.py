@@ -0,0 +1,212 @@
+"""
+COMPRESSEUR SVD À ÉTAT - une factorisation, autant de k que nécessaire
+
+    comp = SVDCompressor(A)          # rien n'est calculé ici
+    comp.metrics(50)                 # factorisation au premier besoin
+    img = comp.reconstruct(50)       # GEMM de rang 50 seulement
+    data = comp.encode(50)           # fichier .svdz
+
+Les facteurs, la somme cumulée de S² et ||A||_F² sont calculés une fois
+(sous verrou) puis partagés en lecture seule. Chaque thread a ses propres
+tampons de travail (threading.local), réutilisés d'un appel à l'autre :
+plusieurs threads peuvent reconstruire en parallèle sur le même objet.
+Le tampon U·diag(S) est en ordre Fortran (U[:, :k] mis à l'échelle dans
+des colonnes contiguës) ; reconstruct() écrit le GEMM et l'écrêtage
+directement dans la sortie quand elle est flottante.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import threading
+
+import numpy as np
+
+from svd_cache import cached_svd
+from svd_codec import encode
+from svd_memstats import count_alloc
+from svd_metrics import MAX_VAL, mean_squared_error, psnr_from_mse, rate_distortion_curve, select_rank
+
+
+class SVDCompressor:
+    """
+    Factorisation SVD paresseuse d'une image et services par rang k
+
+    Args:
+        image: Image (m×n), valeurs dans [0, 255]
+        k_max: Nombre de triplets utiles (obligatoire pour 'randomized', 'lanczos', 'gram')
+        engine: Moteur SVD (voir svd_engines.ENGINES, 'auto' compris)
+        precision: 'float64' ou 'float32' (None: type de l'image)
+        cache_dir: Cache disque des facteurs (None: pas de cache)
+        **options: Options du moteur (oversampling, power_iters, seed)
+    """
+
+    __slots__ = ('image', 'shape', 'k_max', 'engine', 'precision', 'cache_dir', 'options',
+                 '_U', '_S', '_VT', '_info', '_cumulative', '_frob2', '_curve',
+                 '_lock', '_local')
+
+    def __init__(self, image, k_max=None, engine='exact', precision=None, cache_dir=None,
+                 **options):
+        self.image = image
+        self.shape = image.shape
+        self.k_max = k_max
+        self.engine = engine
+        self.precision = precision
+        self.cache_dir = cache_dir
+        self.options = options
+        self._U = self._S = self._VT = self._info = None
+        self._cumulative = self._frob2 = self._curve = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __repr__(self):
+        state = f"rang {len(self._S)}" if self._S is not None else "non factorisé"
+        return f"SVDCompressor({self.shape[0]}×{self.shape[1]}, {self.engine}, {state})"
+
+    # ── factorisation paresseuse
+    def _factorize(self):
+        with self._lock:
+            if self._S is not None:       # un autre thread l'a fait entre-temps
+                return
+            U, S, VT, info = cached_svd(self.image, k=self.k_max, engine=self.engine,
+                                        precision=self.precision, cache_dir=self.cache_dir,
+                                        **self.options)
+            self._cumulative = np.cumsum(np.asarray(S, dtype=np.float64) ** 2)
+            self._frob2 = info['frob2']
+            self._U, self._VT, self._info = U, VT, info
+            self._S = S                   # publié en dernier : sert de drapeau
+
+    @property
+    def factors(self):
+        """(U, S, VT), calculés au premier accès"""
+        if self._S is None:
+            self._factorize()
+        return self._U, self._S, self._VT
+
+    @property
+    def info(self):
+        """Informations du moteur (voir svd_engines.compute_svd)"""
+        if self._S is None:
+            self._factorize()
+        return self._info
+
+    @property
+    def rank(self):
+        """Nombre de triplets disponibles"""
+        return len(self.factors[1])
+
+    def _check_rank(self, k):
+        if not 1 <= k <= self.rank:
+            raise ValueError(f"k doit être compris entre 1 et {self.rank} (reçu {k})")
+
+    def _dtype(self):
+        U, S, VT = self.factors
+        return np.result_type(U, S, VT)
+
+    def _workspace(self, name, shape, order='C'):
+        """Tampon nommé propre au thread appelant, alloué au premier usage"""
+        buf = getattr(self._local, name, None)
+        if buf is None:
+            buf = np.empty(shape, dtype=self._dtype(), order=order)
+            count_alloc(buf)
+            setattr(self._local, name, buf)
+        return buf
+
+    # ── services
+    def reconstruct(self, k, out=None):
+        """
+        Reconstruction de rang k écrêtée dans [0, 255]
+
+        Args:
+            k: Rang
+            out: Tampon (m×n) de sortie, float ou uint8 (None: nouveau
+                 tableau float)
+
+        Returns:
+            numpy.ndarray: A_k écrêté
+        """
+        self._check_rank(k)
+        U, S, VT = self.factors
+        us = self._workspace('us', U.shape, order='F')
+        np.multiply(U[:, :k], S[:k], out=us[:, :k])
+
+        if out is None:
+            out = np.empty(self.shape, dtype=self._dtype())
+            count_alloc(out)
+        # Sortie flottante : GEMM et écrêtage sur place ; sinon via le tampon
+        target = out if out.dtype == us.dtype else self._workspace('work', self.shape)
+        np.matmul(us[:, :k], VT[:k, :], out=target)
+        np.clip(target, 0, MAX_VAL, out=target)
+        if target is not out:
+            np.copyto(out, target, casting='unsafe')
+        return out
+
+    def curve(self):
+        """
+        Courbe débit/distorsion de tous les rangs (forme close, calculée une fois)
+
+        Returns:
+            dict: Voir svd_metrics.rate_distortion_curve (ne pas modifier)
+        """
+        if self._curve is None:
+            S = self.factors[1]
+            curve = rate_distortion_curve(S, *self.shape, self._frob2)
+            with self._lock:
+                if self._curve is None:
+                    self._curve = curve
+        return self._curve
+
+    def metrics(self, k, exact=False):
+        """
+        Métriques du rang k
+
+        Args:
+            k: Rang
+            exact: PSNR de l'image reconstruite et écrêtée (sinon forme close)
+
+        Returns:
+            dict: 'k', 'psnr', 'mse', 'energy' (%), 'ratio', 'bytes'
+                  (facteurs dans la précision de calcul)
+        """
+        self._check_rank(k)
+        curve = self.curve()
+        mse = float(curve['mse'][k - 1])
+        if exact:
+            mse = mean_squared_error(self.image, self.reconstruct(k))
+        m, n = self.shape
+        itemsize = self.factors[1].dtype.itemsize
+        return {
+            'k': k,
+            'psnr': float(psnr_from_mse(mse)),
+            'mse': mse,
+            'energy': float(curve['energy'][k - 1]),
+            'ratio': float(curve['ratio'][k - 1]),
+            'bytes': k * (m + n + 1) * itemsize,
+        }
+
+    def select_rank(self, psnr=None, energy=None, max_bytes=None):
+        """
+        Plus petit k atteignant les objectifs (voir svd_metrics.select_rank)
+
+        Returns:
+            int: k, ou None si inatteignable
+        """
+        U, S, VT = self.factors
+        return select_rank(S, *self.shape, self._frob2, psnr=psnr, energy=energy,
+                           max_bytes=max_bytes, bytes_per_value=S.dtype.itemsize,
+                           cumulative=self._cumulative)
+
+    def encode(self, k, **options):
+        """
+        Fichier .svdz des k premières composantes
+
+        Args:
+            k: Rang
+            **options: quant, codec, level (voir svd_codec.encode)
+
+        Returns:
+            bytes: Contenu du fichier .svdz
+        """
+        self._check_rank(k)
+        U, S, VT = self.factors
+        return encode(U, S, VT, k, **options)
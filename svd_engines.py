@@ -0,0 +1,328 @@
+"""
+MOTEURS SVD - exact (LAPACK) et randomisé (range finder)
+
+Le moteur 'exact' appelle np.linalg.svd sur tout le spectre ; il sert de
+référence pour la validation. Le moteur 'randomized' (Halko, Martinsson,
+Tropp) ne calcule que les k premiers triplets (σᵢ, uᵢ, vᵢ), ce qui suffit
+au balayage en k dès que k_max ≪ min(m, n).
+
+Pilote LAPACK de la SVD complète ('exact', 'c_lapack') : 'gesdd' (diviser
+pour régner, plusieurs fois plus rapide sur les grandes images), 'gesvd'
+(QR implicite, la référence) ou 'auto' (gesdd dès que min(m, n) ≥ 64).
+Si gesdd ne converge pas, la SVD est refaite par gesvd ; info['driver']
+indique le pilote effectivement utilisé.
+
+Autres moteurs :
+    'gesvd'    pilote LAPACK gesvd via SciPy (plus lent, plus robuste)
+    'lanczos'  k premiers triplets par Lanczos (scipy.sparse.linalg.svds)
+    'gram'     valeurs propres de AᵀA (n×n) : très rapide pour k ≪ n,
+               mais le conditionnement est élevé au carré
+    'c_lapack' noyau C de svd_compress.c (LAPACKE) appelé par ctypes,
+               sans copie (svd_clib, après 'make lib'), en float64
+    'auto'     moteur le plus rapide respectant la précision, d'après le
+               profil d'autoréglage de la machine (svd_autotune)
+
+Les images rectangulaires ne sont pas recadrées : la SVD économique
+(full_matrices=False) d'une matrice m×n coûte O(max(m,n)·min(m,n)²).
+Quand n > m, on factorise Aᵀ (haute) et on échange les facteurs :
+A = (V Σ Uᵀ)ᵀ, donc U = V', VT = U'ᵀ, sans copie supplémentaire.
+
+Précision : les pixels sont sur 8 bits, float32 (24 bits de mantisse)
+suffit largement. precision='float32' fait passer toute la chaîne en
+simple précision (sgesdd, sgemm) : mémoire et bande passante divisées
+par deux. Le rapport d'exactitude est dans svd_benchmark.precision_report.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import importlib.util
+
+import numpy as np
+
+from svd_memstats import count_alloc, count_copy
+from svd_metrics import sum_squares
+
+
+ENGINES = ('exact', 'randomized', 'gesvd', 'lanczos', 'gram', 'c_lapack', 'auto')
+PRECISIONS = {'float64': np.float64, 'float32': np.float32}
+DRIVERS = ('auto', 'gesdd', 'gesvd')
+GESDD_MIN_DIM = 64          # comme SVD_GESDD_MIN_DIM (svd_compress.h)
+RANDOMIZED_OPTIONS = ('oversampling', 'power_iters', 'seed')
+
+
+def as_precision(A, precision='float64'):
+    """
+    Convertir une image dans la précision de calcul demandée (sans copie si
+    elle y est déjà)
+
+    Args:
+        A: Image ou matrice
+        precision: 'float64' ou 'float32'
+
+    Returns:
+        numpy.ndarray: A dans le type flottant correspondant
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Précision inconnue: {precision!r} (choix: {', '.join(PRECISIONS)})")
+    return np.asarray(A, dtype=PRECISIONS[precision])
+
+
+def svd_driver(A, driver='auto'):
+    """
+    SVD complète (économique) par le pilote LAPACK demandé
+
+    'gesdd' passe par NumPy, 'gesvd' par SciPy ; sans SciPy, 'auto' prend
+    toujours gesdd. Un échec de convergence de gesdd est rattrapé par gesvd.
+
+    Args:
+        A: Matrice (m×n)
+        driver: 'auto', 'gesdd' ou 'gesvd' (voir DRIVERS)
+
+    Returns:
+        tuple: (U, S, VT, pilote utilisé)
+    """
+    if driver not in DRIVERS:
+        raise ValueError(f"Pilote LAPACK inconnu: {driver!r} (choix: {', '.join(DRIVERS)})")
+    if driver == 'auto':
+        small = min(A.shape) < GESDD_MIN_DIM
+        driver = 'gesvd' if small and importlib.util.find_spec('scipy') else 'gesdd'
+
+    if driver == 'gesdd':
+        try:
+            U, S, VT = np.linalg.svd(A, full_matrices=False)
+            return U, S, VT, 'gesdd'
+        except np.linalg.LinAlgError:
+            pass                    # non-convergence : repli sur gesvd
+    U, S, VT = svd_gesvd(A)
+    return U, S, VT, 'gesvd'
+
+
+def svd_exact(A, k=None, driver='gesdd'):
+    """
+    SVD complète (économique) via LAPACK, tronquée éventuellement à k
+
+    Args:
+        A: Matrice (m×n)
+        k: Nombre de triplets à garder (None pour tout garder)
+        driver: Pilote LAPACK (voir svd_driver)
+
+    Returns:
+        tuple: (U, S, VT) avec U (m×r), S (r), VT (r×n)
+    """
+    U, S, VT, _ = svd_driver(A, driver)
+    if k is not None:
+        U, S, VT = U[:, :k], S[:k], VT[:k, :]
+    return U, S, VT
+
+
+def svd_randomized(A, k, oversampling=10, power_iters=2, seed=0):
+    """
+    SVD tronquée randomisée (range finder + itérations de puissance)
+
+    On échantillonne l'image de A avec k + p vecteurs gaussiens, on
+    orthonormalise (QR) puis on projette : B = Qᵀ A est petit
+    ((k+p)×n) et sa SVD exacte donne les k premiers triplets de A.
+    Les itérations de puissance, réorthonormalisées à chaque passe,
+    accentuent la décroissance du spectre pour les images peu contrastées.
+
+    Args:
+        A: Matrice (m×n)
+        k: Nombre de triplets à calculer
+        oversampling: Colonnes supplémentaires p de l'échantillon
+        power_iters: Nombre d'itérations de puissance q
+        seed: Graine du générateur (reproductibilité)
+
+    Returns:
+        tuple: (U, S, VT) avec U (m×k), S (k), VT (k×n)
+    """
+    m, n = A.shape
+    l = k + oversampling
+
+    # L'échantillon couvre tout le spectre : autant faire la SVD exacte
+    if l >= min(m, n):
+        return svd_exact(A, k)
+
+    rng = np.random.default_rng(seed)
+    omega = rng.standard_normal((n, l)).astype(A.dtype, copy=False)
+
+    Q, _ = np.linalg.qr(A @ omega)
+    for _ in range(power_iters):
+        Z, _ = np.linalg.qr(A.T @ Q)
+        Q, _ = np.linalg.qr(A @ Z)
+
+    B = Q.T @ A
+    U_b, S, VT = np.linalg.svd(B, full_matrices=False)
+    U = Q @ U_b[:, :k]
+
+    return U, S[:k], VT[:k, :]
+
+
+def svd_gesvd(A, k=None):
+    """
+    SVD complète par le pilote LAPACK gesvd (SciPy), tronquée éventuellement à k
+
+    Args:
+        A: Matrice (m×n)
+        k: Nombre de triplets à garder (None pour tout garder)
+
+    Returns:
+        tuple: (U, S, VT)
+    """
+    from scipy.linalg import svd
+    U, S, VT = svd(A, full_matrices=False, lapack_driver='gesvd', check_finite=False)
+    if k is not None:
+        U, S, VT = U[:, :k], S[:k], VT[:k, :]
+    return U, S, VT
+
+
+def svd_lanczos(A, k):
+    """
+    k premiers triplets par bidiagonalisation de Lanczos (ARPACK via SciPy)
+
+    Args:
+        A: Matrice (m×n)
+        k: Nombre de triplets (k < min(m, n), sinon SVD exacte)
+
+    Returns:
+        tuple: (U, S, VT) triés par σ décroissant
+    """
+    if k >= min(A.shape):
+        return svd_exact(A, k)
+    from scipy.sparse.linalg import svds
+    U, S, VT = svds(A, k=k, which='LM', random_state=0)
+    order = np.argsort(S)[::-1]
+    return U[:, order], S[order], VT[order, :]
+
+
+def svd_gram(A, k):
+    """
+    k premiers triplets par les valeurs propres de la matrice de Gram AᵀA
+
+    AᵀA = V Σ² Vᵀ (n×n, un seul GEMM puis eigh), et U = A V Σ⁻¹. Les
+    petites valeurs singulières perdent la moitié de leurs chiffres
+    significatifs : réservé aux k dominants d'une matrice haute (m ≥ n).
+
+    Args:
+        A: Matrice (m×n), m ≥ n
+        k: Nombre de triplets
+
+    Returns:
+        tuple: (U, S, VT)
+    """
+    w, V = np.linalg.eigh(A.T @ A)
+    w, V = w[::-1][:k], V[:, ::-1][:, :k]
+    S = np.sqrt(np.maximum(w, 0.0))
+    U = A @ V
+    nonzero = S > S[0] * np.finfo(A.dtype).eps if len(S) else S > 0
+    U[:, nonzero] /= S[nonzero]
+    return U, S, np.ascontiguousarray(V.T)
+
+
+def truncation_error(A, S):
+    """
+    Estimation a posteriori de l'erreur de troncature ||A - A_k||_F
+
+    U_k Σ_k V_kᵀ est la projection orthogonale de A sur vect(U_k), donc
+    ||A - A_k||_F² = ||A||_F² - Σ σᵢ² : l'erreur se lit sans reconstruire.
+
+    Args:
+        A: Matrice originale (m×n)
+        S: Valeurs singulières calculées (k)
+
+    Returns:
+        dict: frob2 (||A||_F²), residual (||A - A_k||_F), rel_error
+    """
+    frob2 = sum_squares(A)
+    residual2 = max(frob2 - float(np.sum(np.asarray(S, dtype=np.float64) ** 2)), 0.0)
+    residual = np.sqrt(residual2)
+    rel_error = residual / np.sqrt(frob2) if frob2 > 0 else 0.0
+    return {'frob2': frob2, 'residual': residual, 'rel_error': rel_error}
+
+
+def compute_svd(A, k=None, engine='exact', precision=None, driver='auto', tol=None,
+                **options):
+    """
+    Point d'entrée unique : choisir le moteur SVD
+
+    Args:
+        A: Matrice (m×n)
+        k: Nombre de triplets utiles (obligatoire pour 'randomized')
+        engine: Voir ENGINES ('auto': choix par svd_autotune.select_engine)
+        precision: 'float64' ou 'float32' (None: garder le type flottant de A)
+        driver: Pilote LAPACK des moteurs 'exact' et 'c_lapack' (voir DRIVERS)
+        tol: Tolérance de précision du choix 'auto' (None: celle de
+             svd_autotune.select_engine)
+        **options: Paramètres du moteur randomisé (RANDOMIZED_OPTIONS) ;
+                   refusés par les autres moteurs ('auto' les transmet
+                   si son choix tombe sur 'randomized')
+
+    Returns:
+        tuple: (U, S, VT, info) où info contient le moteur, le pilote LAPACK
+               utilisé ('driver', None pour les moteurs itératifs), k, le
+               sens de factorisation ('transposed'), la précision et
+               l'estimation d'erreur de truncation_error()
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Moteur SVD inconnu: {engine!r} (choix: {', '.join(ENGINES)})")
+    if engine in ('randomized', 'lanczos', 'gram') and k is None:
+        raise ValueError(f"Le moteur {engine!r} nécessite k")
+    unknown = sorted(set(options) - set(RANDOMIZED_OPTIONS))
+    if unknown:
+        raise TypeError(f"Option(s) inconnue(s): {', '.join(unknown)} "
+                        f"(choix: {', '.join(RANDOMIZED_OPTIONS)})")
+    if options and engine not in ('randomized', 'auto'):
+        raise TypeError(f"Le moteur {engine!r} n'accepte pas {', '.join(sorted(options))} "
+                        "(options du moteur 'randomized')")
+    if tol is not None and engine != 'auto':
+        raise TypeError(f"tol ne concerne que engine='auto' (reçu {engine!r})")
+    source = A
+    if precision is not None:
+        A = as_precision(A, precision)
+    elif A.dtype not in (np.float32, np.float64):
+        A = A.astype(np.float64)
+    if A is not source:
+        count_alloc(A)
+        count_copy(A)
+
+    # Image plus large que haute : factoriser Aᵀ (m' = n ≥ n' = m)
+    m, n = A.shape
+    transposed = n > m
+    M = A.T if transposed else A
+
+    requested = engine
+    if engine == 'auto':
+        from svd_autotune import select_engine
+        if tol is None:
+            engine = select_engine(M.shape[0], M.shape[1], k)
+        else:
+            engine = select_engine(M.shape[0], M.shape[1], k, tolerance=tol)
+
+    used = None
+    if engine in ('exact', 'gesvd'):
+        count_copy(M)               # copie de travail interne : LAPACK détruit son entrée
+    if engine == 'exact':
+        U, S, VT, used = svd_driver(M, driver)
+    elif engine == 'gesvd':
+        U, S, VT = svd_gesvd(M)
+        used = 'gesvd'
+    elif engine == 'lanczos':
+        U, S, VT = svd_lanczos(M, k)
+    elif engine == 'gram':
+        U, S, VT = svd_gram(M, k)
+    elif engine == 'c_lapack':
+        from svd_clib import c_svd
+        U, S, VT, used = c_svd(M, driver=driver, return_driver=True)
+        U, S, VT = (X.astype(M.dtype, copy=False) for X in (U, S, VT))
+    else:
+        U, S, VT = svd_randomized(M, k, **options)
+    if engine != 'c_lapack':        # comptés par c_svd
+        count_alloc(U, S, VT)
+
+    if transposed:
+        U, VT = VT.T, U.T
+
+    info = {'engine': engine, 'requested': requested, 'driver': used, 'k': len(S),
+            'transposed': transposed, 'precision': A.dtype.name}
+    info.update(truncation_error(A, S))
+    return U, S, VT, info
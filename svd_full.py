@@ -1539,29 +1539,35 @@
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, ArrowStyle, FancyArrowPatch
-import matplotlib.patheffects as path_effects
 import os, time, sys
 
+from svd_engines import DRIVERS, ENGINES, PRECISIONS
+from svd_cache import DEFAULT_CACHE_DIR, cached_svd
+from svd_compressor import SVDCompressor
+from svd_benchmark import BACKEND_LABELS, measured_benchmarks, nearest_measurements, plot_benchmark
+from svd_metrics import mean_squared_error, rate_distortion_curve, select_rank
+from svd_sweep import rank_sweep
+from svd_codec import QUANTS, decode_image, encode_stream, save_svdz
+from svd_imageio import engine_order, open_gray, to_array
+
+def _pyplot():
+    """matplotlib.pyplot (backend Agg), importé au premier graphique seulement :
+    la pile matplotlib coûte plusieurs centaines de ms au démarrage"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
 # ─────────────────────────────────────────────
 # 1. FONCTIONS POUR CHARGER/CREER DES IMAGES
 # ─────────────────────────────────────────────
 def create_test_image(size=256):
     """Crée une image de test réaliste"""
-    img = Image.new('L', (size, size), 240)
+    # Dégradé de fond (une ligne calculée, diffusée sur toute la hauteur)
+    row = (200 + 40 * np.arange(size) / size).astype(np.uint8)
+    img = Image.fromarray(np.ascontiguousarray(np.broadcast_to(row, (size, size))))
     draw = ImageDraw.Draw(img)
 
-    # Dégradé de fond
-    for y in range(size):
-        for x in range(size):
-            val = int(200 + 40 * (x / size))
-            img.putpixel((x, y), val)
-
     # Cercles concentriques
     cx, cy = size // 2, size // 2
     colors = [30, 60, 100, 140, 180, 50, 90, 130, 170, 20]
@@ -1602,23 +1608,18 @@ def load_custom_image(image_path, max_size=512):
     """Charge une image personnalisée depuis un fichier"""
     try:
         print(f"Chargement de l'image: {image_path}")
-        img = Image.open(image_path)
+        # Niveaux de gris et réduction dès le décodage (draft JPEG, reduce) ;
+        # max_size=None garde la pleine résolution (images géantes : voir
+        # svd_outofcore.py)
+        img, info = open_gray(image_path, max_size)
         
-        # Obtenir les dimensions originales
-        original_width, original_height = img.size
+        original_width, original_height = info['original']
         print(f"Dimensions originales: {original_width} x {original_height}")
-        
-        # Convertir en niveaux de gris si nécessaire
-        if img.mode != 'L':
-            print("Conversion en niveaux de gris...")
-            img = img.convert('L')
-        
-        # Redimensionner si trop grand (pour performance)
-        if max(img.size) > max_size:
-            print(f"Redimensionnement à {max_size}px max...")
-            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        if img.size != info['original']:
             new_width, new_height = img.size
             print(f"Nouvelles dimensions: {new_width} x {new_height}")
+        draft = f", réduction JPEG 1/{info['draft']}" if info['draft'] > 1 else ""
+        print(f"Chargement: {info['decode_ms']:.1f} ms{draft}")
         
         return img
     except Exception as e:
@@ -1676,31 +1677,34 @@ def get_user_image_choice():
 # 2. FONCTIONS SVD ET CALCULS
 # ─────────────────────────────────────────────
 def svd_compress(img_array, k):
-    """Compression SVD avec k valeurs singulières"""
-    U, S, VT = np.linalg.svd(img_array, full_matrices=False)
-    # Garder seulement k valeurs
-    U_k  = U[:, :k]
-    S_k  = S[:k]
-    VT_k = VT[:k, :]
-    # Reconstruction : A ≈ U_k × diag(S_k) × VT_k
-    img_compressed = U_k @ np.diag(S_k) @ VT_k
+    """Compression SVD avec k valeurs singulières (appel isolé : pour plusieurs k,
+    garder un SVDCompressor qui ne factorise qu'une fois)"""
+    U, S, VT = SVDCompressor(img_array).factors
+    # Reconstruction : A ≈ U_k × diag(S_k) × VT_k (non écrêtée, k > rang toléré,
+    # comme avant ; SVDCompressor.reconstruct donne la version écrêtée)
+    img_compressed = (U[:, :k] * S[:k]) @ VT[:k, :]
     return img_compressed, U, S, VT
 
 def compute_psnr(original, compressed):
-    mse = np.mean((original - compressed) ** 2)
+    mse = mean_squared_error(original, compressed)
     if mse < 1e-10:
         return 100.0
     return 10 * np.log10((255.0 ** 2) / mse)
 
-def energy_retained(S, k):
-    return (np.sum(S[:k]**2) / np.sum(S**2)) * 100.0
+def energy_retained(S, k, total=None):
+    # total = ||A||_F² quand S est tronqué (moteur randomisé)
+    if total is None:
+        total = np.sum(S**2)
+    return (np.sum(S[:k]**2) / total) * 100.0
 
 # ─────────────────────────────────────────────
 # 3. FONCTION POUR LA CARTE DES COMPROMIS
 # ─────────────────────────────────────────────
-def generate_compromise_chart(results, size, img_name, out):
-    """Génère la carte des compromis qualité/compression"""
+def generate_compromise_chart(results, size, img_name, out, shape=None):
+    """Génère la carte des compromis qualité/compression (shape = (m, n) si non carrée)"""
+    plt = _pyplot()
     print("  [6/5] Génération de la carte des compromis …")
+    dims = f"{shape[1]}×{shape[0]}" if shape else f"{size}×{size}"
     
     # Extraire les données
     ks = [r[0] for r in results]
@@ -1822,7 +1826,7 @@ def generate_compromise_chart(results, size, img_name, out):
     ax.set_ylim(0, max(psnrs) * 1.15)
     
     # Titre principal
-    title = f"Carte des compromis qualité/compression - {img_name} ({size}×{size})"
+    title = f"Carte des compromis qualité/compression - {img_name} ({dims})"
     ax.set_title(title, color='white', fontsize=16, fontweight='bold', pad=20)
     
     # Légende combinée
@@ -1837,7 +1841,7 @@ def generate_compromise_chart(results, size, img_name, out):
     ax.grid(True, color='#2a3a5c', alpha=0.6, linestyle=':', zorder=0)
     
     # Boîte d'information
-    info_text = f"Image: {img_name}\nTaille: {size}×{size} pixels\n"
+    info_text = f"Image: {img_name}\nTaille: {dims} pixels\n"
     
     # Trouver les points intéressants
     k_acceptable = None
@@ -1895,9 +1899,15 @@ def generate_compromise_chart(results, size, img_name, out):
 # ─────────────────────────────────────────────
 # 4. FONCTIONS POUR GÉNÉRER LES DIAGRAMMES
 # ─────────────────────────────────────────────
-def generate_flowchart(results, S, size, img_name, t_svd, out):
-    """Génère le diagramme de flux SVD"""
+def generate_flowchart(results, S, size, img_name, t_svd, out, shape=None, cached=False):
+    """Génère le diagramme de flux SVD (shape = (m, n) si non carrée)"""
+    import matplotlib.patheffects as path_effects
+    from matplotlib.patches import FancyArrowPatch, FancyBboxPatch
+    plt = _pyplot()
     print("  [7/6] Génération du diagramme de flux SVD …")
+    m, n = shape if shape else (size, size)
+    dims = f"{n}×{m}"
+    svd_time = f"Cache: {t_svd*1000:.0f} ms" if cached else f"Temps: {t_svd*1000:.0f} ms"
     
     fig, ax = plt.subplots(figsize=(16, 8))
     fig.patch.set_facecolor('#1a1a2e')
@@ -1916,10 +1926,10 @@ def generate_flowchart(results, S, size, img_name, t_svd, out):
     blocks = [
         # (x, y, width, height, label, color, details)
         (1, 7, 2.5, 1.5, "1. Chargement Image", "#4ecdc4", 
-         f"• Lecture fichier\n• Conversion niveaux de gris\n• {size}×{size} pixels"),
+         f"• Lecture fichier\n• Conversion niveaux de gris\n• {dims} pixels"),
         
         (5, 7, 3, 1.5, "2. Décomposition SVD\n(LAPACKE_dgesvd)", "#ff6b6b",
-         f"• Calcul SVD complète\n• A = UΣVᵀ\n• {len(S)} valeurs singulières\n• Temps: {t_svd*1000:.0f} ms"),
+         f"• Calcul SVD complète\n• A = UΣVᵀ\n• {len(S)} valeurs singulières\n• {svd_time}"),
         
         (9.5, 7, 3, 1.5, "3. Troncature", "#ffa726",
          f"• Sélection des k valeurs\n• k ∈ [1, {size}]\n• Uₖ, Σₖ, Vₖᵀ\n• Compression adaptative"),
@@ -1965,9 +1975,9 @@ def generate_flowchart(results, S, size, img_name, t_svd, out):
     # Complexité algorithmique
     complexities = [
         (1.5, 5.5, "O(1)", "Temps constant", "#4ecdc4"),
-        (5.5, 5.5, f"O({size}³)", f"~{size}³ opérations", "#ff6b6b"),
+        (5.5, 5.5, f"O({max(m, n)}×{size}²)", f"~{max(m, n) * size**2:.2e} opérations", "#ff6b6b"),
         (9.5, 5.5, "O(1)", "Sélection simple", "#ffa726"),
-        (14.5, 5.5, f"O(k×{size}²)", "2× cblas_dgemm", "#45b7d1")
+        (14.5, 5.5, f"O(k×{m}×{n})", "2× cblas_dgemm", "#45b7d1")
     ]
     
     for x, y, comp, desc, color in complexities:
@@ -2012,8 +2022,8 @@ def generate_flowchart(results, S, size, img_name, t_svd, out):
     
     # Légende de performance
     total_energy = np.sum(S**2)
-    perf_text = f"Performances sur {img_name} ({size}×{size}):\n"
-    perf_text += f"• SVD calculée en {t_svd*1000:.0f} ms\n"
+    perf_text = f"Performances sur {img_name} ({dims}):\n"
+    perf_text += f"• {'Facteurs relus du cache' if cached else 'SVD calculée'} en {t_svd*1000:.0f} ms\n"
     perf_text += f"• {len(S)} valeurs singulières\n"
     perf_text += f"• σ₁ = {S[0]:.0f} ({S[0]**2/total_energy*100:.1f}% énergie)\n"
     perf_text += f"• Compression jusqu'à {max([r[2] for r in results]):.1f}:1"
@@ -2033,6 +2043,9 @@ def generate_flowchart(results, S, size, img_name, t_svd, out):
 
 def generate_architecture_diagram(out):
     """Génère le diagramme d'architecture du code"""
+    import matplotlib.patheffects as path_effects
+    from matplotlib.patches import FancyArrowPatch, FancyBboxPatch
+    plt = _pyplot()
     print("  [8/7] Génération du diagramme d'architecture …")
     
     fig, ax = plt.subplots(figsize=(14, 10))
@@ -2162,8 +2175,13 @@ def generate_architecture_diagram(out):
     print(f"        ✓ {filename}")
     return filename
 
-def generate_summary_infographic(results, S, size, img_name, t_svd, out):
+def generate_summary_infographic(results, S, size, img_name, t_svd, out, shape=None,
+                                 benchmarks=None, cached=False):
     """Génère l'infographie de synthèse"""
+    import matplotlib.gridspec as gridspec
+    import matplotlib.patches as patches
+    import matplotlib.patheffects as path_effects
+    plt = _pyplot()
     print("  [9/8] Génération de l'infographie de synthèse …")
     
     fig = plt.figure(figsize=(18, 12))
@@ -2177,7 +2195,8 @@ def generate_summary_infographic(results, S, size, img_name, t_svd, out):
     ax_title.set_facecolor('#1a1a2e')
     ax_title.axis('off')
     
-    title_text = f"SYNTHÈSE COMPLÈTE - Compression SVD de {img_name} ({size}×{size})"
+    dims = f"{shape[1]}×{shape[0]}" if shape else f"{size}×{size}"
+    title_text = f"SYNTHÈSE COMPLÈTE - Compression SVD de {img_name} ({dims})"
     ax_title.text(0.5, 0.7, title_text, ha='center', va='center',
                   fontsize=22, fontweight='bold', color='white',
                   path_effects=[path_effects.withStroke(linewidth=4, foreground='#1a1a2e')])
@@ -2208,10 +2227,11 @@ def generate_summary_infographic(results, S, size, img_name, t_svd, out):
         if psnr >= 40 and k_excellent is None:
             k_excellent = (k, psnr, ratio)
     
-    stats_text = f"• Taille image: {size}×{size} pixels\n"
+    stats_text = f"• Taille image: {dims} pixels\n"
     stats_text += f"• Valeurs singulières: {len(S)}\n"
     stats_text += f"• σ₁/σ₂ ratio: {S[0]/S[1]:.1f}:1\n"
-    stats_text += f"• Temps SVD: {t_svd*1000:.0f} ms\n"
+    stats_text += (f"• SVD relue du cache: {t_svd*1000:.0f} ms\n" if cached
+                   else f"• Temps SVD: {t_svd*1000:.0f} ms\n")
     stats_text += f"• Compression max: {max_ratio:.1f}:1\n\n"
     
     if k_optimal:
@@ -2325,16 +2345,22 @@ def generate_summary_infographic(results, S, size, img_name, t_svd, out):
     ax_perf.text(0.5, 0.9, perf_title, ha='center', va='center',
                  fontsize=14, fontweight='bold', color='#45b7d1')
     
-    perf_text = "Accélération avec Intel MKL:\n\n"
-    perf_text += "┌─────────────────┬──────────┐\n"
-    perf_text += "│ Plateforme      │ Temps    │\n"
-    perf_text += "├─────────────────┼──────────┤\n"
-    perf_text += f"│ MATLAB          │ {t_svd*4000:.0f} ms   │\n"
-    perf_text += f"│ Python/NumPy    │ {t_svd*1000:.0f} ms   │\n"
-    perf_text += f"│ C+MKL (1T)      │ {t_svd*1000/2.3:.0f} ms   │\n"
-    perf_text += f"│ C+MKL (8T)      │ {t_svd*1000/8:.0f} ms   │\n"
-    perf_text += "└─────────────────┴──────────┘\n\n"
-    perf_text += f"Gain total: ×{(t_svd*4000)/(t_svd*1000/8):.1f}"
+    # Temps mesurés seulement (svd_benchmark.py --suite, new.m)
+    bench_size, measured = nearest_measurements(benchmarks or {}, size)
+    perf_text = f"Temps SVD mesurés ({bench_size}×{bench_size}):\n\n" if measured \
+        else "Temps SVD mesuré:\n\n"
+    perf_text += "┌──────────────────────┬────────────┐\n"
+    perf_text += "│ Plateforme           │ Temps      │\n"
+    perf_text += "├──────────────────────┼────────────┤\n"
+    for name, ms in sorted(measured.items(), key=lambda item: -item[1]):
+        perf_text += f"│ {BACKEND_LABELS.get(name, name)[:20]:<20s} │ {ms:7.0f} ms │\n"
+    if not cached:                  # lecture du cache : pas un temps de SVD
+        perf_text += f"│ {'Cette image':<20s} │ {t_svd*1000:7.0f} ms │\n"
+    perf_text += "└──────────────────────┴────────────┘\n\n"
+    if len(measured) > 1:
+        perf_text += f"Écart mesuré: ×{max(measured.values()) / min(measured.values()):.1f}"
+    else:
+        perf_text += "Autres plateformes: python svd_benchmark.py --suite"
     
     ax_perf.text(0.5, 0.6, perf_text, ha='center', va='center',
                  fontsize=10, color='white', fontfamily='monospace',
@@ -2382,7 +2408,9 @@ def generate_summary_infographic(results, S, size, img_name, t_svd, out):
 # ─────────────────────────────────────────────
 # 5. MAIN MODIFIÉ : avec choix utilisateur
 # ─────────────────────────────────────────────
-def main():
+def main(engine='exact', target_psnr=None, target_energy=None, max_bytes=None, svdz=None,
+         precision='float64', cache_dir=DEFAULT_CACHE_DIR, driver='auto', charts=True,
+         exact_psnr=True):
     import os 
     current_dir = os.getcwd() # dossier courant
     out = os.path.join(current_dir, 'python')
@@ -2396,9 +2424,8 @@ def main():
     pil_img, img_name = get_user_image_choice()
     
     # ── image originale
-    size = pil_img.size[0]  # Taille de l'image (carrée ou non)
     print(f"\n✅ Image sélectionnée: {img_name}")
-    print(f"   Dimensions: {size} x {pil_img.size[1]}")
+    print(f"   Dimensions: {pil_img.size[0]} x {pil_img.size[1]}")
     print(f"   Mode: {pil_img.mode}")
     
     # Sauvegarder l'image originale
@@ -2406,25 +2433,40 @@ def main():
     pil_img.save(original_path)
     print(f"   Sauvegardée dans: {original_path}")
     
-    # Convertir en numpy array pour SVD
-    A = np.array(pil_img, dtype=np.float64)
+    # Convertir en numpy array pour SVD (image m×n complète, sans recadrage)
+    # (type et ordre mémoire attendus par le moteur, une seule conversion)
+    A = to_array(pil_img, PRECISIONS[precision],
+                 engine_order(engine, (pil_img.size[1], pil_img.size[0])))
     height, width = A.shape
+    size = min(height, width)   # rang maximal : k ≤ min(m, n)
+    dims = f"{width}×{height}"
+    
+    # ── valeurs de k (ajustées selon la taille)
+    max_k = min(256, size)  # Ne pas dépasser la taille ni 256
+    K_VALUES = [1, 5, 10, 25, 50, 75, 100]
+    # Ajouter des valeurs supplémentaires si la taille le permet
+    if size >= 150:
+        K_VALUES.append(150)
+    if size >= 200:
+        K_VALUES.append(200)
+    K_VALUES.append(size)  # Ajouter la taille maximale
     
-    # Ajuster la taille pour le calcul (on prend le minimum pour carré)
-    min_dim = min(height, width)
-    if height != width:
-        print(f"\n⚠  Attention: L'image n'est pas carrée ({width}x{height})")
-        print(f"   La SVD sera calculée sur la dimension minimale: {min_dim}")
-        # Pour simplifier, on tronque au carré
-        A = A[:min_dim, :min_dim]
-        size = min_dim
-    
-    # ── SVD une seule fois
-    print(f"\n  [1/3] Calcul SVD sur image {size}x{size} …")
+    # Filtrer les valeurs supérieures à max_k
+    K_VALUES = [k for k in K_VALUES if k <= max_k]
+
+    # ── SVD une seule fois (seuls les max(K_VALUES) premiers triplets servent)
+    print(f"\n  [1/3] Calcul SVD ({engine}, {precision}) sur image {width}x{height} …")
     t0 = time.time()
-    U, S, VT = np.linalg.svd(A, full_matrices=False)
+    U, S, VT, svd_info = cached_svd(A, k=max(K_VALUES), engine=engine, precision=precision,
+                                    cache_dir=cache_dir, driver=driver)
     t_svd = time.time() - t0
-    print(f"        ✓ SVD en {t_svd*1000:.2f} ms")
+    total_energy = svd_info['frob2']
+    print(f"        ✓ {'SVD relue du cache' if svd_info['cached'] else 'SVD'} en {t_svd*1000:.2f} ms "
+          f"({len(S)} triplets"
+          f"{', pilote ' + svd_info['driver'] if svd_info.get('driver') else ''})")
+    print(f"        Erreur de troncature k={len(S)}: "
+          f"||A - A_k||_F = {svd_info['residual']:.3e} "
+          f"(relative {svd_info['rel_error']:.3e})")
     if len(S) > 0:
         print(f"        σ₁={S[0]:.2f}", end="")
     if len(S) > 9:
@@ -2435,19 +2477,30 @@ def main():
         print(f"  σ₁₀₀={S[99]:.2f}")
     print()
 
-    # ── compression pour chaque k (ajusté selon la taille)
-    max_k = min(256, size)  # Ne pas dépasser la taille ni 256
-    K_VALUES = [1, 5, 10, 25, 50, 75, 100]
-    # Ajouter des valeurs supplémentaires si la taille le permet
-    if size >= 150:
-        K_VALUES.append(150)
-    if size >= 200:
-        K_VALUES.append(200)
-    K_VALUES.append(size)  # Ajouter la taille maximale
-    
-    # Filtrer les valeurs supérieures à max_k
-    K_VALUES = [k for k in K_VALUES if k <= max_k]
-    
+    # ── PSNR/énergie/ratio de tous les k d'un coup (Eckart–Young, sans reconstruction)
+    curve = rate_distortion_curve(S, height, width, total_energy)
+
+    # ── rang cible (plus petit k pour un PSNR/une énergie, ou meilleur k sous un budget) :
+    #    forme close, bissection sur images écrêtées si nécessaire (exact_psnr)
+    if target_psnr is not None or target_energy is not None or max_bytes is not None:
+        clip_args = dict(original=A, U=U, VT=VT) if exact_psnr else {}
+        k_target = select_rank(S, height, width, total_energy, psnr=target_psnr,
+                               energy=target_energy, max_bytes=max_bytes,
+                               bytes_per_value=A.itemsize, **clip_args)
+        if k_target is None:
+            print(f"  ⚠ Objectif inatteignable avec les {len(S)} triplets calculés\n")
+        else:
+            psnr_target = curve['psnr'][k_target - 1]
+            if exact_psnr:          # PSNR de l'image écrêtée, celui qu'a visé la bissection
+                rec = (U[:, :k_target] * S[:k_target]) @ VT[:k_target, :]
+                psnr_target = compute_psnr(A, np.clip(rec, 0, 255, out=rec))
+            print(f"  ✓ Rang cible: k = {k_target}  (PSNR {psnr_target:.2f} dB, "
+                  f"énergie {curve['energy'][k_target - 1]:.2f} %, "
+                  f"{k_target * (height + width + 1) * A.itemsize / 1024:.1f} Ko en {precision})\n")
+            if k_target not in K_VALUES:
+                K_VALUES = sorted(K_VALUES + [k_target])
+
+    # ── compression pour chaque k
     print(f"  [2/3] Compression avec k = {K_VALUES} …")
     print("  ┌─────┬──────────┬───────────┬───────────┐")
     print("  │  k  │  PSNR dB │ Ratio     │ Énergie % │")
@@ -2455,23 +2508,40 @@ def main():
 
     results = []
     compressed_images = {}
-
-    for k in K_VALUES:
-        U_k  = U[:, :k]
-        S_k  = S[:k]
-        VT_k = VT[:k, :]
-        A_k  = U_k @ np.diag(S_k) @ VT_k          # reconstruction
-
-        psnr  = compute_psnr(A, A_k)
-        ratio = (size * size) / (k * (size + size + 1))
-        ener  = energy_retained(S, k)
+    svdz_files = []
+
+    # reconstruction incrémentale : A_k = A_{k-1} + bloc de rang (k - k_prev)
+    for k, _, frame in rank_sweep(U, S, VT, K_VALUES):
+        psnr  = curve['psnr'][k - 1]
+        ratio = curve['ratio'][k - 1]
+        ener  = curve['energy'][k - 1]
+        if svdz:
+            # fichier .svdz réel : le ratio devient le vrai ratio en octets (pixels 8 bits)
+            path = f"{out}/compressed_k{k:03d}.svdz"
+            nbytes = save_svdz(path, U, S, VT, k, quant=svdz)
+            ratio = A.size / nbytes
+            with open(path, "rb") as f:
+                svdz_files.append((k, nbytes, compute_psnr(A, decode_image(f.read()))))
         results.append((k, psnr, ratio, ener))
-        compressed_images[k] = np.clip(A_k, 0, 255).astype(np.uint8)
+        compressed_images[k] = frame.copy()   # le tampon est réutilisé au k suivant
 
         print(f"  │ {k:3d} │  {psnr:7.2f} │  {ratio:6.2f}:1 │  {ener:7.2f}  │")
 
     print("  └─────┴──────────┴───────────┴───────────┘\n")
 
+    if svdz_files:
+        print(f"  Fichiers .svdz ({svdz}) — {A.size} octets bruts :")
+        for k, nbytes, psnr_q in svdz_files:
+            print(f"    k={k:3d} : {nbytes:8d} octets  ratio {A.size / nbytes:6.2f}:1  "
+                  f"PSNR décodé {psnr_q:6.2f} dB")
+        # flux progressif : un bloc par palier de K_VALUES, aperçus pendant la réception
+        stream = encode_stream(U, S, VT, K_VALUES, quant=svdz)
+        with open(f"{out}/compressed_progressive.svds", "wb") as f:
+            f.write(stream)
+        print(f"    progressif (k ≤ {max(K_VALUES)}) : {len(stream):8d} octets "
+              f"→ compressed_progressive.svds")
+        print()
+
     # ── sauvegarder chaque image compressée
     print(f"  [3/3] Sauvegarde des images compressées …")
     for k in K_VALUES:
@@ -2486,7 +2556,7 @@ def main():
     with open(f"{out}/singular_values.csv", "w") as f:
         f.write("Index,SingularValue,Energy,CumulativeEnergy\n")
         cumul = 0.0
-        total = np.sum(S**2)
+        total = total_energy
         for i, s in enumerate(S):
             cumul += s**2
             f.write(f"{i+1},{s:.6f},{s**2:.6f},{cumul/total*100:.2f}\n")
@@ -2499,7 +2569,12 @@ def main():
     # ─────────────────────────────────────────
     # 6. GRAPHIQUES POUR LA PRÉSENTATION
     # ─────────────────────────────────────────
+    if not charts:
+        print(f"\n✅ Compression SVD terminée (sans graphiques) : {out}/")
+        return
+
     print("\n  [4/3] Génération des graphiques …")
+    plt = _pyplot()
 
     # Sélectionner les k à afficher pour les graphiques
     show_ks = []
@@ -2549,7 +2624,7 @@ def main():
         col = idx % n_cols
         axes[row][col].axis('off')
     
-    fig.suptitle(f"COMPRESSION SVD — {img_name} ({size}x{size})",
+    fig.suptitle(f"COMPRESSION SVD — {img_name} ({dims})",
                  color='white', fontsize=18, fontweight='bold', y=0.98)
     plt.tight_layout(rect=[0, 0, 1, 0.94])
     fig.savefig(f"{out}/graphique_comparaison.png", dpi=150, bbox_inches='tight',
@@ -2582,7 +2657,7 @@ def main():
     ax1.grid(True, color='#2a3a5c', alpha=0.6)
 
     # énergie cumulée
-    cumul_energy = np.cumsum(S**2) / np.sum(S**2) * 100
+    cumul_energy = curve['energy']
     ax2.plot(range(1, len(S)+1), cumul_energy, color='#ff7043', linewidth=2.2)
     for pct in [50, 90, 95, 99]:
         if pct <= cumul_energy[-1]:
@@ -2646,70 +2721,23 @@ def main():
     print("        ✓ graphique_qualite_compression.png")
 
     # ── FIGURE D : Benchmark comparatif
+    # Mesures réelles uniquement : CSV de svd_benchmark.py --suite et de new.m
+    # (matlab_benchmark.csv), plus le temps mesuré sur l'image en cours
     print("  [5/4] Génération du graphique benchmark …")
-    fig, ax = plt.subplots(figsize=(10, 6))
-    fig.patch.set_facecolor('#1a1a2e')
-    ax.set_facecolor('#16213e')
-    ax.tick_params(colors='white')
-    for sp in ax.spines.values():
-        sp.set_color('#334466')
-
-    labels  = ['MATLAB\n(R2024a)', 'Python\n(NumPy)', 'C + MKL\n(1 thread)', 'C + MKL\n(8 threads)']
-    
-    # Temps réalistes basés sur votre temps mesuré
-    python_time = t_svd * 1000
-    
-    # Calculer les temps relatifs
-    times = [
-        python_time * 4.0,      # MATLAB
-        python_time,            # Python/NumPy
-        python_time / 2.3,      # C+MKL 1 thread
-        python_time / 8.0       # C+MKL 8 threads
-    ]
-    
-    colors  = ['#ef5350', '#ffa726', '#42a5f5', '#66bb6a']
-
-    bars = ax.bar(labels, times, color=colors, width=0.5, edgecolor='white', linewidth=1.2)
-    for bar, t in zip(bars, times):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(times)*0.05,
-                f'{t:.0f} ms', ha='center', color='white', fontsize=14, fontweight='bold')
-
-    # Calculer l'accélération
-    acceleration = times[0] / times[-1]
-    
-    # Flèche d'accélération
-    ax.annotate('', xy=(3, times[-1] + max(times)*0.1), 
-                xytext=(0, times[0] + max(times)*0.1),
-                arrowprops=dict(arrowstyle='<->', color='white', lw=2))
-    
-    # Texte d'accélération
-    ax.text(1.5, max(times) * 1.2, f'×{acceleration:.1f} plus rapide', 
-            ha='center', color='white', fontsize=13, fontweight='bold',
-            bbox=dict(boxstyle='round,pad=0.3', facecolor='#2a3a5c', edgecolor='white'))
-
-    # Info sur l'image
-    ax.text(0.5, -0.15, f"Image: {img_name} ({size}×{size}) | Temps Python: {python_time:.0f} ms",
-            transform=ax.transAxes, ha='center', color='#aaccff', fontsize=11)
-
-    ax.set_ylabel('Temps de calcul (ms)', color='white', fontsize=13)
-    ax.set_title('Benchmark comparatif: Temps de calcul SVD',
-                 color='white', fontsize=15, fontweight='bold')
-    ax.set_ylim(0, max(times) * 1.3)
-    ax.grid(True, axis='y', color='#2a3a5c', alpha=0.5)
-    ax.set_axisbelow(True)
-
-    plt.tight_layout()
-    fig.savefig(f"{out}/graphique_benchmark.png", dpi=150, bbox_inches='tight',
-                facecolor=fig.get_facecolor())
-    plt.close(fig)
-    print("        ✓ graphique_benchmark.png (basé sur vos performances)\n")
+    benchmarks = measured_benchmarks(current_dir, os.path.dirname(os.path.abspath(__file__)))
+    n_equiv = int(round((height * width) ** 0.5))
+    # Facteurs relus du cache : le temps mesuré est une lecture disque, pas une SVD
+    point = None if svd_info['cached'] else (n_equiv, t_svd * 1000, f"Python (cette image, {dims})")
+    plot_benchmark(benchmarks, f"{out}/graphique_benchmark.png", point=point)
+    print(f"        ✓ graphique_benchmark.png (mesures: {', '.join(sorted(benchmarks)) or 'aucune'})\n")
     
     # ── FIGURE E : Carte des compromis
-    compromise_file = generate_compromise_chart(results, size, img_name, out)
+    compromise_file = generate_compromise_chart(results, size, img_name, out, shape=A.shape)
     print("        ✓ compromise_chart_ensgmm.png")
     
     # ── FIGURE F : Diagramme de flux SVD
-    flowchart_file = generate_flowchart(results, S, size, img_name, t_svd, out)
+    flowchart_file = generate_flowchart(results, S, size, img_name, t_svd, out, shape=A.shape,
+                                        cached=svd_info['cached'])
     print("        ✓ flowchart_svd_compression.png")
     
     # ── FIGURE G : Architecture du code
@@ -2717,7 +2745,9 @@ def main():
     print("        ✓ code_architecture_ensgmm.png")
     
     # ── FIGURE H : Infographie de synthèse
-    summary_file = generate_summary_infographic(results, S, size, img_name, t_svd, out)
+    summary_file = generate_summary_infographic(results, S, size, img_name, t_svd, out,
+                                                shape=A.shape, benchmarks=benchmarks,
+                                                cached=svd_info['cached'])
     print("        ✓ summary_infographic_ensgmm.png\n")
 
     # ── liste finale
@@ -2751,4 +2781,28 @@ def main():
     print("═" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Compression SVD — génération complète")
+    parser.add_argument('--engine', choices=ENGINES, default='exact',
+                        help="moteur SVD ('randomized' ne calcule que max(K_VALUES) triplets)")
+    parser.add_argument('--target-psnr', type=float, help="plus petit k avec PSNR ≥ cible (dB)")
+    parser.add_argument('--fast-psnr', action='store_true',
+                        help="rang cible en forme close, sans correction de l'écrêtage")
+    parser.add_argument('--target-energy', type=float, help="plus petit k avec énergie ≥ cible (%%)")
+    parser.add_argument('--max-bytes', type=int,
+                        help="meilleur k sous ce budget (octets, facteurs dans la précision de calcul)")
+    parser.add_argument('--svdz', choices=QUANTS,
+                        help="écrire des fichiers .svdz (quantification) et rapporter le vrai ratio en octets")
+    parser.add_argument('--precision', choices=tuple(PRECISIONS), default='float64',
+                        help="précision de calcul de toute la chaîne (float32: mémoire / 2)")
+    parser.add_argument('--driver', choices=DRIVERS, default='auto',
+                        help="pilote LAPACK de la SVD complète (gesdd: diviser pour régner)")
+    parser.add_argument('--no-charts', action='store_true',
+                        help="images et CSV seulement (matplotlib n'est pas chargé)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="cache disque des facteurs SVD")
+    parser.add_argument('--no-cache', action='store_true', help="toujours recalculer la SVD")
+    args = parser.parse_args()
+    main(engine=args.engine, target_psnr=args.target_psnr,
+         target_energy=args.target_energy, max_bytes=args.max_bytes, svdz=args.svdz,
+         precision=args.precision, cache_dir=None if args.no_cache else args.cache_dir,
+         driver=args.driver, charts=not args.no_charts, exact_psnr=not args.fast_psnr)
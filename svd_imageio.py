@@ -0,0 +1,242 @@
+"""
+CHARGEMENT RAPIDE DES IMAGES - décodage JPEG réduit, directement en gris
+
+L'ancien chemin (Image.open → convert('L') → thumbnail) décode d'abord
+toute l'image en couleur : pour une photo de 24 Mpx réduite à 512 px,
+presque tout ce travail est jeté. Ici :
+
+    1. Image.draft('L', taille) avant tout décodage : libjpeg réduit dans
+       le domaine DCT (1/2, 1/4 ou 1/8) et ne produit que la luminance Y,
+       sans conversion couleur. On garde au moins reducing_gap × la
+       taille visée, pour que le filtre LANCZOS final reste net.
+    2. Formats sans draft (PNG, TIFF…) : resize(reducing_gap=…) commence
+       par une réduction entière par blocs (Image.reduce), puis LANCZOS.
+    3. Les pixels passent une seule fois de uint8 au type flottant et à
+       l'ordre mémoire voulus par le moteur SVD (engine_order).
+
+Les PGM/PPM binaires (format de l'exécutable C) sans réduction demandée
+ne passent pas par PIL : svd_pnm.read_pnm les projette en mémoire et la
+conversion flottante lit directement le fichier (ramené sur 0..255 si
+maxval ≠ 255, luminance arrondie comme 'L'). Les PNM ASCII (P2/P3)
+passent par PIL.
+
+load_gray() renvoie aussi les temps de l'étape de chargement (décodage,
+conversion en tableau), séparés du temps de la SVD.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import time
+
+import numpy as np
+from PIL import Image
+
+from svd_memstats import count_alloc, count_copy
+from svd_pnm import is_pnm, luma, read_pnm
+
+
+# Moteurs dont le noyau lit directement un tableau column-major (SciPy
+# gesvd sans copie interne, noyau C sans transposition)
+FORTRAN_ENGINES = ('gesvd', 'c_lapack')
+
+
+def fit_size(size, max_size=None):
+    """
+    Dimensions (largeur, hauteur) tenant dans un carré max_size, proportions gardées
+
+    Args:
+        size: (largeur, hauteur) d'origine
+        max_size: Côté maximal (None: taille d'origine)
+
+    Returns:
+        tuple: (largeur, hauteur)
+    """
+    width, height = size
+    if not max_size or max(width, height) <= max_size:
+        return width, height
+    scale = max_size / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def engine_order(engine, shape):
+    """
+    Ordre mémoire ('C' ou 'F') à donner à l'image pour le moteur SVD
+
+    compute_svd factorise Aᵀ quand l'image est large (n > m) : une image
+    C-contiguë donne alors une matrice Fortran, et inversement.
+
+    Args:
+        engine: Moteur (voir svd_engines.ENGINES)
+        shape: (m, n) de l'image
+
+    Returns:
+        str: 'F' ou 'C'
+    """
+    if engine not in FORTRAN_ENGINES:
+        return 'C'
+    m, n = shape
+    return 'C' if n > m else 'F'
+
+
+def open_gray(path, max_size=None, reducing_gap=2.0):
+    """
+    Ouvrir une image en niveaux de gris, réduite dès le décodage si possible
+
+    Args:
+        path: Fichier image
+        max_size: Côté maximal (None: pleine résolution)
+        reducing_gap: Marge gardée avant le filtre LANCZOS (voir Image.thumbnail)
+
+    Returns:
+        tuple: (image PIL 'L', info) avec info = original (largeur, hauteur),
+               draft (facteur de réduction DCT, 1 sans draft), decode_ms
+    """
+    t0 = time.perf_counter()
+    img = Image.open(path)
+    original = img.size
+    target = fit_size(original, max_size)
+
+    draft = 1
+    if img.format == 'JPEG':
+        request = target
+        if target != original:
+            request = tuple(min(o, int(t * reducing_gap)) for o, t in zip(original, target))
+        img.draft('L', request)
+        draft = original[0] // img.size[0]
+
+    if img.mode != 'L':
+        img = img.convert('L')
+    if img.size != target:
+        img = img.resize(target, Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+    img.load()
+
+    info = {'original': original, 'draft': draft,
+            'decode_ms': (time.perf_counter() - t0) * 1000.0}
+    return img, info
+
+
+def to_array(img, dtype=np.float64, order='C'):
+    """
+    Pixels d'une image PIL dans le type et l'ordre mémoire demandés (une seule conversion)
+
+    Args:
+        img: Image PIL 'L'
+        dtype: Type du tableau
+        order: 'C' ou 'F'
+
+    Returns:
+        numpy.ndarray: Image (m×n)
+    """
+    A = np.asarray(img).astype(dtype, order=order)
+    count_alloc(A)
+    count_copy(A)
+    return A
+
+
+def load_gray(path, max_size=None, dtype=np.float64, engine=None, order='C'):
+    """
+    Charger une image en tableau de niveaux de gris prêt pour la SVD
+
+    Args:
+        path: Fichier image
+        max_size: Côté maximal (None: pleine résolution)
+        dtype: Type du tableau ('float64', 'float32', np.uint8…)
+        engine: Moteur SVD visé : fixe l'ordre mémoire (voir engine_order)
+        order: Ordre mémoire si engine est None
+
+    Returns:
+        tuple: (tableau m×n, info) ; info ajoute à open_gray shape, order,
+               array_ms et load_ms (temps total de l'étape de chargement)
+    """
+    if is_pnm(path):
+        try:
+            pixels, maxval = read_pnm(path)
+        except ValueError:
+            pixels = None                 # P2/P3 (ASCII) : lecture par PIL
+        if pixels is not None and fit_size(pixels.shape[1::-1], max_size) == pixels.shape[1::-1]:
+            return _load_pnm(pixels, maxval, dtype, engine, order)
+
+    img, info = open_gray(path, max_size)
+    t0 = time.perf_counter()
+    shape = (img.size[1], img.size[0])
+    if engine is not None:
+        order = engine_order(engine, shape)
+    A = to_array(img, dtype, order)
+    info.update(shape=shape, order=order, array_ms=(time.perf_counter() - t0) * 1000.0)
+    info['load_ms'] = info['decode_ms'] + info['array_ms']
+    return A, info
+
+
+def _load_pnm(pixels, maxval, dtype, engine, order):
+    """load_gray pour un PGM/PPM projeté en mémoire (aucun décodage)"""
+    t0 = time.perf_counter()
+    shape = pixels.shape[:2]
+    if engine is not None:
+        order = engine_order(engine, shape)
+    if pixels.ndim == 2 and maxval == 255:
+        A = pixels.astype(dtype, order=order)
+    else:
+        # Luminance et/ou échelle 0..255, arrondies comme le mode 'L' de PIL
+        work = dtype if np.issubdtype(dtype, np.floating) else np.float64
+        A = np.empty(shape, dtype=work, order=order)
+        if pixels.ndim == 3:
+            luma(pixels, dtype=work, out=A)
+        else:
+            A[...] = pixels
+        if maxval != 255:
+            A *= 255.0 / maxval
+        np.rint(A, out=A)
+        A = A.astype(dtype, copy=False)
+    count_alloc(A)
+    count_copy(A)
+    elapsed = (time.perf_counter() - t0) * 1000.0
+    info = {'original': shape[::-1], 'draft': 1, 'decode_ms': 0.0, 'shape': shape,
+            'order': order, 'array_ms': elapsed, 'load_ms': elapsed}
+    return A, info
+
+
+def describe_load(info):
+    """Ligne de compte rendu de l'étape de chargement"""
+    width, height = info['original']
+    m, n = info['shape']
+    draft = f", réduction JPEG 1/{info['draft']}" if info['draft'] > 1 else ''
+    return (f"{width}×{height} → {n}×{m} en {info['load_ms']:.1f} ms "
+            f"(décodage {info['decode_ms']:.1f} ms{draft})")
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_imageio.py photo.jpg --max-size 512 --runs 5
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Chargement rapide d'images en niveaux de gris")
+    parser.add_argument('image')
+    parser.add_argument('--max-size', type=int, help='côté maximal (défaut: pleine résolution)')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    def classic():
+        img = Image.open(args.image).convert('L')
+        if args.max_size:
+            img.thumbnail((args.max_size, args.max_size), Image.Resampling.LANCZOS)
+        return np.array(img, dtype=np.float64)
+
+    def fast():
+        return load_gray(args.image, args.max_size)[0]
+
+    print('┌──────────────────────────────┬──────────────┬─────────────┐')
+    print('│ Chemin                       │ Dimensions   │ Temps (ms)  │')
+    print('├──────────────────────────────┼──────────────┼─────────────┤')
+    for label, fn in (('convert + thumbnail', classic), ('draft + reduce (svd_imageio)', fast)):
+        times = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            A = fn()
+            times.append((time.perf_counter() - t0) * 1000.0)
+        dims = f"{A.shape[1]}×{A.shape[0]}"
+        print(f"│ {label:<28s} │ {dims:>12s} │ {min(times):11.1f} │")
+    print('└──────────────────────────────┴──────────────┴─────────────┘')
+    print(f"   • {describe_load(load_gray(args.image, args.max_size)[1])}")
@@ -0,0 +1,144 @@
+"""
+COMPTEUR MÉMOIRE DE DÉBOGAGE - octets alloués et copiés par étape
+
+Désactivé par défaut (coût nul : un test de booléen par appel). Activé
+par SVD_MEMDEBUG=1 ou enable(), il comptabilise pour chaque étape :
+
+    allocated  tableaux créés par la chaîne (tampons, facteurs, images),
+               déclarés par count_alloc() là où ils sont alloués
+    copied     octets recopiés (changement de type ou d'ordre mémoire,
+               copie de travail détruite par LAPACK), déclarés par
+               count_copy()
+    peak       pic de mémoire NumPy au-dessus du niveau d'entrée dans
+               l'étape, mesuré par tracemalloc : il révèle aussi les
+               temporaires implicites (A * s, A @ B sans out=…)
+
+    with stage('reconstruction'):
+        ...
+    print_report()
+
+Une régression (temporaire m×n réapparu, copie d'ordre mémoire) se voit
+d'une exécution à l'autre dans les colonnes copied et peak.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+
+_enabled = os.environ.get('SVD_MEMDEBUG', '') not in ('', '0')
+_stats = {}
+_local = threading.local()
+_lock = threading.Lock()
+OUTSIDE = 'hors étape'
+
+
+def enable(flag=True):
+    """Activer (ou désactiver) le compteur"""
+    global _enabled
+    _enabled = flag
+
+
+def enabled():
+    """True si le compteur est actif"""
+    return _enabled
+
+
+def reset():
+    """Oublier toutes les mesures"""
+    with _lock:
+        _stats.clear()
+
+
+def _entry(name):
+    entry = _stats.get(name)
+    if entry is None:
+        entry = _stats[name] = {'calls': 0, 'allocated': 0, 'copied': 0, 'peak': 0}
+    return entry
+
+
+def _current():
+    stack = getattr(_local, 'stack', None)
+    return stack[-1]['name'] if stack else OUTSIDE
+
+
+def count_alloc(*arrays):
+    """Déclarer des tableaux nouvellement alloués dans l'étape courante"""
+    if _enabled:
+        with _lock:
+            _entry(_current())['allocated'] += sum(a.nbytes for a in arrays if a is not None)
+
+
+def count_copy(nbytes):
+    """Déclarer une copie de nbytes octets (ou d'un tableau) dans l'étape courante"""
+    if _enabled:
+        nbytes = getattr(nbytes, 'nbytes', nbytes)
+        with _lock:
+            _entry(_current())['copied'] += int(nbytes)
+
+
+@contextmanager
+def stage(name):
+    """
+    Attribuer allocations, copies et pic mémoire du bloc à l'étape name
+
+    Les étapes imbriquées comptent pour la plus interne ; le pic de
+    l'étape englobante inclut celui des étapes internes (reset_peak d'une
+    étape interne efface le pic de tracemalloc : celui de l'englobante est
+    relevé avant et repris à la sortie).
+    """
+    if not _enabled:
+        yield
+        return
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    if stack:
+        parent = stack[-1]
+        parent['peak'] = max(parent['peak'], tracemalloc.get_traced_memory()[1])
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    frame = {'name': name, 'peak': base}
+    stack.append(frame)
+    try:
+        yield
+    finally:
+        top = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+        peak = top - base
+        stack.pop()
+        if stack:
+            stack[-1]['peak'] = max(stack[-1]['peak'], top)
+        with _lock:
+            entry = _entry(name)
+            entry['calls'] += 1
+            entry['peak'] = max(entry['peak'], peak)
+
+
+def snapshot():
+    """Copie des mesures : {étape: {calls, allocated, copied, peak}}"""
+    with _lock:
+        return {name: dict(entry) for name, entry in _stats.items()}
+
+
+def _mb(nbytes):
+    return f"{nbytes / 2**20:10.2f}"
+
+
+def print_report(stats=None):
+    """Tableau des mesures par étape (Mo)"""
+    stats = snapshot() if stats is None else stats
+    print('┌──────────────────────┬───────┬────────────┬────────────┬────────────┐')
+    print('│ Étape                │ Appels│ Alloué (Mo)│ Copié (Mo) │ Pic (Mo)   │')
+    print('├──────────────────────┼───────┼────────────┼────────────┼────────────┤')
+    for name, e in stats.items():
+        print(f"│ {name:<20s} │ {e['calls']:5d} │ {_mb(e['allocated'])} │ {_mb(e['copied'])} │ "
+              f"{_mb(e['peak'])} │")
+    print('└──────────────────────┴───────┴────────────┴────────────┴────────────┘')
+    return stats
@@ -0,0 +1,209 @@
+"""
+MÉTRIQUES SVD - courbe débit/distorsion en forme close
+
+Théorème d'Eckart–Young : pour la troncature de rang k,
+    ||A - A_k||_F² = Σ_{i>k} σᵢ²
+donc l'erreur quadratique moyenne (non écrêtée) de tous les rangs se lit
+sur les sommes cumulées de S², en O(min(m, n)), sans reconstruire d'image.
+
+Seul l'écrêtage np.clip(A_k, 0, 255) sort de ce cadre : il ne peut que
+réduire l'erreur, et sa correction exacte demande l'image reconstruite.
+clip_correction() ne l'applique donc qu'aux k effectivement rendus.
+
+En précision float32, les sommes de carrés s'accumulent ligne par ligne
+en float32 (bande passante divisée par deux) puis se réduisent en float64
+(sum_squares) : l'erreur d'arrondi reste celle d'une ligne, pas de l'image.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import numpy as np
+
+
+MAX_VAL = 255.0
+PSNR_CAP = 100.0   # valeur retournée par compute_psnr pour une MSE nulle
+
+
+def sum_squares(X):
+    """
+    Somme des carrés ||X||_F² : accumulation par ligne dans le type de X,
+    réduction finale en float64
+
+    Args:
+        X: Tableau 2D (float32 ou float64)
+
+    Returns:
+        float: Σ x²
+    """
+    X = np.asarray(X)
+    if X.ndim != 2:
+        X = X.reshape(1, -1)
+    return float(np.sum(np.einsum('ij,ij->i', X, X), dtype=np.float64))
+
+
+def mean_squared_error(original, reconstructed):
+    """
+    MSE entre deux images, calculée dans la précision flottante de l'original
+
+    Une image entière (uint8) est comparée en float32 au moins : la
+    différence est signée et ne doit pas déborder.
+
+    Args:
+        original: Image originale (float32, float64 ou uint8)
+        reconstructed: Image reconstruite (float ou uint8)
+
+    Returns:
+        float: MSE
+    """
+    dtype = np.result_type(np.asarray(original).dtype, np.float32)
+    diff = np.subtract(original, reconstructed, dtype=dtype)
+    return sum_squares(diff) / diff.size
+
+
+def psnr_from_mse(mse):
+    """
+    Convertir une (ou des) MSE en PSNR, avec le même plafond que compute_psnr
+
+    Args:
+        mse: MSE scalaire ou tableau
+
+    Returns:
+        numpy.ndarray: PSNR en dB
+    """
+    mse = np.asarray(mse, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        psnr = 10 * np.log10((MAX_VAL ** 2) / np.maximum(mse, 1e-300))
+    return np.where(mse < 1e-10, PSNR_CAP, psnr)
+
+
+def rate_distortion_curve(S, m, n, total_energy=None):
+    """
+    PSNR, énergie et ratio pour tous les rangs k = 1..len(S) en une passe
+
+    Args:
+        S: Valeurs singulières (décroissantes)
+        m: Nombre de lignes de l'image
+        n: Nombre de colonnes de l'image
+        total_energy: ||A||_F² (obligatoire si S est tronqué, sinon Σ σᵢ²)
+
+    Returns:
+        dict: tableaux 'k', 'mse', 'psnr', 'energy' (%), 'ratio', indexés
+              par k - 1
+    """
+    s2 = np.asarray(S, dtype=np.float64) ** 2
+    cumulative = np.cumsum(s2)
+    if total_energy is None:
+        total_energy = cumulative[-1] if len(cumulative) else 0.0
+
+    k = np.arange(1, len(s2) + 1)
+    tail = np.maximum(total_energy - cumulative, 0.0)
+    mse = tail / (m * n)
+
+    return {
+        'k': k,
+        'mse': mse,
+        'psnr': psnr_from_mse(mse),
+        'energy': cumulative / total_energy * 100.0 if total_energy > 0 else np.zeros_like(s2),
+        'ratio': (m * n) / (k * (m + n + 1.0)),
+    }
+
+
+def clip_correction(curve, original, frames):
+    """
+    Remplacer la MSE en forme close par la MSE exacte des images écrêtées
+
+    Args:
+        curve: Courbe retournée par rate_distortion_curve (modifiée en place)
+        original: Image originale (m×n)
+        frames: Dict {k: image reconstruite et écrêtée dans [0, 255]}
+
+    Returns:
+        dict: la courbe, avec 'psnr'/'mse' corrigés aux k de frames
+    """
+    for k, frame in frames.items():
+        mse = mean_squared_error(original, frame)
+        curve['mse'][k - 1] = mse
+        curve['psnr'][k - 1] = psnr_from_mse(mse)
+    return curve
+
+
+def _clipped_mse(original, U, S, VT, k):
+    """MSE exacte de la reconstruction de rang k écrêtée dans [0, 255]"""
+    diff = (U[:, :k] * S[:k]) @ VT[:k, :]
+    np.clip(diff, 0, MAX_VAL, out=diff)
+    diff -= original
+    return sum_squares(diff) / diff.size
+
+
+def select_rank(S, m, n, total_energy=None, psnr=None, energy=None,
+                max_bytes=None, bytes_per_value=8, cumulative=None,
+                original=None, U=None, VT=None):
+    """
+    Choisir k à partir d'objectifs de qualité et/ou d'un budget en octets
+
+    Les objectifs PSNR et énergie se traduisent en seuils sur
+    cumsum(S²) (Eckart–Young), et np.searchsorted donne le plus petit k
+    en O(log n). Le budget donne le plus grand k tel que
+    k·(m + n + 1)·bytes_per_value ≤ max_bytes.
+
+    L'écrêtage [0, 255] ne fait que réduire l'erreur : le k en forme close
+    est donc un majorant. Si original, U et VT sont fournis, on vérifie sur
+    une vraie reconstruction de rang k - 1, et on ne lance une bissection
+    sur [1, k] que si l'écrêtage y suffit à atteindre l'objectif PSNR.
+
+    Args:
+        S: Valeurs singulières (décroissantes)
+        m: Nombre de lignes de l'image
+        n: Nombre de colonnes de l'image
+        total_energy: ||A||_F² (obligatoire si S est tronqué)
+        psnr: PSNR minimal visé (dB)
+        energy: Énergie minimale visée (%)
+        max_bytes: Budget de stockage des facteurs (octets)
+        bytes_per_value: Taille d'un coefficient stocké (8 = double)
+        cumulative: np.cumsum(S**2) déjà calculé (optionnel)
+        original, U, VT: Image et facteurs pour la correction d'écrêtage
+
+    Returns:
+        int: k sélectionné, ou None si les objectifs sont inatteignables
+    """
+    if cumulative is None:
+        cumulative = np.cumsum(np.asarray(S, dtype=np.float64) ** 2)
+    if total_energy is None:
+        total_energy = cumulative[-1]
+    r = len(cumulative)
+
+    k = 1
+    if energy is not None:
+        # tolérance relative : energy=100 doit donner k = r et non r + 1
+        target = energy / 100.0 * total_energy * (1 - 1e-12)
+        k = int(np.searchsorted(cumulative, target)) + 1
+
+    if psnr is not None:
+        mse_target = (MAX_VAL ** 2) / 10 ** (psnr / 10)
+        k_psnr = int(np.searchsorted(cumulative, total_energy - mse_target * m * n)) + 1
+
+        # Repli exact : l'écrêtage atteint-il l'objectif avant le majorant ?
+        if original is not None and k_psnr > k:
+            hi = min(k_psnr - 1, r)
+            if _clipped_mse(original, U, S, VT, hi) <= mse_target:
+                lo = k
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if _clipped_mse(original, U, S, VT, mid) <= mse_target:
+                        hi = mid
+                    else:
+                        lo = mid + 1
+                k_psnr = hi
+        k = max(k, k_psnr)
+
+    if max_bytes is not None:
+        k_budget = min(int(max_bytes // ((m + n + 1) * bytes_per_value)), r)
+        if psnr is None and energy is None:
+            k = k_budget   # meilleure qualité sous le budget
+        if k_budget < 1 or k > k_budget:
+            return None
+
+    if k > r:
+        return None
+    return k
@@ -0,0 +1,275 @@
+"""
+SVD HORS MÉMOIRE - images gigapixels en niveaux de gris
+
+Les pixels sont placés dans un np.memmap (uint8, sur disque) et ne sont
+jamais chargés en entier : chaque passe de l'algorithme randomisé lit
+l'image par bandes de lignes.
+
+    passe 1      Y  = A Ω              (bande par bande, Y : m×l)
+    puissance    Z  = Aᵀ Q ; Y = A Z   (2 passes par itération)
+    projection   B  = Qᵀ A             (l×n, accumulé bande par bande)
+    petite SVD   B  = Û Σ Vᵀ ;  U = Q Û
+
+Seuls Q (m×l), Z et B (n×l) résident en mémoire : le pic mémoire suit
+k·(m + n) et non m·n. La reconstruction est écrite elle aussi par bandes
+(PGM binaire P5 lisible par le programme C, ou .npy).
+
+Entrées : .npy et PGM P5 (8 bits) sont projetés tels quels, sans copie ;
+PGM 16 bits et PPM P6 sont convertis bande par bande dans un memmap
+temporaire. Les autres formats passent par PIL, qui décode l'image
+entière au premier accès : le pic mémoire de cette conversion est alors
+la taille décodée (convertir d'abord en PGM, ex. vips/ImageMagick, pour
+rester sous le plafond).
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from svd_pnm import is_pnm, luma, read_pnm
+
+
+def _open_destination(shape, memmap_path):
+    """memmap uint8 à remplir ; sans chemin, fichier temporaire déjà supprimé"""
+    if memmap_path is not None:
+        return np.memmap(memmap_path, dtype=np.uint8, mode='w+', shape=shape)
+    fd, path = tempfile.mkstemp(suffix='.u8.mmap')
+    try:
+        A = np.memmap(path, dtype=np.uint8, mode='w+', shape=shape)
+    finally:
+        os.close(fd)
+        os.unlink(path)     # la projection garde les données jusqu'à sa fermeture
+    return A
+
+
+def image_to_memmap(image_path, memmap_path=None, band_rows=1024):
+    """
+    Pixels (niveaux de gris) d'une image dans un memmap uint8
+
+    .npy et PGM P5 8 bits sont projetés directement (aucune copie). PGM
+    16 bits et PPM sont convertis bande par bande ; les autres formats sont
+    copiés par bandes depuis PIL, qui décode toutefois l'image entière
+    (voir l'en-tête du module).
+
+    Args:
+        image_path: Image source
+        memmap_path: Fichier de destination du memmap (None: fichier
+                     temporaire, supprimé à la fermeture du memmap)
+        band_rows: Nombre de lignes converties à la fois
+
+    Returns:
+        numpy.memmap: Image (m×n) uint8 en lecture seule
+    """
+    if image_path.lower().endswith('.npy'):
+        return np.load(image_path, mmap_mode='r')
+
+    if is_pnm(image_path):
+        pixels, maxval = read_pnm(image_path)
+        if pixels.ndim == 2 and maxval == 255:
+            return pixels
+        A = _open_destination(pixels.shape[:2], memmap_path)
+        for r0 in range(0, A.shape[0], band_rows):
+            band = pixels[r0:r0 + band_rows]
+            band = luma(band) if band.ndim == 3 else band.astype(np.float64)
+            band *= 255.0 / maxval
+            np.rint(band, out=band)
+            A[r0:r0 + band_rows] = band
+    else:
+        limit = Image.MAX_IMAGE_PIXELS
+        Image.MAX_IMAGE_PIXELS = None   # pas de protection "decompression bomb" ici
+        try:
+            with Image.open(image_path) as img:
+                width, height = img.size
+                A = _open_destination((height, width), memmap_path)
+                for r0 in range(0, height, band_rows):
+                    r1 = min(r0 + band_rows, height)
+                    A[r0:r1] = np.asarray(img.crop((0, r0, width, r1)).convert('L'))
+        finally:
+            Image.MAX_IMAGE_PIXELS = limit
+
+    A.flush()
+    A.flags.writeable = False
+    return A
+
+
+def band_rows_for(m, n, l, ram_bytes, dtype=np.float64):
+    """
+    Hauteur de bande compatible avec un plafond mémoire
+
+    Args:
+        m, n: Dimensions de l'image
+        l: Taille de l'échantillon (k + suréchantillonnage)
+        ram_bytes: Plafond mémoire en octets
+        dtype: Type des calculs
+
+    Returns:
+        int: Nombre de lignes par bande (≥ 1)
+    """
+    itemsize = np.dtype(dtype).itemsize
+    fixed = (2 * m * l + 3 * n * l) * itemsize      # Y/Q, Z/B et copies de QR
+    per_row = n * (itemsize + 1) + l * itemsize     # bande convertie + bande uint8
+    if fixed + per_row > ram_bytes:
+        raise MemoryError(f"Plafond de {ram_bytes / 2**20:.0f} Mo insuffisant pour l={l} "
+                          f"(au moins {(fixed + per_row) / 2**20:.0f} Mo) : réduire k")
+    return int(min(m, (ram_bytes - fixed) // per_row))
+
+
+def _bands(m, band_rows):
+    for r0 in range(0, m, band_rows):
+        yield r0, min(r0 + band_rows, m)
+
+
+def svd_outofcore(A, k, ram_bytes=512 * 2**20, oversampling=10, power_iters=2,
+                  seed=0, dtype=np.float64):
+    """
+    SVD randomisée de rang k d'une matrice sur disque, lue par bandes
+
+    Args:
+        A: Matrice (m×n), typiquement un np.memmap uint8
+        k: Nombre de triplets à calculer
+        ram_bytes: Plafond mémoire de travail en octets
+        oversampling: Colonnes supplémentaires de l'échantillon
+        power_iters: Nombre d'itérations de puissance
+        seed: Graine du générateur
+        dtype: Type des calculs (float64 ou float32)
+
+    Returns:
+        tuple: (U, S, VT, info) comme svd_engines.compute_svd
+    """
+    m, n = A.shape
+    l = min(k + oversampling, m, n)
+    band = band_rows_for(m, n, l, ram_bytes, dtype)
+
+    rng = np.random.default_rng(seed)
+    omega = rng.standard_normal((n, l)).astype(dtype)
+
+    # Passe 1 : Y = A Ω  (et ||A||_F² au passage)
+    Y = np.empty((m, l), dtype=dtype)
+    frob2 = 0.0
+    for r0, r1 in _bands(m, band):
+        blk = np.asarray(A[r0:r1], dtype=dtype)
+        np.matmul(blk, omega, out=Y[r0:r1])
+        frob2 += float(np.vdot(blk, blk))
+    del omega
+    Q, _ = np.linalg.qr(Y)
+    del Y
+
+    # Itérations de puissance : 2 passes chacune
+    for _ in range(power_iters):
+        Z = np.zeros((n, l), dtype=dtype)
+        for r0, r1 in _bands(m, band):
+            Z += np.asarray(A[r0:r1], dtype=dtype).T @ Q[r0:r1]
+        Z, _ = np.linalg.qr(Z)
+        for r0, r1 in _bands(m, band):
+            np.matmul(np.asarray(A[r0:r1], dtype=dtype), Z, out=Q[r0:r1])
+        del Z
+        Q, _ = np.linalg.qr(Q)
+
+    # Projection : B = Qᵀ A  (l×n)
+    B = np.zeros((l, n), dtype=dtype)
+    for r0, r1 in _bands(m, band):
+        B += Q[r0:r1].T @ np.asarray(A[r0:r1], dtype=dtype)
+
+    U_b, S, VT = np.linalg.svd(B, full_matrices=False)
+    del B
+    U = Q @ U_b[:, :k]
+    S, VT = S[:k], VT[:k, :]
+
+    residual = np.sqrt(max(frob2 - float(np.sum(S.astype(np.float64) ** 2)), 0.0))
+    info = {'engine': 'outofcore', 'k': len(S), 'band_rows': band, 'frob2': frob2,
+            'residual': residual,
+            'rel_error': residual / np.sqrt(frob2) if frob2 > 0 else 0.0}
+    return U, S, VT, info
+
+
+def write_reconstruction(U, S, VT, path, band_rows=1024, original=None):
+    """
+    Écrire A_k = U diag(S) VT par bandes (PGM P5 ou .npy), sans l'assembler
+
+    Args:
+        U, S, VT: Facteurs de rang k
+        path: Fichier de sortie (.pgm ou .npy)
+        band_rows: Nombre de lignes reconstruites à la fois
+        original: Image originale (memmap) pour calculer le PSNR au passage
+
+    Returns:
+        float: PSNR en dB si original est fourni, sinon None
+    """
+    m, n = U.shape[0], VT.shape[1]
+    US = U * S
+    sq_err = 0.0
+
+    if path.lower().endswith('.npy'):
+        dest = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=(m, n))
+        f = None
+    elif path.lower().endswith('.pgm'):
+        f = open(path, 'wb')
+        f.write(f"P5\n# Created by SVD Compression Tool\n{n} {m}\n255\n".encode('ascii'))
+        dest = None
+    else:
+        raise ValueError(f"Format de sortie non supporté pour l'écriture par bandes: {path}")
+
+    try:
+        for r0, r1 in _bands(m, band_rows):
+            strip = US[r0:r1] @ VT
+            np.clip(strip, 0, 255, out=strip)
+            if original is not None:
+                diff = strip - np.asarray(original[r0:r1], dtype=strip.dtype)
+                sq_err += float(np.vdot(diff, diff))
+            strip8 = strip.astype(np.uint8)
+            if f is not None:
+                f.write(strip8.tobytes())
+            else:
+                dest[r0:r1] = strip8
+    finally:
+        if f is not None:
+            f.close()
+        else:
+            dest.flush()
+            del dest
+
+    if original is None:
+        return None
+    mse = sq_err / (m * n)
+    return 100.0 if mse < 1e-10 else 10 * np.log10((255.0 ** 2) / mse)
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_outofcore.py scan.tif -k 100 --ram-mb 2048 -o scan_k100.pgm
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='SVD hors mémoire (images gigapixels)')
+    parser.add_argument('image', help='image source (.npy, PGM/PPM binaire ou tout format lisible par PIL)')
+    parser.add_argument('-k', type=int, default=100, help='rang de la factorisation')
+    parser.add_argument('--ram-mb', type=int, default=512, help='plafond mémoire de travail (Mo)')
+    parser.add_argument('--power-iters', type=int, default=2, help='itérations de puissance')
+    parser.add_argument('--float32', action='store_true', help='calculs en float32')
+    parser.add_argument('-o', '--output', help='reconstruction écrite par bandes (.pgm ou .npy)')
+    args = parser.parse_args()
+
+    t0 = time.time()
+    A = image_to_memmap(args.image)
+    print(f"   ✓ Image {A.shape[0]}×{A.shape[1]} en memmap ({time.time() - t0:.2f} s)")
+
+    t0 = time.time()
+    U, S, VT, info = svd_outofcore(A, args.k, ram_bytes=args.ram_mb * 2**20,
+                                   power_iters=args.power_iters,
+                                   dtype=np.float32 if args.float32 else np.float64)
+    print(f"   ✓ SVD rang {args.k} en {time.time() - t0:.2f} s "
+          f"(bandes de {info['band_rows']} lignes)")
+    print(f"   ✓ Erreur relative ||A - A_k||_F / ||A||_F = {info['rel_error']:.3e}")
+
+    if args.output:
+        t0 = time.time()
+        psnr = write_reconstruction(U, S, VT, args.output, band_rows=info['band_rows'], original=A)
+        print(f"   ✓ Reconstruction écrite: {args.output} ({time.time() - t0:.2f} s, "
+              f"PSNR {psnr:.2f} dB)")
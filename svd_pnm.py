@@ -0,0 +1,195 @@
+"""
+PGM/PPM BINAIRES (P5/P6) - lecture sans copie, écriture en un seul appel
+
+Format commun avec image_io.c (image_load_pgm / image_save_pgm) : en-tête
+texte « P5 largeur hauteur maxval » (commentaires # admis), un seul
+blanc, puis les pixels bruts, ligne par ligne, sur 1 octet (2 octets
+big-endian si maxval > 255). P6 : trois octets R, G, B par pixel.
+
+    read_pnm()   projette le fichier en mémoire (np.memmap) : les pixels
+                 sont une vue NumPy en lecture seule, rien n'est lu avant
+                 d'être touché ; une entrée brute se « charge » en temps
+                 quasi nul, quelle que soit sa taille
+    write_pnm()  écrête et arrondit comme image_save_pgm ((int)(v + 0.5))
+                 directement dans le tampon du fichier (en-tête compris),
+                 puis un seul write : pas de bytes() ni de concaténation
+
+Python et l'exécutable C échangent ainsi de grandes images sans PIL.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import os
+
+import numpy as np
+
+
+MAGICS = {b'P5': 1, b'P6': 3}           # nombre de canaux
+PNM_EXTENSIONS = ('.pgm', '.ppm', '.pnm')
+_HEADER_MAX = 4096
+
+
+def parse_header(data):
+    """
+    Lire l'en-tête d'un fichier P5/P6
+
+    Args:
+        data: Début du fichier (octets)
+
+    Returns:
+        tuple: (canaux, largeur, hauteur, maxval, position des pixels)
+    """
+    magic = bytes(data[:2])
+    if magic not in MAGICS:
+        raise ValueError(f"Format non supporté: {magic!r} (attendu P5 ou P6)")
+
+    fields, pos = [], 2
+    while len(fields) < 3:
+        while pos < len(data) and data[pos:pos + 1].isspace():
+            pos += 1
+        if pos >= len(data):
+            raise ValueError("En-tête PNM tronqué")
+        if data[pos:pos + 1] == b'#':
+            end = data.find(b'\n', pos)
+            pos = len(data) if end < 0 else end + 1
+            continue
+        start = pos
+        while pos < len(data) and data[pos:pos + 1].isdigit():
+            pos += 1
+        if start == pos:
+            raise ValueError("En-tête PNM invalide")
+        fields.append(int(data[start:pos]))
+    if pos >= len(data) or not data[pos:pos + 1].isspace():
+        raise ValueError("En-tête PNM invalide")
+
+    width, height, maxval = fields
+    if not 0 < maxval < 65536:
+        raise ValueError(f"maxval invalide: {maxval}")
+    return MAGICS[magic], width, height, maxval, pos + 1
+
+
+def read_pnm(path, mode='r'):
+    """
+    Projeter un fichier P5/P6 en mémoire, sans copie
+
+    Args:
+        path: Fichier .pgm/.ppm
+        mode: Mode de np.memmap ('r': lecture seule, 'c': copie à l'écriture,
+              'r+': modifications écrites dans le fichier)
+
+    Returns:
+        tuple: (pixels, maxval) ; pixels est une vue (hauteur×largeur, ou
+               hauteur×largeur×3 pour P6) en uint8, ou >u2 si maxval > 255
+    """
+    with open(path, 'rb') as f:
+        head = f.read(_HEADER_MAX)
+    channels, width, height, maxval, offset = parse_header(head)
+
+    dtype = np.dtype(np.uint8) if maxval < 256 else np.dtype('>u2')
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    expected = offset + int(np.prod(shape)) * dtype.itemsize
+    if os.path.getsize(path) < expected:
+        raise ValueError(f"{path}: données tronquées ({os.path.getsize(path)} < {expected} octets)")
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape), maxval
+
+
+def luma(rgb, dtype=np.float64, out=None):
+    """
+    Niveaux de gris d'un tableau (m×n×3), pondération ITU-R 601 de PIL ('L')
+
+    Args:
+        rgb: Pixels R, G, B
+        dtype: Type du résultat
+        out: Tampon (m×n) optionnel
+
+    Returns:
+        numpy.ndarray: Luminance (m×n)
+    """
+    weights = np.array([0.299, 0.587, 0.114], dtype=dtype)
+    return np.matmul(rgb, weights, out=out, dtype=dtype)
+
+
+def write_pnm(path, A, maxval=255, comment=None):
+    """
+    Écrire une image en P5 (m×n) ou P6 (m×n×3), en un seul write
+
+    Les valeurs sont écrêtées dans [0, maxval] et arrondies comme
+    image_save_pgm, directement dans le tampon qui part au fichier.
+
+    Args:
+        path: Fichier de sortie
+        A: Pixels (flottants ou entiers)
+        maxval: Valeur maximale (≤ 255 : 1 octet par valeur, sinon 2)
+        comment: Ligne de commentaire de l'en-tête (None: aucune ; le
+                 skip_comments d'image_load_pgm ne saute que les commentaires
+                 collés au nombre magique, un fichier commenté lui est illisible)
+
+    Returns:
+        int: Nombre d'octets écrits
+    """
+    A = np.asarray(A)
+    if A.ndim == 2:
+        magic = 'P5'
+    elif A.ndim == 3 and A.shape[2] == 3:
+        magic = 'P6'
+    else:
+        raise ValueError(f"Forme non supportée: {A.shape} (m×n ou m×n×3)")
+
+    height, width = A.shape[:2]
+    comment = f"# {comment}\n" if comment else ''
+    header = f"{magic}\n{comment}{width} {height}\n{maxval}\n".encode('ascii')
+    dtype = np.dtype(np.uint8) if maxval < 256 else np.dtype('>u2')
+
+    buf = bytearray(len(header) + A.size * dtype.itemsize)
+    buf[:len(header)] = header
+    pixels = np.frombuffer(buf, dtype=dtype, offset=len(header)).reshape(A.shape)
+    if A.dtype == dtype and maxval == np.iinfo(dtype).max:
+        pixels[...] = A
+    elif np.issubdtype(A.dtype, np.integer):
+        np.clip(A, 0, maxval, out=pixels, casting='unsafe')
+    else:
+        # (int)(v + 0.5) après écrêtage, comme image_save_pgm : la conversion
+        # vers l'entier tronque, et v + 0.5 ≥ 0
+        clipped = np.clip(A, 0.0, maxval)
+        np.add(clipped, 0.5, out=pixels, casting='unsafe')
+
+    with open(path, 'wb') as f:
+        f.write(buf)
+    return len(buf)
+
+
+def is_pnm(path):
+    """True si le fichier a une extension PGM/PPM"""
+    return os.path.splitext(str(path))[1].lower() in PNM_EXTENSIONS
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_pnm.py image.pgm                  (en-tête et temps de lecture)
+        python svd_pnm.py image.png --to image.pgm   (conversion pour l'exécutable C)
+    """
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Lecture/écriture PGM/PPM binaires')
+    parser.add_argument('image')
+    parser.add_argument('--to', help='écrire une copie en PGM/PPM')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    if is_pnm(args.image):
+        pixels, maxval = read_pnm(args.image)
+    else:
+        from PIL import Image
+        with Image.open(args.image) as img:
+            pixels, maxval = np.asarray(img.convert('RGB' if img.mode in ('RGB', 'RGBA') else 'L')), 255
+    t_read = (time.perf_counter() - t0) * 1000.0
+    print(f"   • {args.image}: {pixels.shape[1]}×{pixels.shape[0]}, "
+          f"{1 if pixels.ndim == 2 else 3} canal(aux), maxval {maxval}, lu en {t_read:.2f} ms")
+
+    if args.to:
+        t0 = time.perf_counter()
+        size = write_pnm(args.to, pixels, maxval)
+        print(f"   ✓ {args.to}: {size} octets en {(time.perf_counter() - t0) * 1000.0:.2f} ms")
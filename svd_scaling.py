@@ -0,0 +1,274 @@
+"""
+ÉTUDE DE PASSAGE À L'ÉCHELLE - taille, threads BLAS et modèle de coût
+
+Pour chaque moteur, chaque taille n et chaque nombre de threads BLAS, un
+processus neuf ('spawn', threads fixés par svd_threads) mesure :
+    temps SVD, temps de reconstruction U_k Σ_k V_kᵀ, GFLOP/s, pic RSS
+
+puis un modèle de coût est ajusté par moindres carrés relatifs (droite
+par l'origine, chaque taille pèse autant) pour chaque (moteur, threads) :
+
+    SVD exacte       t = c_svd · max(m,n)·min(m,n)²     (c·n³ en carré)
+    SVD randomisée   t = c_svd · m·n·(k + p)
+    reconstruction   t = c_rec · k·m·n
+
+Le modèle est sauvegardé en JSON ; predict_runtime() estime le temps d'une
+nouvelle image avant de lancer le travail.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import time
+
+import numpy as np
+
+from svd_cache import DEFAULT_CACHE_DIR
+from svd_threads import available_cores
+
+
+MODEL_PATH = os.path.join(DEFAULT_CACHE_DIR, 'cost_model.json')
+SCALING_BACKENDS = ('numpy', 'randomized')
+OVERSAMPLING = 10           # mêmes valeurs que svd_engines.svd_randomized,
+POWER_ITERS = 2             # mesurées par _measure et supposées par svd_flops
+
+
+def svd_work(backend, m, n, k):
+    """
+    Variable du modèle de coût de la SVD (proportionnelle au nombre d'opérations)
+
+    Args:
+        backend: Moteur ('randomized' ou moteur exact)
+        m, n: Dimensions
+        k: Rang (moteur randomisé)
+
+    Returns:
+        float: max·min² (exact) ou m·n·(k+p) (randomisé)
+    """
+    if backend == 'randomized':
+        return float(m) * n * min(k + OVERSAMPLING, m, n)
+    return float(max(m, n)) * min(m, n) ** 2
+
+
+def svd_flops(backend, m, n, k, power_iters=POWER_ITERS):
+    """
+    Nombre d'opérations flottantes de la SVD (Golub–Van Loan pour la SVD
+    mince : 14·m·n² + 8·n³ avec m ≥ n ; randomisée : 2(q+1) produits par A,
+    chacun 2·m·n·l, plus la projection)
+    """
+    if backend == 'randomized':
+        l = min(k + OVERSAMPLING, m, n)
+        return 2.0 * m * n * l * (2 * power_iters + 3)
+    big, small = max(m, n), min(m, n)
+    return 14.0 * big * small ** 2 + 8.0 * small ** 3
+
+
+def _measure(backend, n, k, threads, runs, seed):
+    """Mesure dans un processus neuf : temps, GFLOP/s et pic RSS"""
+    import resource
+
+    from svd_benchmark import python_backends
+    from svd_threads import set_blas_threads
+
+    set_blas_threads(threads)
+    kk = min(k, n)
+    if backend == 'randomized':
+        # Le rang mesuré doit être celui du modèle (svd_work, svd_flops), pas le
+        # k = min(100, n/2) fixe de python_backends()
+        from svd_engines import svd_randomized
+        fn = lambda A: svd_randomized(A, kk, oversampling=OVERSAMPLING,
+                                      power_iters=POWER_ITERS)
+    else:
+        fn = python_backends()[backend]
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    A = np.random.default_rng(seed).standard_normal((n, n))
+
+    U, S, VT = fn(A)                                   # chauffe
+    t_svd, t_rec = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        U, S, VT = fn(A)
+        t_svd.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        (U[:, :kk] * S[:kk]) @ VT[:kk, :]
+        t_rec.append(time.perf_counter() - t0)
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    svd_s, rec_s = float(np.median(t_svd)), float(np.median(t_rec))
+    return {
+        'backend': backend, 'n': n, 'k': kk, 'threads': threads,
+        'svd_ms': svd_s * 1000.0, 'recon_ms': rec_s * 1000.0,
+        'svd_gflops': svd_flops(backend, n, n, kk) / svd_s / 1e9,
+        'recon_gflops': 2.0 * kk * n * n / rec_s / 1e9,
+        'peak_rss_mb': (peak_rss - base_rss) / 1024.0,   # ru_maxrss en Kio (Linux)
+    }
+
+
+def scaling_study(sizes=(256, 512, 1024, 2048), threads=None, k=50,
+                  backends=SCALING_BACKENDS, runs=3, seed=42):
+    """
+    Balayer tailles × threads BLAS × moteurs, chaque mesure dans un processus neuf
+
+    Args:
+        sizes: Tailles n des matrices n×n
+        threads: Nombres de threads (None: 1, 2, 4, … jusqu'au nombre de cœurs)
+        k: Rang de reconstruction (et du moteur randomisé)
+        backends: Moteurs (voir svd_benchmark.python_backends)
+        runs: Répétitions (médiane) après une chauffe
+        seed: Graine des matrices
+
+    Returns:
+        list: Mesures (dictionnaires)
+    """
+    if threads is None:
+        cores = available_cores()
+        threads = sorted({min(2 ** i, cores) for i in range(cores.bit_length() + 1)})
+
+    ctx = multiprocessing.get_context('spawn')
+    rows = []
+    print('┌──────────────┬───────┬─────────┬────────────┬──────────┬──────────────┬───────────┐')
+    print('│ Moteur       │   n   │ threads │  SVD (ms)  │ GFLOP/s  │ recon. (ms)  │ RSS (Mo)  │')
+    print('├──────────────┼───────┼─────────┼────────────┼──────────┼──────────────┼───────────┤')
+    for backend in backends:
+        for t in threads:
+            for n in sizes:
+                with ctx.Pool(1) as pool:
+                    row = pool.apply(_measure, (backend, n, k, t, runs, seed))
+                rows.append(row)
+                print(f"│ {backend:<12s} │ {n:5d} │ {t:7d} │ {row['svd_ms']:10.2f} │ "
+                      f"{row['svd_gflops']:8.2f} │ {row['recon_ms']:12.3f} │ "
+                      f"{row['peak_rss_mb']:9.1f} │")
+    print('└──────────────┴───────┴─────────┴────────────┴──────────┴──────────────┴───────────┘')
+    return rows
+
+
+def fit_cost_model(rows):
+    """
+    Ajuster t = c·x pour chaque (moteur, threads), en minimisant Σ((c·x - t)/t)²
+
+    Args:
+        rows: Mesures de scaling_study
+
+    Returns:
+        dict: Modèle {'host', 'cores', 'models': {moteur: {threads: {...}}}}
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['backend'], row['threads']), []).append(row)
+
+    models = {}
+    for (backend, threads), group in groups.items():
+        x_svd = np.array([svd_work(backend, r['n'], r['n'], r['k']) for r in group])
+        x_rec = np.array([float(r['k']) * r['n'] * r['n'] for r in group])
+        t_svd = np.array([r['svd_ms'] for r in group])
+        t_rec = np.array([r['recon_ms'] for r in group])
+        c_svd = float(np.sum(x_svd / t_svd) / np.sum((x_svd / t_svd) ** 2))
+        c_rec = float(np.sum(x_rec / t_rec) / np.sum((x_rec / t_rec) ** 2))
+        models.setdefault(backend, {})[str(threads)] = {
+            'c_svd_ms': c_svd,
+            'c_recon_ms': c_rec,
+            # erreur relative maximale du modèle sur les points mesurés
+            'svd_fit_error': float(np.max(np.abs(c_svd * x_svd - t_svd) / t_svd)),
+            'recon_fit_error': float(np.max(np.abs(c_rec * x_rec - t_rec) / t_rec)),
+            'sizes': sorted(r['n'] for r in group),
+        }
+
+    return {'host': platform.node(), 'machine': platform.machine(),
+            'cores': available_cores(), 'models': models}
+
+
+def save_cost_model(model, path=MODEL_PATH):
+    """Écrire le modèle de coût (JSON)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(model, f, indent=2)
+
+
+def load_cost_model(path=MODEL_PATH):
+    """Lire le modèle de coût ; None s'il n'existe pas"""
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def predict_runtime(m, n, k, backend='numpy', threads=None, model=None):
+    """
+    Estimer le temps d'une compression avant de la lancer
+
+    Args:
+        m, n: Dimensions de l'image
+        k: Rang de reconstruction
+        backend: Moteur SVD
+        threads: Threads BLAS prévus (None: le plus grand nombre mesuré) ;
+                 on prend le plus grand nombre mesuré ≤ threads
+        model: Modèle de coût (None: load_cost_model())
+
+    Returns:
+        dict: 'svd_ms', 'recon_ms', 'total_ms', 'threads' retenus
+    """
+    model = model or load_cost_model()
+    if model is None or backend not in model['models']:
+        raise ValueError(f"Pas de modèle de coût pour {backend!r} : lancer python svd_scaling.py")
+
+    fits = model['models'][backend]
+    measured = sorted(int(t) for t in fits)
+    eligible = [t for t in measured if threads is None or t <= threads] or measured[:1]
+    fit = fits[str(eligible[-1])]
+
+    svd_ms = fit['c_svd_ms'] * svd_work(backend, m, n, k)
+    recon_ms = fit['c_recon_ms'] * float(k) * m * n
+    return {'svd_ms': svd_ms, 'recon_ms': recon_ms, 'total_ms': svd_ms + recon_ms,
+            'threads': eligible[-1]}
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_scaling.py --sizes 256 512 1024 2048 --threads 1 2 4 8 -k 50
+        python svd_scaling.py --predict 4000x3000 -k 100 --threads 4
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Passage à l\'échelle et modèle de coût SVD')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 512, 1024, 2048])
+    parser.add_argument('--threads', type=int, nargs='+', help='threads BLAS (défaut: 1, 2, 4, …)')
+    parser.add_argument('-k', type=int, default=50, help='rang de reconstruction')
+    parser.add_argument('--backends', nargs='+', default=list(SCALING_BACKENDS))
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--model', default=MODEL_PATH, help='fichier JSON du modèle')
+    parser.add_argument('--csv', help='mesures brutes en CSV')
+    parser.add_argument('--predict', metavar='MxN', help='estimer le temps pour une image m×n')
+    args = parser.parse_args()
+
+    if args.predict:
+        m, n = (int(v) for v in args.predict.lower().split('x'))
+        model = load_cost_model(args.model)
+        for backend in args.backends:
+            p = predict_runtime(m, n, args.k, backend, args.threads and max(args.threads), model)
+            print(f"   • {backend:<12s} {m}×{n}, k={args.k}, {p['threads']} thread(s): "
+                  f"SVD {p['svd_ms']:.0f} ms + reconstruction {p['recon_ms']:.1f} ms "
+                  f"= {p['total_ms'] / 1000:.2f} s")
+        raise SystemExit(0)
+
+    rows = scaling_study(args.sizes, args.threads, args.k, args.backends, args.runs)
+    if args.csv:
+        import csv
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"   ✓ Mesures sauvegardées: {args.csv}")
+
+    model = fit_cost_model(rows)
+    save_cost_model(model, args.model)
+    for backend, fits in model['models'].items():
+        for t, fit in sorted(fits.items(), key=lambda item: int(item[0])):
+            print(f"   • {backend:<12s} {t:>2s} thread(s): c_svd = {fit['c_svd_ms']:.3e} ms, "
+                  f"c_rec = {fit['c_recon_ms']:.3e} ms (écart max {fit['svd_fit_error']:.0%} / "
+                  f"{fit['recon_fit_error']:.0%})")
+    print(f"   ✓ Modèle de coût sauvegardé: {args.model}")
@@ -0,0 +1,90 @@
+"""
+BALAYAGE EN k INCRÉMENTAL - A_k construit à partir de A_{k-1}
+
+    A_k = A_{k-1} + U[:, k'..k] · diag(S[k'..k]) · VT[k'..k, :]
+
+Pour une liste de k triée, chaque étape n'ajoute que le bloc de rang
+(k_i - k_{i-1}) à un accumulateur préalloué : un balayage complet coûte
+autant qu'une seule reconstruction de rang max(k), au lieu d'une par k.
+
+U_blk · diag(S_blk) est écrit dans un tampon Fortran (colonnes contiguës)
+alloué une fois : aucun temporaire n'est créé pendant le balayage.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import numpy as np
+
+from svd_memstats import count_alloc
+
+
+def add_rank_block(acc, U_blk, S_blk, VT_blk, work, us=None):
+    """
+    Ajouter un bloc de rang à l'accumulateur : acc += U_blk · diag(S_blk) · VT_blk
+
+    Args:
+        acc: Accumulateur (m×n), modifié en place
+        U_blk: Colonnes de U du bloc (m×b)
+        S_blk: Valeurs singulières du bloc (b)
+        VT_blk: Lignes de V^T du bloc (b×n)
+        work: Tampon (m×n) du même type que acc, écrasé
+        us: Tampon (m×b' avec b' ≥ b) pour U_blk · diag(S_blk), de préférence
+            en ordre Fortran (None: temporaire alloué à chaque appel)
+    """
+    us_blk = None if us is None else us[:, :len(S_blk)]
+    np.matmul(np.multiply(U_blk, S_blk, out=us_blk), VT_blk, out=work)
+    acc += work
+
+
+def render_frame(acc, work, frame):
+    """
+    Écrêter l'accumulateur dans [0, 255] vers work (float) et frame (uint8)
+
+    Args:
+        acc: Accumulateur A_k (m×n), non modifié
+        work: Tampon float (m×n) recevant A_k écrêté
+        frame: Tampon uint8 (m×n) recevant l'image
+    """
+    np.clip(acc, 0, 255, out=work)
+    np.copyto(frame, work, casting='unsafe')   # troncature, comme astype(np.uint8)
+
+
+def rank_sweep(U, S, VT, k_values, out=None):
+    """
+    Générateur des reconstructions écrêtées pour chaque k (ordre croissant)
+
+    Les tampons (accumulateur, image écrêtée, image uint8) sont alloués une
+    fois et réutilisés : les tableaux produits ne sont valides que jusqu'à
+    l'itération suivante (faire .copy() pour les conserver).
+
+    Args:
+        U: Matrice U (m×r)
+        S: Valeurs singulières (r)
+        VT: Matrice V^T (r×n)
+        k_values: Valeurs de k (triées et dédoublonnées ici, k ≤ r)
+        out: Tampon uint8 (m×n) optionnel pour l'image de sortie
+
+    Yields:
+        tuple: (k, A_k écrêté dans [0, 255] en float, image uint8)
+    """
+    m, n = U.shape[0], VT.shape[1]
+    dtype = np.result_type(U, S, VT)
+    ks = sorted(set(k_values))
+    block = max((b - a for a, b in zip([0] + ks, ks)), default=0)
+
+    acc = np.zeros((m, n), dtype=dtype)     # A_k non écrêté
+    work = np.empty((m, n), dtype=dtype)    # bloc de rang, puis A_k écrêté
+    us = np.empty((m, block), dtype=dtype, order='F')     # U_blk · diag(S_blk)
+    frame = out if out is not None else np.empty((m, n), dtype=np.uint8)
+    count_alloc(acc, work, us, None if out is not None else frame)
+
+    k_prev = 0
+    for k in ks:
+        if k > k_prev:
+            # Bloc de rang (k - k_prev)
+            add_rank_block(acc, U[:, k_prev:k], S[k_prev:k], VT[k_prev:k, :], work, us)
+            k_prev = k
+
+        render_frame(acc, work, frame)
+        yield k, work, frame
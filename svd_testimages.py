@@ -0,0 +1,277 @@
+"""
+IMAGES DE TEST SYNTHÉTIQUES - générateur vectorisé et reproductible
+
+Chaque motif est calculé d'un bloc par diffusion (broadcasting) sur des
+grilles np.ogrid, sans boucle par pixel : une image 8192×8192 se génère
+en quelques secondes au lieu de plusieurs minutes.
+
+    rings     cercles concentriques + dégradé (motif de main.c et de
+              svd_compress_python.generate_test_image)
+    shapes    disques, anneaux, rectangles et triangles aléatoires sur un
+              dégradé ; chaque forme ne touche que sa boîte englobante
+    lowrank   spectre maîtrisé : A = U diag(σ) Vᵀ de rang r, σᵢ = σ₁·decayⁱ,
+              plus un bruit gaussien (plancher du spectre)
+    mixed     lowrank + shapes : décroissance d'image naturelle
+
+Les graines sont déterministes : (seed, type, m, n) donnent toujours la
+même image, quel que soit l'ordre de génération. make_corpus() produit
+un corpus complet en parallèle (threads : NumPy relâche le GIL sur les
+grands tableaux) et le remet directement aux benchmarks, sans PNG.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+KINDS = ('rings', 'shapes', 'lowrank', 'mixed')
+
+
+def _rng(seed, kind, m, n):
+    """Générateur propre à (seed, type, m, n), indépendant de l'ordre des appels"""
+    return np.random.default_rng([seed, KINDS.index(kind), m, n])
+
+
+def _normalize(img, dtype):
+    """Ramener img dans [0, 255] (sur place) et convertir"""
+    lo, hi = img.min(), img.max()
+    img -= lo
+    img *= 255.0 / (hi - lo) if hi > lo else 0.0
+    return img.astype(dtype, copy=False)
+
+
+def rings_image(m, n, rings=10, slope=50.0, dtype=np.float64):
+    """
+    Cercles concentriques + dégradé horizontal
+
+    Args:
+        m, n: Hauteur et largeur
+        rings: Nombre de demi-périodes du sinus entre le centre et le coin
+        slope: Amplitude du dégradé horizontal
+        dtype: Type de sortie
+
+    Returns:
+        numpy.ndarray: Image (m×n) dans [0, 255]
+    """
+    y, x = np.ogrid[0:m, 0:n]
+    cy, cx = m / 2, n / 2
+    img = np.hypot(x - cx, y - cy)
+    img *= rings * np.pi / np.hypot(cx, cy)
+    np.sin(img, out=img)
+    img *= 127.0
+    img += 128.0
+    img += x * (slope / n)
+    return _normalize(img, dtype)
+
+
+def shapes_image(m, n, count=32, seed=0, dtype=np.float64):
+    """
+    Formes pleines et contours sur un dégradé (contours nets : spectre lent)
+
+    Args:
+        m, n: Hauteur et largeur
+        count: Nombre de formes
+        seed: Graine
+        dtype: Type de sortie
+
+    Returns:
+        numpy.ndarray: Image (m×n) dans [0, 255]
+    """
+    rng = _rng(seed, 'shapes', m, n)
+    img = np.empty((m, n))
+    img[:] = 200.0 + 40.0 * np.arange(n) / n          # dégradé de fond (une ligne diffusée)
+
+    scale = min(m, n)
+    for _ in range(count):
+        kind = rng.integers(4)
+        cy, cx = rng.uniform(0, m), rng.uniform(0, n)
+        r = rng.uniform(0.03, 0.2) * scale
+        value = rng.uniform(0, 255)
+        y0, y1 = max(int(cy - r), 0), min(int(cy + r) + 1, m)
+        x0, x1 = max(int(cx - r), 0), min(int(cx + r) + 1, n)
+        if y0 >= y1 or x0 >= x1:
+            continue
+        box = img[y0:y1, x0:x1]
+        y, x = np.ogrid[y0:y1, x0:x1]
+        if kind == 0:                                   # disque
+            mask = (y - cy) ** 2 + (x - cx) ** 2 <= r * r
+        elif kind == 1:                                 # anneau
+            d = np.hypot(y - cy, x - cx)
+            mask = np.abs(d - 0.8 * r) <= max(1.0, 0.08 * r)
+        elif kind == 2:                                 # rectangle
+            mask = np.ones(box.shape, dtype=bool)
+        else:                                           # triangle (pointe en haut)
+            mask = (y >= cy - r) & (np.abs(x - cx) <= (y - (cy - r)) / 2)
+        box[mask] = value
+
+    period = max(scale // 8, 8)                         # fines diagonales
+    y, x = np.ogrid[0:m, 0:n]
+    img[(x + y) % period < 2] = 100.0
+    return _normalize(img, dtype)
+
+
+def lowrank_image(m, n, rank=50, decay=0.9, noise=2.0, seed=0, dtype=np.float64):
+    """
+    Image au spectre maîtrisé : rang r exact plus un plancher de bruit
+
+    Args:
+        m, n: Hauteur et largeur
+        rank: Rang de la partie lisse
+        decay: σᵢ₊₁ / σᵢ (1.0: spectre plat sur les r premières valeurs)
+        noise: Écart-type du bruit gaussien (0: rang exactement r + 1, fond compris)
+        seed: Graine
+        dtype: Type de sortie
+
+    Returns:
+        numpy.ndarray: Image (m×n) dans [0, 255]
+    """
+    rng = _rng(seed, 'lowrank', m, n)
+    r = min(rank, m, n)
+    U, _ = np.linalg.qr(rng.standard_normal((m, r)))
+    V, _ = np.linalg.qr(rng.standard_normal((n, r)))
+    sigma = decay ** np.arange(r)
+    img = (U * sigma) @ V.T                             # un seul GEMM m×r×n
+    img *= 100.0 / max(np.abs(img).max(), 1e-12)       # pas d'écrêtage sans bruit
+    img += 128.0                                        # fond constant : rang r + 1
+    if noise:
+        img += rng.normal(0.0, noise, (m, n))
+    np.clip(img, 0.0, 255.0, out=img)
+    return img.astype(dtype, copy=False)
+
+
+GENERATORS = {'rings': (rings_image,), 'shapes': (shapes_image,),
+              'lowrank': (lowrank_image,), 'mixed': (lowrank_image, shapes_image)}
+_COMMON = ('m', 'n', 'seed', 'dtype')
+
+
+def _params_of(generator):
+    """Paramètres propres à un générateur (hors dimensions, graine et type)"""
+    return [name for name in inspect.signature(generator).parameters if name not in _COMMON]
+
+
+def kind_params(kind):
+    """
+    Paramètres acceptés par un type d'image
+
+    Args:
+        kind: Voir KINDS
+
+    Returns:
+        tuple: Noms des paramètres (ex. rank, decay, noise, count pour 'mixed')
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"Type d'image inconnu: {kind!r} (choix: {', '.join(KINDS)})")
+    return tuple(name for gen in GENERATORS[kind] for name in _params_of(gen))
+
+
+def _check_params(kinds, params):
+    accepted = {name for kind in kinds for name in kind_params(kind)}
+    unknown = sorted(set(params) - accepted)
+    if unknown:
+        raise TypeError(f"Paramètre(s) inconnu(s) pour {', '.join(kinds)}: {', '.join(unknown)}")
+
+
+def test_image(kind, m, n=None, seed=0, dtype=np.float64, **params):
+    """
+    Image de test d'un type donné
+
+    Args:
+        kind: Voir KINDS
+        m, n: Hauteur et largeur (n=None: carrée)
+        seed: Graine
+        dtype: Type de sortie (np.uint8 pour un fichier, float pour la SVD)
+        **params: Paramètres du générateur (rank, decay, noise, count, rings) ;
+                  pour 'mixed', chacun va au générateur qui l'accepte
+
+    Returns:
+        numpy.ndarray: Image (m×n) dans [0, 255]
+    """
+    n = m if n is None else n
+    _check_params((kind,), params)
+    if kind == 'rings':
+        return rings_image(m, n, dtype=dtype, **params)
+    if kind == 'shapes':
+        return shapes_image(m, n, seed=seed, dtype=dtype, **params)
+    if kind == 'lowrank':
+        return lowrank_image(m, n, seed=seed, dtype=dtype, **params)
+    own = {gen: {name: params[name] for name in _params_of(gen) if name in params}
+           for gen in GENERATORS['mixed']}
+    img = lowrank_image(m, n, seed=seed, **own[lowrank_image])
+    img += shapes_image(m, n, seed=seed, **own[shapes_image])
+    img *= 0.5
+    return img.astype(dtype, copy=False)
+
+
+def make_corpus(sizes, kinds=KINDS, seed=0, workers=None, dtype=np.float64, out_dir=None,
+                **params):
+    """
+    Générer un corpus (types × tailles) en parallèle
+
+    Args:
+        sizes: Tailles n (images n×n) ou dimensions (m, n)
+        kinds: Types d'images (voir KINDS)
+        seed: Graine commune (chaque image a la sienne, dérivée de (seed, type, m, n))
+        workers: Threads (None: nombre de cœurs)
+        dtype: Type des images
+        out_dir: Dossier où écrire chaque image en .npy (None: mémoire seulement)
+        **params: Voir test_image ; chaque type ne reçoit que les paramètres
+                  qu'il accepte (rank pour lowrank/mixed, rings pour rings…)
+
+    Returns:
+        dict: {(type, m, n): image}
+    """
+    _check_params(kinds, params)
+    shapes = [(s, s) if np.isscalar(s) else tuple(s) for s in sizes]
+    jobs = [(kind, m, n) for kind in kinds for m, n in shapes]
+    own = {kind: {name: params[name] for name in kind_params(kind) if name in params}
+           for kind in kinds}
+
+    def build(job):
+        kind, m, n = job
+        img = test_image(kind, m, n, seed=seed, dtype=dtype, **own[kind])
+        if out_dir:
+            np.save(os.path.join(out_dir, f'{kind}_{m}x{n}.npy'), img)
+        return job, img
+
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return dict(pool.map(build, jobs))
+
+
+if __name__ == '__main__':
+    """
+    Utilisation:
+        python svd_testimages.py --sizes 256 1024 8192 --kinds rings mixed -o corpus/
+        python svd_testimages.py --sizes 512 --png -o apercu/
+    """
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Corpus d'images de test synthétiques")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 512, 1024, 2048])
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=list(KINDS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, help='threads (défaut: nombre de cœurs)')
+    parser.add_argument('-o', '--output', help='dossier des .npy (défaut: pas d\'écriture)')
+    parser.add_argument('--png', action='store_true', help='écrire aussi un aperçu PNG (uint8)')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    corpus = make_corpus(args.sizes, args.kinds, seed=args.seed, workers=args.workers,
+                         out_dir=args.output)
+    elapsed = time.perf_counter() - t0
+    for (kind, m, n), img in corpus.items():
+        print(f"   • {kind:<8s} {m:5d}×{n:<5d} moyenne {img.mean():6.1f}, écart-type {img.std():5.1f}")
+    print(f"   ✓ {len(corpus)} image(s) en {elapsed:.2f} s")
+
+    if args.png and args.output:
+        from PIL import Image
+        for (kind, m, n), img in corpus.items():
+            Image.fromarray(img.astype(np.uint8)).save(os.path.join(args.output, f'{kind}_{m}x{n}.png'))
+        print(f"   ✓ Aperçus PNG: {args.output}/")
@@ -0,0 +1,219 @@
+"""
+BUDGET DE THREADS - cœurs partagés entre processus et threads BLAS
+
+Un pool de P processus dont chaque LAPACK/BLAS (OpenBLAS, MKL, OpenMP)
+lance un thread par cœur fait tourner P × cœurs threads : le débit
+s'effondre. Le budget se répartit donc en processus × threads BLAS ≤ cœurs,
+selon la taille des images :
+
+    petites SVD (min(m, n) < 512)    beaucoup de processus, 1 thread chacun
+    grandes SVD (min(m, n) ≥ 2048)   peu de processus, beaucoup de threads
+
+limit_blas_threads() fixe le nombre de threads des bibliothèques déjà
+chargées (threadpoolctl s'il est installé, sinon appel direct par ctypes
+des fonctions *_set_num_threads trouvées dans /proc/self/maps).
+pin_process() restreint optionnellement un processus à un groupe de cœurs.
+
+Auteurs: KPOKOUTA Abel, OUSSOUKPEVI Richenel, ANAHAHOUNDE A. Fredy
+UNSTIM - ENSGMM | Année 2025-2026
+"""
+
+import contextlib
+import ctypes
+import os
+import re
+
+
+# (min(m, n) < seuil → threads BLAS par processus) ; au-delà : tous les cœurs
+SIZE_CLASSES = ((512, 1), (1024, 2), (2048, 4))
+
+# Bibliothèques reconnues : (motif du fichier, getter, setter) ; les
+# variantes préfixées/suffixées (scipy_openblas, interface 64 bits) sont essayées
+_LIBRARIES = (
+    (re.compile(r'openblas'), 'openblas_get_num_threads', 'openblas_set_num_threads'),
+    (re.compile(r'mkl_rt'), 'MKL_Get_Max_Threads', 'MKL_Set_Num_Threads'),
+    (re.compile(r'lib(g|i)omp'), 'omp_get_max_threads', 'omp_set_num_threads'),
+)
+_PREFIXES = ('', 'scipy_')
+_SUFFIXES = ('', '64_', '_64_')
+
+
+def available_cores():
+    """Nombre de cœurs utilisables par ce processus (affinité comprise)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def threads_for_shape(m, n, cores=None):
+    """
+    Threads BLAS à donner à la SVD d'une image m×n
+
+    Args:
+        m, n: Dimensions de l'image
+        cores: Cœurs disponibles (None: available_cores())
+
+    Returns:
+        int: Nombre de threads dans [1, cores]
+    """
+    cores = cores or available_cores()
+    d = min(m, n)
+    for limit, threads in SIZE_CLASSES:
+        if d < limit:
+            return min(threads, cores)
+    return cores
+
+
+def plan_threads(shapes, cores=None):
+    """
+    Répartir les images en groupes (processus × threads BLAS) selon leur taille
+
+    Args:
+        shapes: Dimensions (m, n) de chaque image
+        cores: Cœurs disponibles (None: available_cores())
+
+    Returns:
+        list: Groupes {'threads', 'workers', 'indices'} des plus gros
+              threads aux plus petits, workers × threads ≤ cores
+    """
+    cores = cores or available_cores()
+    groups = {}
+    for i, (m, n) in enumerate(shapes):
+        groups.setdefault(threads_for_shape(m, n, cores), []).append(i)
+    return [{'threads': t, 'workers': max(1, min(cores // t, len(idx))), 'indices': idx}
+            for t, idx in sorted(groups.items(), reverse=True)]
+
+
+def cpu_groups(workers, threads, cores=None):
+    """
+    Groupes de cœurs disjoints pour l'épinglage de chaque processus
+
+    Args:
+        workers: Nombre de processus
+        threads: Threads BLAS par processus
+        cores: Liste des cœurs utilisables (None: affinité courante)
+
+    Returns:
+        list: Un ensemble de cœurs par processus
+    """
+    if cores is None:
+        cores = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') \
+            else list(range(os.cpu_count() or 1))
+    return [set(cores[(w * threads + t) % len(cores)] for t in range(threads))
+            for w in range(workers)]
+
+
+def pin_process(cpus):
+    """
+    Restreindre le processus courant à un ensemble de cœurs (Linux)
+
+    Args:
+        cpus: Ensemble des cœurs autorisés
+
+    Returns:
+        bool: True si l'affinité a été appliquée
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return False
+    os.sched_setaffinity(0, cpus)
+    return True
+
+
+def _loaded_libraries():
+    """Chemins des bibliothèques de threads chargées dans ce processus"""
+    try:
+        with open('/proc/self/maps') as f:
+            paths = {line.split()[-1] for line in f if '.so' in line}
+    except OSError:
+        return []
+    return sorted(paths)
+
+
+def _controllers():
+    """(nom, getter, setter) ctypes des bibliothèques de threads chargées"""
+    found = []
+    for path in _loaded_libraries():
+        name = os.path.basename(path)
+        for pattern, get_name, set_name in _LIBRARIES:
+            if not pattern.search(name):
+                continue
+            try:
+                lib = ctypes.CDLL(path)
+            except OSError:
+                continue
+            for prefix in _PREFIXES:
+                for suffix in _SUFFIXES:
+                    getter = getattr(lib, prefix + get_name + suffix, None)
+                    setter = getattr(lib, prefix + set_name + suffix, None)
+                    if getter is not None and setter is not None:
+                        found.append((name, getter, setter))
+                        break
+                else:
+                    continue
+                break
+    return found
+
+
+def blas_threads_info():
+    """
+    Nombre de threads courant de chaque bibliothèque BLAS/OpenMP chargée
+
+    Returns:
+        dict: {bibliothèque: threads}
+    """
+    try:
+        from threadpoolctl import threadpool_info
+        return {info['filepath']: info['num_threads'] for info in threadpool_info()}
+    except ImportError:
+        return {name: getter() for name, getter, _ in _controllers()}
+
+
+@contextlib.contextmanager
+def limit_blas_threads(threads):
+    """
+    Limiter les threads BLAS/OpenMP du processus le temps d'un bloc with
+
+    Args:
+        threads: Nombre de threads
+
+    Yields:
+        dict: Valeurs précédentes par bibliothèque (restaurées en sortie)
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        threadpool_limits = None
+
+    if threadpool_limits is not None:
+        previous = blas_threads_info()
+        with threadpool_limits(limits=threads):
+            yield previous
+        return
+
+    controllers = _controllers()
+    previous = {name: getter() for name, getter, _ in controllers}
+    for _, _, setter in controllers:
+        setter(threads)
+    try:
+        yield previous
+    finally:
+        for name, _, setter in controllers:
+            setter(previous[name])
+
+
+def set_blas_threads(threads):
+    """
+    Fixer définitivement les threads BLAS/OpenMP du processus (initialiseur
+    de pool)
+
+    Args:
+        threads: Nombre de threads
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=threads)
+        return
+    except ImportError:
+        pass
+    for _, _, setter in _controllers():
+        setter(threads)